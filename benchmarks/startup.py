@@ -0,0 +1,86 @@
+'''Benchmarks of the cost of starting to use chemicals: importing the package,
+the first call of each family of properties whose data is loaded lazily, the
+transform done on first use of `chemicals.numba`, and the memory held once
+all data is loaded.
+
+The `timeraw_` benchmarks return code which asv times in a fresh interpreter,
+with the second element of the returned tuple run untimed beforehand; so each
+one measures a true cold start rather than a warm cache in the benchmark
+process.
+'''
+import os
+from importlib.util import find_spec
+
+# The property functions read the constants database first when it exists;
+# it is disabled in the first call benchmarks so they measure the loading of
+# the data files of each family
+SETUP_NO_DATABASE = '''
+import chemicals
+from chemicals import data_reader
+data_reader.USE_CONSTANTS_DATABASE = False
+'''
+
+class TimeImportSuite(object):
+    def timeraw_import_chemicals(self):
+        return 'import chemicals'
+
+    def timeraw_import_chemicals_lazy(self):
+        return 'import chemicals', 'import os; os.environ["CHEDL_LAZY_IMPORT"] = "1"'
+
+    def timeraw_import_Antoine_lazy(self):
+        return ('from chemicals import Antoine; Antoine(100.0, A=8.95894, B=510.595, C=-15.95)',
+                'import os; os.environ["CHEDL_LAZY_IMPORT"] = "1"')
+
+    def timeraw_import_CAS_from_any_lazy(self):
+        return ('from chemicals import CAS_from_any; CAS_from_any("water")',
+                'import os; os.environ["CHEDL_LAZY_IMPORT"] = "1"')
+
+
+class TimeFirstCallSuite(object):
+    def timeraw_first_Tc(self):
+        return 'chemicals.Tc("64-17-5")', SETUP_NO_DATABASE
+
+    def timeraw_first_Tb(self):
+        return 'chemicals.Tb("64-17-5")', SETUP_NO_DATABASE
+
+    def timeraw_first_Hfg(self):
+        return 'chemicals.Hfg("64-17-5")', SETUP_NO_DATABASE
+
+    def timeraw_first_Cp_data(self):
+        return 'chemicals.heat_capacity.Cp_data_Poling', SETUP_NO_DATABASE
+
+    def timeraw_first_Cp_JANAF(self):
+        return 'chemicals.heat_capacity.Cp_dict_JANAF_gas["7732-18-5"]', SETUP_NO_DATABASE
+
+    def timeraw_first_search_chemical(self):
+        return 'chemicals.search_chemical("ethanol")', 'import chemicals'
+
+    def timeraw_search_chemical_main_db_autoload(self):
+        from chemicals.identifiers import folder
+        if not os.path.exists(os.path.join(folder, 'chemical identifiers pubchem large.tsv')):
+            raise NotImplementedError('The large identifier database is not installed')
+        # A name not in the small databases makes the main database be loaded
+        code = '''
+try:
+    search_chemical('asdfasddsaf', autoload=True, cache=False)
+except ValueError:
+    pass
+'''
+        return code, 'from chemicals.identifiers import search_chemical'
+
+    def timeraw_first_numba_attribute(self):
+        if find_spec('numba') is None:
+            raise NotImplementedError('numba is not installed')
+        return 'chemicals.numba.Antoine', 'import chemicals'
+
+
+class MemLazyLoadingSuite(object):
+    def setup(self):
+        import chemicals
+        self.chemicals = chemicals
+
+    def peakmem_complete_lazy_loading(self):
+        self.chemicals.complete_lazy_loading()
+
+    def peakmem_import_chemicals(self):
+        pass
@@ -29,7 +29,32 @@ import fluids
 __version__ = '1.1.3'
 from math import isnan
 
-if not fluids.numerics.is_micropython:
+'''Importing the package normally imports every submodule. With the
+environment variable `CHEDL_LAZY_IMPORT` set to 1, only the package itself is
+imported; a submodule is imported the first time it, or a name it exports,
+is accessed as an attribute of the package, using the map of exported names
+in `chemicals.lazy_names` (regenerated by `dev/generate_lazy_names.py`).
+`from chemicals import *` still works, but imports every submodule.
+'''
+try:
+    lazy_import = bool(int(os.environ.get('CHEDL_LAZY_IMPORT', '0')))
+except:
+    lazy_import = False
+
+if not fluids.numerics.is_micropython and lazy_import:
+    import importlib
+
+    from . import utils
+    from .lazy_names import exported_names, submodule_names
+    from .utils import PY37, mark_numba_incompatible
+    __all__ = list(submodule_names)
+    for _names in exported_names.values():
+        __all__.extend(_names)
+    lazy_name_modules = {name: module for module, names in exported_names.items() for name in names}
+
+    chemicals_dir = utils.source_path
+
+elif not fluids.numerics.is_micropython:
 
     from . import (
         acentric, air, combustion, critical, dipole, dippr, elements,
@@ -123,33 +148,97 @@ if not fluids.numerics.is_micropython:
     chemicals_dir = utils.source_path
     
     
+if not fluids.numerics.is_micropython:
+    # Functions which load the data of each submodule on first use
+    lazy_loader_names = {
+        'critical': ('_load_critical_data',),
+        'dipole': ('_load_dipole_data',),
+        'environment': ('_load_GWP_ODP_data', '_load_logP_data'),
+        'heat_capacity': ('_load_Cp_data',),
+        'interface': ('load_interface_dfs',),
+        'lennard_jones': ('_load_LJ_data',),
+        'miscdata': ('_load_VDI_saturation_dict', '_load_miscdata'),
+        'permittivity': ('_load_permittivity_data',),
+        'phase_change': ('_load_phase_change_constants', '_load_phase_change_correlations'),
+        'reaction': ('_load_reaction_data',),
+        'refractivity': ('_load_RI_data',),
+        'safety': ('_load_safety_data',),
+        'thermal_conductivity': ('_load_k_data',),
+        'triple': ('_load_triple_data',),
+        'vapor_pressure': ('load_vapor_pressure_dfs',),
+        'viscosity': ('_load_mu_data',),
+        'volume': ('_load_rho_data',),
+        'molecular_geometry': ('_load_RG_data',),
+        'combustion': ('_load_combustion_data',),
+    }
+
+    def submodule_lazy_loaders(name):
+        from importlib import import_module
+        module = import_module('chemicals.' + name)
+        return tuple(getattr(module, loader) for loader in lazy_loader_names[name])
+
+    if not lazy_import:
+        lazy_loaders = {name: submodule_lazy_loaders(name) for name in lazy_loader_names}
+
     def complete_lazy_loading():
-        critical._load_critical_data()
-        dipole._load_dipole_data()
-        environment._load_GWP_ODP_data()
-        environment._load_logP_data()
-        heat_capacity._load_Cp_data()
-        interface.load_interface_dfs()
-        lennard_jones._load_LJ_data()
-        miscdata._load_VDI_saturation_dict()
-        miscdata._load_miscdata()
-        permittivity._load_permittivity_data()
-        phase_change._load_phase_change_constants()
-        phase_change._load_phase_change_correlations()
-        reaction._load_reaction_data()
-        refractivity._load_RI_data()
-        safety._load_safety_data()
-        thermal_conductivity._load_k_data()
-        triple._load_triple_data()
-        vapor_pressure.load_vapor_pressure_dfs()
-        viscosity._load_mu_data()
-        volume._load_rho_data()
-        molecular_geometry._load_RG_data()
-        combustion._load_combustion_data()
+        for name in lazy_loader_names:
+            for loader in submodule_lazy_loaders(name):
+                loader()
+        from chemicals.identifiers import search_chemical
         try:
-            identifiers.search_chemical('asdfasddsaf', autoload=True, cache=False)
+            search_chemical('asdfasddsaf', autoload=True, cache=False)
         except:
             pass
+
+    warm_up_thread = None
+    def warm_up(modules=None, background=True):
+        '''Load the data of submodules ahead of their first use. By default
+        the loading happens on a daemon thread so importing stays fast; a
+        function which needs data still being loaded waits only for the
+        source it needs. Errors are ignored here, and are raised again on the
+        first real use of the data.
+
+        The warm-up can also be started at import time by setting the
+        environment variable `CHEDL_WARM_UP` to 1 for every submodule or to
+        a comma separated list of submodule names.
+
+        Parameters
+        ----------
+        modules : list[str], optional
+            Names of the submodules to load, in order, as in `lazy_loader_names`;
+            all of them if not specified, [-]
+        background : bool, optional
+            Whether to load on a background thread, [-]
+
+        Returns
+        -------
+        thread : threading.Thread or None
+            The thread doing the loading, None if `background` is False [-]
+        '''
+        global warm_up_thread
+        if modules is None:
+            modules = list(lazy_loader_names)
+        for name in modules:
+            if name not in lazy_loader_names:
+                raise ValueError("Unknown submodule %s, allowed submodules are %s" %(name, list(lazy_loader_names)))
+        def load():
+            for name in modules:
+                try:
+                    loaders = submodule_lazy_loaders(name)
+                except Exception:
+                    continue
+                for loader in loaders:
+                    try:
+                        loader()
+                    except Exception:
+                        pass
+        if not background:
+            load()
+            return None
+        import threading
+        warm_up_thread = threading.Thread(target=load, name='chemicals-warm-up', daemon=True)
+        warm_up_thread.start()
+        return warm_up_thread
     
     def remove_missing(values, CASs):
         values_found, CASs_found = [], []
@@ -218,6 +307,29 @@ if not fluids.numerics.is_micropython:
             if name == 'numba_vectorized':
                 import chemicals.numba_vectorized as numba_vectorized
                 return numba_vectorized
+            if lazy_import:
+                module = lazy_name_modules.get(name)
+                if module is not None:
+                    value = getattr(importlib.import_module('chemicals.' + module), name)
+                    globals()[name] = value
+                    return value
+                if name in submodule_names or name == 'data_reader':
+                    return importlib.import_module('chemicals.' + name)
+                if name == 'submodules':
+                    return [importlib.import_module('chemicals.' + module) for module in submodule_names]
+                if name == 'lazy_loaders':
+                    return {module: submodule_lazy_loaders(module) for module in lazy_loader_names}
             raise AttributeError("module %s has no attribute %s" %(__name__, name))
+        if lazy_import:
+            def __dir__():
+                return sorted(set(globals()) | set(__all__))
     else:
         from . import vectorized
+
+    _warm_up_modules = os.environ.get('CHEDL_WARM_UP', '').strip()
+    if _warm_up_modules and _warm_up_modules != '0':
+        if _warm_up_modules.lower() in ('1', 'all', 'true'):
+            warm_up()
+        else:
+            warm_up([name.strip() for name in _warm_up_modules.split(',')
+                     if name.strip() in lazy_loader_names])
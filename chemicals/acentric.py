@@ -36,6 +36,7 @@ Lookup Functions
 ----------------
 .. autofunction:: chemicals.acentric.omega
 .. autofunction:: chemicals.acentric.omega_methods
+.. autofunction:: chemicals.acentric.omega_many
 .. autodata:: chemicals.acentric.omega_all_methods
 
 Definitions
@@ -49,14 +50,15 @@ Correlations
 """
 
 __all__ = ['omega', 'LK_omega', 'Stiel_polar_factor',
-           'omega_methods', 'omega_all_methods', 'omega_definition']
+           'omega_methods', 'omega_many', 'omega_all_methods', 'omega_definition']
 
 from chemicals import critical
 from chemicals import data_reader as dr
 from chemicals.data_reader import (list_available_methods_from_df_dict,
                                    database_constant_lookup,
                                    retrieve_any_from_df_dict,
-                                   retrieve_from_df_dict)
+                                   retrieve_from_df_dict,
+                                   retrieve_many_from_df_dict)
 from chemicals.utils import log, log10, mark_numba_incompatible
 
 omega_all_methods = ('PSRK', 'PD', 'YAWS', critical.ACENTRIC_DEFINITION)
@@ -159,6 +161,43 @@ def omega(CASRN, method=None):
     else:
         return retrieve_any_from_df_dict(critical.omega_sources, CASRN, 'omega')
 
+@mark_numba_incompatible
+def omega_many(CASRNs, method=None):
+    r'''Retrieve the acentric factors of many chemicals from the tabulated
+    values of PSRK, Passut and Danner and Yaws in that order, and then the
+    values calculated from the definition of the acentric factor, as
+    :obj:`omega` does.
+
+    Parameters
+    ----------
+    CASRNs : list[str]
+        CASRNs, [-]
+
+    Returns
+    -------
+    omegas : ndarray
+        Acentric factors, NaN where not available, [-]
+    methods : ndarray
+        Method which provided each value, None where not available, [-]
+
+    Other Parameters
+    ----------------
+    method : string, optional
+        A single method to use for all of the chemicals; see :obj:`omega`.
+
+    Examples
+    --------
+    >>> omegas, methods = omega_many(['64-17-5', '7732-18-5'])
+    >>> omegas.tolist(), methods.tolist()
+    ([0.635, 0.344], ['PSRK', 'PSRK'])
+
+    See Also
+    --------
+    omega
+    chemicals.data_reader.retrieve_many_from_df_dict
+    '''
+    return retrieve_many_from_df_dict(critical.omega_sources, CASRNs, 'omega', method)
+
 def omega_definition(Psat, Pc):
     r'''Returns the acentric factor of a fluid according to its fundamental
     definition using the vapor pressure at a reduced temperature of 0.7Tc.
@@ -83,7 +83,7 @@ from chemicals.data_reader import (data_source, database_constant_lookup,
                                    retrieve_from_df_dict)
 from chemicals.elements import (mass_fractions, molecular_weight,
                                 simple_formula_parser)
-from chemicals.utils import (PY37, can_load_data, mark_numba_incompatible,
+from chemicals.utils import (PY37, can_load_data, single_flight_loader, mark_numba_incompatible,
                              os_path_join, property_mass_to_molar,
                              property_molar_to_mass, source_path)
 
@@ -129,6 +129,7 @@ DAHMEN_MARQUARDT = 'DAHMEN_MARQUARDT'
 
 _combustion_data_loaded = False
 @mark_numba_incompatible
+@single_flight_loader
 def _load_combustion_data():
     global _combustion_data_loaded, florian_liming_ron_experimental, RON_sources, combustdb_ron, combustdb_predictions
     global florian_liming_ron_mon_ann, florian_liming_mon_experimental, MON_sources, dahmen_marquardt_iqt
@@ -157,6 +158,7 @@ def _load_combustion_data():
     ignition_delay_sources = {
         DAHMEN_MARQUARDT: dahmen_marquardt_iqt,
     }
+    _combustion_data_loaded = True
 
 if PY37:
     def __getattr__(name):
@@ -35,18 +35,21 @@ Critical Temperature
 --------------------
 .. autofunction:: chemicals.critical.Tc
 .. autofunction:: chemicals.critical.Tc_methods
+.. autofunction:: chemicals.critical.Tc_many
 .. autodata:: chemicals.critical.Tc_all_methods
 
 Critical Pressure
 -----------------
 .. autofunction:: chemicals.critical.Pc
 .. autofunction:: chemicals.critical.Pc_methods
+.. autofunction:: chemicals.critical.Pc_many
 .. autodata:: chemicals.critical.Pc_all_methods
 
 Critical Volume
 ---------------
 .. autofunction:: chemicals.critical.Vc
 .. autofunction:: chemicals.critical.Vc_methods
+.. autofunction:: chemicals.critical.Vc_many
 .. autodata:: chemicals.critical.Vc_all_methods
 .. autofunction:: chemicals.critical.Mersmann_Kind_predictor
 
@@ -54,6 +57,7 @@ Critical Compressibility Factor
 -------------------------------
 .. autofunction:: chemicals.critical.Zc
 .. autofunction:: chemicals.critical.Zc_methods
+.. autofunction:: chemicals.critical.Zc_many
 .. autodata:: chemicals.critical.Zc_all_methods
 
 Critical Property Relationships
@@ -90,8 +94,8 @@ __all__ = ['Tc', 'Pc', 'Vc', 'Zc',
            'Chueh_Prausnitz_Tc', 'Grieves_Thodos',
            'modified_Wilson_Tc', 'Chueh_Prausnitz_Vc',
            'modified_Wilson_Vc',
-           'Tc_methods', 'Pc_methods',
-           'Vc_methods', 'Zc_methods',
+           'Tc_methods', 'Tc_many', 'Pc_methods', 'Pc_many',
+           'Vc_methods', 'Vc_many', 'Zc_methods', 'Zc_many',
            'critical_surface_methods',
            'Tc_all_methods', 'Pc_all_methods',
            'Vc_all_methods', 'Zc_all_methods',
@@ -101,13 +105,14 @@ __all__ = ['Tc', 'Pc', 'Vc', 'Zc',
 from fluids.constants import N_A, R, R_inv
 from chemicals import data_reader as dr
 from chemicals import miscdata
-from chemicals.data_reader import (data_source,
+from chemicals.data_reader import (data_source, ensure_columns,
                                    list_available_methods_from_df_dict,
                                    register_df_source, database_constant_lookup,
                                    retrieve_any_from_df_dict,
-                                   retrieve_from_df_dict)
+                                   retrieve_from_df_dict,
+                                   retrieve_many_from_df_dict)
 from chemicals.utils import (
-    PY37, can_load_data, log, mark_numba_incompatible, os_path_join,
+    PY37, can_load_data, single_flight_loader, log, mark_numba_incompatible, os_path_join,
     source_path)
 
 folder = os_path_join(source_path, 'Critical Properties')
@@ -130,6 +135,7 @@ def _add_Zc_to_df(df):
     # TODO: Think about adding these to the files
     import pandas as pd
     if 'Zc' in df: return
+    ensure_columns(df, ('Tc', 'Pc', 'Vc'))
     df['Zc'] = pd.Series(df['Pc']*df['Vc']*R_inv/df['Tc'], index=df.index)
 
 # IUPAC Organic data series
@@ -151,6 +157,7 @@ register_df_source(folder, 'omega_Psat_Tc_predictions.tsv', int_CAS=True)
 
 _critical_data_loaded = False
 @mark_numba_incompatible
+@single_flight_loader
 def _load_critical_data():
     global critical_data_IUPAC, critical_data_Matthews, critical_data_CRC
     global critical_data_PSRKR4, critical_data_Yaws, critical_data_PassutDanner, critical_data_PinaMartines
@@ -166,7 +173,6 @@ def _load_critical_data():
     critical_data_WilsonJasperson = data_source('wilson_jasperson_Tc_Pc_predictions.tsv')
     critical_data_Fedors = data_source('fedors_Vc_predictions.tsv')
     critical_data_omega_Psat_Tc = data_source('omega_Psat_Tc_predictions.tsv')
-    _critical_data_loaded = True
     Tc_sources = {
         IUPAC: critical_data_IUPAC,
         MATTHEWS: critical_data_Matthews,
@@ -213,6 +219,7 @@ def _load_critical_data():
         YAWS: critical_data_Yaws,
         ACENTRIC_DEFINITION: critical_data_omega_Psat_Tc
     }
+    _critical_data_loaded = True
 
 if PY37:
     def __getattr__(name):
@@ -413,6 +420,44 @@ def Tc(CASRN, method=None):
     else:
         return retrieve_any_from_df_dict(Tc_sources, CASRN, 'Tc')
 
+@mark_numba_incompatible
+def Tc_many(CASRNs, method=None):
+    r'''Retrieve the critical temperatures of many chemicals with the sources
+    of :obj:`Tc` in the same order of preference, from the IUPAC review of
+    experimental data first to the Joback and Wilson-Jasperson estimates
+    last.
+
+    Parameters
+    ----------
+    CASRNs : list[str]
+        CASRNs, [-]
+
+    Returns
+    -------
+    Tcs : ndarray
+        Critical temperatures, NaN where not available, [K]
+    methods : ndarray
+        Method which provided each value, None where not available, [-]
+
+    Other Parameters
+    ----------------
+    method : string, optional
+        A single method to use for all of the chemicals; see :obj:`Tc`.
+
+    Examples
+    --------
+    >>> Tcs, methods = Tc_many(['64-17-5', '7732-18-5'])
+    >>> Tcs.tolist(), methods.tolist()
+    ([514.0, 647.14], ['IUPAC', 'MATTHEWS'])
+
+    See Also
+    --------
+    Tc
+    chemicals.data_reader.retrieve_many_from_df_dict
+    '''
+    if not _critical_data_loaded: _load_critical_data()
+    return retrieve_many_from_df_dict(Tc_sources, CASRNs, 'Tc', method)
+
 Pc_all_methods = (IUPAC, MATTHEWS, CRC, PD, miscdata.WEBBOOK, PSRK, PINAMARTINES, YAWS, WILSON_JASPERSON, miscdata.JOBACK)
 '''Tuple of method name keys. See the `Pc` for the actual references'''
 
@@ -592,6 +637,44 @@ def Pc(CASRN, method=None):
     else:
         return retrieve_any_from_df_dict(Pc_sources, CASRN, 'Pc')
 
+@mark_numba_incompatible
+def Pc_many(CASRNs, method=None):
+    r'''Retrieve the critical pressures of many chemicals, preferring the
+    IUPAC and Mathews experimental data and then the CRC, PSRK, Passut and
+    Danner, WebBook, Piña-Martinez and Yaws compilations over the estimation
+    methods, as :obj:`Pc` does.
+
+    Parameters
+    ----------
+    CASRNs : list[str]
+        CASRNs, [-]
+
+    Returns
+    -------
+    Pcs : ndarray
+        Critical pressures, NaN where not available, [Pa]
+    methods : ndarray
+        Method which provided each value, None where not available, [-]
+
+    Other Parameters
+    ----------------
+    method : string, optional
+        A single method to use for all of the chemicals; see :obj:`Pc`.
+
+    Examples
+    --------
+    >>> Pcs, methods = Pc_many(['64-17-5', '7732-18-5'])
+    >>> Pcs.tolist(), methods.tolist()
+    ([6137000.0, 22048320.0], ['IUPAC', 'MATTHEWS'])
+
+    See Also
+    --------
+    Pc
+    chemicals.data_reader.retrieve_many_from_df_dict
+    '''
+    if not _critical_data_loaded: _load_critical_data()
+    return retrieve_many_from_df_dict(Pc_sources, CASRNs, 'Pc', method)
+
 Vc_all_methods = (IUPAC, MATTHEWS, CRC, miscdata.WEBBOOK, PSRK, PINAMARTINES, YAWS, FEDORS, miscdata.JOBACK)
 '''Tuple of method name keys. See the `Vc` for the actual references'''
 
@@ -765,6 +848,43 @@ def Vc(CASRN, method=None):
     else:
         return retrieve_any_from_df_dict(Vc_sources, CASRN, 'Vc')
 
+@mark_numba_incompatible
+def Vc_many(CASRNs, method=None):
+    r'''Retrieve the critical volumes of many chemicals with the sources of
+    :obj:`Vc`; the Joback and Fedors group contribution estimates are used
+    only for chemicals in none of the tabulations.
+
+    Parameters
+    ----------
+    CASRNs : list[str]
+        CASRNs, [-]
+
+    Returns
+    -------
+    Vcs : ndarray
+        Critical volumes, NaN where not available, [m^3/mol]
+    methods : ndarray
+        Method which provided each value, None where not available, [-]
+
+    Other Parameters
+    ----------------
+    method : string, optional
+        A single method to use for all of the chemicals; see :obj:`Vc`.
+
+    Examples
+    --------
+    >>> Vcs, methods = Vc_many(['64-17-5', '7732-18-5'])
+    >>> Vcs.tolist(), methods.tolist()
+    ([0.000168, 5.6e-05], ['IUPAC', 'MATTHEWS'])
+
+    See Also
+    --------
+    Vc
+    chemicals.data_reader.retrieve_many_from_df_dict
+    '''
+    if not _critical_data_loaded: _load_critical_data()
+    return retrieve_many_from_df_dict(Vc_sources, CASRNs, 'Vc', method)
+
 Zc_all_methods = (IUPAC, MATTHEWS, CRC, miscdata.WEBBOOK, PSRK, PINAMARTINES, YAWS, miscdata.JOBACK)
 '''Tuple of method name keys. See the `Zc` for the actual references'''
 
@@ -935,6 +1055,42 @@ def Zc(CASRN, method=None):
     else:
         return retrieve_any_from_df_dict(Zc_sources, CASRN, 'Zc')
 
+@mark_numba_incompatible
+def Zc_many(CASRNs, method=None):
+    r'''Retrieve the critical compressibilities of many chemicals as tabulated
+    in the sources of :obj:`Zc`, in its order of preference.
+
+    Parameters
+    ----------
+    CASRNs : list[str]
+        CASRNs, [-]
+
+    Returns
+    -------
+    Zcs : ndarray
+        Critical compressibilities, NaN where not available, [-]
+    methods : ndarray
+        Method which provided each value, None where not available, [-]
+
+    Other Parameters
+    ----------------
+    method : string, optional
+        A single method to use for all of the chemicals; see :obj:`Zc`.
+
+    Examples
+    --------
+    >>> Zcs, methods = Zc_many(['64-17-5', '7732-18-5'])
+    >>> Zcs.tolist(), methods.tolist()
+    ([0.241, 0.23], ['IUPAC', 'MATTHEWS'])
+
+    See Also
+    --------
+    Zc
+    chemicals.data_reader.retrieve_many_from_df_dict
+    '''
+    if not _critical_data_loaded: _load_critical_data()
+    return retrieve_many_from_df_dict(Zc_sources, CASRNs, 'Zc', method)
+
 rcovs_Mersmann_Kind = {'C': 0.77, 'Cl': 0.99, 'I': 1.33, 'H': 0.37, 'F': 0.71,
                        'S': 1.04, 'O': 0.6, 'N': 0.71, 'Si': 1.17, 'Br': 1.14}
 
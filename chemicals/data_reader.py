@@ -29,10 +29,31 @@ __all__ = ['df_sources',
            'retrieve_any_from_df',
            'retrieve_from_df',
            'list_available_methods_from_df_dict',
-           'list_available_methods_from_df']
+           'list_available_methods_from_df',
+           'retrieve_many_from_df_dict',
+           'list_indexes_with_methods',
+           'build_df_cache',
+           'write_shared_snapshot',
+           'attach_shared_snapshot',
+           'compile_data_bundle',
+           'attach_data_bundle',
+           'verify_data_bundle',
+           'open_data_file',
+           'PackedArrays',
+           'PackedArrayDict',
+           'ensure_columns',
+           'load_report',
+           'clear_negative_cache']
 
 import os
+import io
+import sys
+import json
+import hashlib
+import threading
 from math import isnan, nan
+from collections.abc import Mapping, MutableMapping
+from time import perf_counter
 
 try:
     path_join = os.path.join
@@ -52,8 +73,8 @@ try:
     
 except:
     pass
-from chemicals.identifiers import CAS_to_int
-from chemicals.utils import source_path
+from chemicals.identifiers import CAS_to_int, int_to_CAS
+from chemicals.utils import LRUCache, source_path
 
 # %% Loading data from local databanks
 
@@ -76,10 +97,22 @@ def make_df_sparse(df, non_sparse_columns=[]):
     return df
 
 
+# Sources whose columns may be loaded one at a time, see `USE_COLUMN_PROJECTION`
+lazy_column_sources = set()
+
 def register_df_source(folder, name, sep='\t', index_col=0, csv_kwargs=None,
-                       postload=None, sparsify=False, int_CAS=False):
+                       postload=None, sparsify=False, int_CAS=False,
+                       lazy_columns=False):
     if csv_kwargs is None: csv_kwargs = {}
+    if int_CAS:
+        dtype = csv_kwargs.get('dtype', {})
+        dtype['CAS'] = int64_dtype
+        csv_kwargs['dtype'] = dtype
+    global sources_generation
     load_cmds[name] = (folder, name, sep, index_col, csv_kwargs, postload, sparsify, int_CAS)
+    sources_generation += 1
+    if lazy_columns and postload is None:
+        lazy_column_sources.add(name)
 
 '''The following flags will strip out the excess memory usage of redundant 
 chemical metadata information.
@@ -89,28 +122,45 @@ try:
 except:
     low_mem = False
 
+'''With column projection, sources registered with `lazy_columns` are
+loaded with only their index and the columns requested from `data_source`;
+any other column is parsed from the file the first time a lookup needs it.
+This is enabled by setting `CHEDL_PROJECT_COLUMNS` to 1; it is not implied
+by `CHEDL_LOW_MEMORY`, as code which reads the columns of such a dataframe
+directly must call `ensure_columns` first.
+'''
+try:
+    USE_COLUMN_PROJECTION = bool(int(os.environ.get('CHEDL_PROJECT_COLUMNS', '0')))
+except:
+    USE_COLUMN_PROJECTION = False
+
 spurious_columns = set(['name', 'formula', 'MW', 'InChI', 'InChI_key', 'Chemical',
                     'Data Type', 'Uncertainty', 'Fluid', 'Name', 'Names', 'Name ',
                     'Formula', 'Formula '])
 
-def load_df(key):
+def parse_df_source(key, columns=None):
+    '''Read a registered data source from its text file, applying the
+    `postload` hook, sparsification, and integer CAS index conversion.
+    If `columns` is given, only the index and those of the columns present
+    in the file are read. Returns the resulting dataframe without storing it.
+    '''
     global pd
     if pd is None:
         import pandas as pd
     folder, name, sep, index_col, csv_kwargs, postload, sparsify, int_CAS = load_cmds[key]
     path = path_join(folder, name)
-    if int_CAS:
-        dtype = csv_kwargs.get('dtype', {})
-        dtype['CAS'] = int64_dtype
-        csv_kwargs['dtype'] = dtype
-    df = pd.read_csv(path, sep=sep, index_col=index_col, **csv_kwargs)
+    if columns is not None:
+        header = source_columns(key)
+        if type(index_col) is int:
+            index_col = header[index_col]
+        usecols = set(columns)
+        usecols = [index_col] + [c for c in header if c in usecols and c != index_col]
+        df = pd.read_csv(path, sep=sep, index_col=index_col, usecols=usecols, **csv_kwargs)
+    else:
+        df = pd.read_csv(path, sep=sep, index_col=index_col, **csv_kwargs)
     if postload: postload(df)
     if sparsify:
         df = make_df_sparse(df)
-    if low_mem:
-        for col_name in df.columns.values.tolist():
-            if col_name in spurious_columns:
-                df[col_name] = pd.Series([], dtype=float).astype(pd.SparseDtype("float", nan))
 
     if int_CAS and df.index.dtype is object_dtype:
         # If the index is already an int, leave it be
@@ -133,19 +183,1099 @@ def load_df(key):
         the check digit.
         '''
         df.index = pd.Index([CAS_to_int(s) for s in df.index], dtype=int64_dtype, name=df.index.name)
-        
+    return df
+
+def load_df(key, columns=None):
+    global pd, sources_generation
+    if pd is None:
+        import pandas as pd
+    if USE_LOAD_PROFILING:
+        start, caller = perf_counter(), load_caller()
+    df = None
+    projected = False
+    origin = 'text'
+    if data_bundle is not None:
+        df = read_data_bundle(key)
+        origin = 'bundle'
+    if df is None and shared_snapshot is not None:
+        df = read_shared_snapshot(key)
+        origin = 'snapshot'
+    if df is None and use_df_cache:
+        source_hash = df_source_hash(key)
+        df = read_df_cache(key, source_hash)
+        origin = 'cache'
+    parse_start = perf_counter()
+    if df is None and columns is not None:
+        df = parse_df_source(key, columns)
+        projected, origin = True, 'text'
+    if df is None:
+        df = parse_df_source(key)
+        origin = 'text'
+    parse_time = perf_counter() - parse_start
+    if origin == 'text' and not projected:
+        if use_df_cache:
+            try:
+                write_df_cache(key, df, source_hash)
+            except Exception:
+                # The cache is an optimization only; a read-only install
+                # keeps working from the text files
+                pass
+    if low_mem:
+        for col_name in df.columns.values.tolist():
+            if col_name in spurious_columns:
+                df[col_name] = pd.Series([], dtype=float).astype(pd.SparseDtype("float", nan))
+
+    if key in df_sources:
+        # Do not keep serving lookups from a replaced dataframe
+        df_lookups.pop(id(df_sources[key]), None)
+        projected_sources.pop(id(df_sources[key]), None)
+    if projected:
+        projected_sources[id(df)] = key
     df_sources[key] = df
+    sources_generation += 1
+    if USE_LOAD_PROFILING:
+        record_load(key, 'source', perf_counter() - start, caller,
+                    parse_time=parse_time if origin == 'text' else 0.0,
+                    nbytes=int(df.memory_usage(deep=True).sum()), origin=origin)
+
+# One lock per source, so concurrent first uses of a source parse it once
+# while loads of other sources proceed
+df_load_locks = {}
+df_load_locks_lock = threading.Lock()
+
+def source_lock(key):
+    with df_load_locks_lock:
+        try:
+            return df_load_locks[key]
+        except KeyError:
+            lock = df_load_locks[key] = threading.RLock()
+            return lock
+
+def data_source(key, columns=None):
+    '''Return the dataframe of a registered data source, loading it on first
+    use. `columns` lists the columns the caller needs; with column
+    projection enabled for the source, only those are loaded (or added to an
+    already loaded dataframe), otherwise every column is loaded.
+    '''
+    try:
+        df = df_sources[key]
+    except KeyError:
+        pass
+    else:
+        if columns is not None and id(df) in projected_sources:
+            ensure_columns(df, columns)
+        return df
+    with source_lock(key):
+        try:
+            # Loaded by another thread while this one waited
+            df = df_sources[key]
+        except KeyError:
+            if USE_COLUMN_PROJECTION and key in lazy_column_sources:
+                load_df(key, () if columns is None else columns)
+            else:
+                load_df(key)
+            return df_sources[key]
+    if columns is not None and id(df) in projected_sources:
+        ensure_columns(df, columns)
+    return df
 
-def data_source(key):
+# Dataframes loaded with only some of their columns, by id, to their source
+projected_sources = {}
+source_headers = {}
+
+def source_columns(key):
+    '''Return the names of all the columns in the file of a data source.'''
     try:
-        return df_sources[key]
+        return source_headers[key]
     except KeyError:
-        load_df(key)
-        return df_sources[key]
+        pass
+    global pd
+    if pd is None:
+        import pandas as pd
+    folder, name, sep, index_col, csv_kwargs = load_cmds[key][0:5]
+    header = pd.read_csv(path_join(folder, name), sep=sep, nrows=0,
+                         **{k: v for k, v in csv_kwargs.items() if k != 'dtype'}).columns.tolist()
+    source_headers[key] = header
+    return header
+
+def ensure_columns(df, columns):
+    '''Make sure a dataframe loaded with column projection holds the given
+    columns, reading the missing ones from its file. Columns not in the file
+    are ignored, and dataframes loaded in full are returned unchanged.
+    '''
+    key = projected_sources.get(id(df))
+    if key is None:
+        return df
+    if isinstance(columns, str):
+        columns = (columns,)
+    existing = df.columns
+    if all(c in existing for c in columns):
+        return df
+    with source_lock(key):
+        header = source_columns(key)
+        missing = [c for c in columns if c not in df.columns and c in header]
+        if missing:
+            extra = parse_df_source(key, missing)
+            for c in missing:
+                # Same file and rows, so the values line up by position
+                df[c] = extra[c].array
+        index_name = df.index.name
+        if all(c in df.columns for c in header if c != index_name):
+            projected_sources.pop(id(df), None)
+    return df
+
+def ensure_dict_columns(df_dict, key):
+    for df in df_dict.values():
+        if id(df) in projected_sources:
+            ensure_columns(df, key)
+
+
+# %% Load profiling
+
+'''Setting the environment variable `CHEDL_PROFILE_LOADS` to 1 records, for
+every data source loaded and every lazy loader of a module run, the wall
+time, the time spent parsing text files, the memory held by the resulting
+dataframe, where the data came from, and the code which first needed it.
+Setting it to 2 also starts `tracemalloc`, so the memory retained by the
+module loaders, including the dicts and objects they build, is recorded as
+well; this slows loading down considerably. `load_report` returns the
+records.
+'''
+try:
+    USE_LOAD_PROFILING = int(os.environ.get('CHEDL_PROFILE_LOADS', '0'))
+except:
+    USE_LOAD_PROFILING = 0
+if USE_LOAD_PROFILING > 1:
+    import tracemalloc
+    tracemalloc.start()
+
+load_profiles = {}
+_profiling_skip_files = set([os.path.abspath(__file__),
+                             path_join(os.path.abspath(source_path), 'utils.py')])
+
+def load_caller():
+    '''Describe the first stack frame outside of the loading machinery.'''
+    frame = sys._getframe(1)
+    while frame is not None and (os.path.abspath(frame.f_code.co_filename) in _profiling_skip_files
+                                 or frame.f_code.co_name == '__getattr__'):
+        frame = frame.f_back
+    if frame is None: # pragma: no cover
+        return None
+    return '%s:%d (%s)' %(frame.f_code.co_filename, frame.f_lineno, frame.f_code.co_name)
+
+def record_load(name, kind, wall_time, caller, parse_time=None, nbytes=None, origin=None):
+    profile = load_profiles.get(name)
+    if profile is None:
+        load_profiles[name] = {'name': name, 'kind': kind, 'count': 1,
+                               'wall_time': wall_time, 'parse_time': parse_time,
+                               'bytes': nbytes, 'origin': origin, 'caller': caller}
+    else:
+        # Reloads accumulate time; the first caller is kept
+        profile['count'] += 1
+        profile['wall_time'] += wall_time
+        if parse_time is not None:
+            profile['parse_time'] = (profile['parse_time'] or 0.0) + parse_time
+        profile['bytes'] = nbytes
+        profile['origin'] = origin
+
+def profile_loader(f):
+    '''Run the lazy loader `f` of a module, recording its wall time and, if
+    `tracemalloc` is tracing, the memory it retains.'''
+    caller = load_caller()
+    tracing = False
+    if USE_LOAD_PROFILING > 1 or 'tracemalloc' in sys.modules:
+        import tracemalloc
+        tracing = tracemalloc.is_tracing()
+    if tracing:
+        before = tracemalloc.get_traced_memory()[0]
+    start = perf_counter()
+    f()
+    wall_time = perf_counter() - start
+    nbytes = tracemalloc.get_traced_memory()[0] - before if tracing else None
+    record_load('%s.%s' %(f.__module__, f.__name__), 'loader', wall_time, caller, nbytes=nbytes)
+
+def load_report(kind=None):
+    '''Return the recorded load profiles, slowest first.
+
+    Parameters
+    ----------
+    kind : str, optional
+        'source' for data files or 'loader' for module loaders; both if not
+        specified, [-]
+
+    Returns
+    -------
+    report : list[dict]
+        One record per data source or loader with the keys 'name', 'kind',
+        'count', 'wall_time' [s], 'parse_time' [s], 'bytes', 'origin'
+        ('text', 'cache', 'snapshot' or 'bundle' for sources) and 'caller', [-]
+    '''
+    report = [dict(v) for v in load_profiles.values() if kind is None or v['kind'] == kind]
+    report.sort(key=lambda v: v['wall_time'], reverse=True)
+    return report
+
+# %% Binary cache of data sources
+
+'''Parsing the text files with pandas dominates the time of the first lookup
+of a property. The following functions store each registered source in a
+pre-parsed binary form, which can be read back in a small fraction of the
+time. The cache is enabled by setting the environment variable
+`CHEDL_DF_CACHE` to 1; its location defaults to a `Cache` folder in the
+package and can be changed with `CHEDL_DF_CACHE_DIR`. Each cached table
+records a hash of the text file it was created from, as well as of the
+options it was loaded with; a cache file which does not match is ignored
+and rewritten.
+
+The file format is a short magic string, the length of a JSON header, the
+header itself, and then the raw arrays, each aligned to 64 bytes. Numeric
+columns are stored as-is, sparse columns are stored densely and
+re-sparsified on load, and string columns are stored as one UTF-8 blob plus
+the offsets of each value and a mask of missing values.
+'''
+try:
+    use_df_cache = bool(int(os.environ.get('CHEDL_DF_CACHE', '0')))
+except:
+    use_df_cache = False
+df_cache_folder = os.environ.get('CHEDL_DF_CACHE_DIR', path_join(source_path, 'Cache'))
+
+DF_CACHE_VERSION = 1
+DF_CACHE_MAGIC = b'CHEDLBIN'
+DF_CACHE_ALIGNMENT = 64
+
+def df_source_hash(key):
+    '''Compute a hash of the text file of a registered data source and the
+    options it is loaded with; any change to either invalidates its cache.
+    '''
+    global pd
+    if pd is None:
+        import pandas as pd
+    folder, name, sep, index_col, csv_kwargs, postload, sparsify, int_CAS = load_cmds[key]
+    h = hashlib.sha256()
+    with open(path_join(folder, name), 'rb') as f:
+        h.update(f.read())
+    postload_name = None if postload is None else (postload.__module__ + '.' + postload.__name__)
+    options = (DF_CACHE_VERSION, pd.__version__, sep, index_col,
+               sorted((k, repr(v)) for k, v in csv_kwargs.items() if k != 'dtype'),
+               sorted((k, repr(v)) for k, v in csv_kwargs.get('dtype', {}).items()),
+               postload_name, sparsify, int_CAS)
+    h.update(repr(options).encode('utf-8'))
+    return h.hexdigest()
+
+def df_cache_path(key, folder=None):
+    if folder is None:
+        folder = df_cache_folder
+    return path_join(folder, key + '.chedl')
+
+def pack_strings(values, nulls):
+    '''Pack an array of strings into a UTF-8 blob and the character offsets
+    of each value. Missing values are stored as empty strings.
+    '''
+    strings = ['' if null else value for value, null in zip(values.tolist(), nulls.tolist())]
+    for value in strings:
+        if type(value) is not str:
+            raise TypeError("Cannot cache non-string object %r" %(value,))
+    offsets = np.zeros(len(strings) + 1, dtype=np.int64)
+    np.cumsum([len(v) for v in strings], out=offsets[1:])
+    blob = np.frombuffer(''.join(strings).encode('utf-8'), dtype=np.uint8)
+    return blob, offsets
+
+def unpack_strings(blob, offsets, nulls):
+    text = blob.tobytes().decode('utf-8')
+    offsets = offsets.tolist()
+    values = np.empty(len(offsets) - 1, dtype=object)
+    values[:] = [text[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+    values[nulls.view(np.bool_)] = nan
+    return values
+
+def encode_df(df, arrays):
+    '''Describe a dataframe as JSON-compatible metadata, appending the
+    arrays holding its data to `arrays`.
+    '''
+    def add(arr):
+        arrays.append(np.ascontiguousarray(arr))
+        return len(arrays) - 1
+
+    def encode_values(values, dtype):
+        if isinstance(dtype, pd.SparseDtype):
+            return {'kind': 'sparse', 'dtype': str(dtype.subtype),
+                    'data': add(np.asarray(values.to_dense(), dtype=dtype.subtype))}
+        elif isinstance(dtype, np.dtype) and dtype.kind in 'biuf':
+            return {'kind': 'numeric', 'dtype': dtype.str, 'data': add(np.asarray(values))}
+        else:
+            values = np.asarray(values, dtype=object)
+            nulls = pd.isna(values)
+            blob, offsets = pack_strings(values, nulls)
+            return {'kind': 'str', 'dtype': str(dtype), 'data': add(blob),
+                    'offsets': add(offsets), 'nulls': add(nulls.astype(np.uint8))}
+
+    index = encode_values(df.index.values, df.index.dtype)
+    index['name'] = df.index.name
+    columns = []
+    for col, dtype in zip(df.columns.tolist(), df.dtypes.tolist()):
+        column = encode_values(df[col].array, dtype)
+        column['name'] = col
+        columns.append(column)
+    return {'index': index, 'columns': columns, 'rows': len(df)}
+
+def decode_df(meta, arrays, copy=True, sparse=True):
+    '''Recreate a dataframe from the metadata and arrays created by
+    `encode_df`. With `copy` False, numeric columns are views of `arrays`;
+    with `sparse` False, sparse columns are left dense so they can be views
+    as well.
+    '''
+    def decode_values(spec):
+        values = arrays[spec['data']]
+        kind = spec['kind']
+        if kind == 'str':
+            values = unpack_strings(values, arrays[spec['offsets']], arrays[spec['nulls']])
+            return pd.array(values, dtype=spec['dtype'], copy=False)
+        elif copy:
+            values = values.copy()
+        if kind == 'sparse' and sparse:
+            return pd.arrays.SparseArray(values, fill_value=nan)
+        return values
+
+    index = pd.Index(decode_values(meta['index']), name=meta['index']['name'], copy=False)
+    data = {column['name']: decode_values(column) for column in meta['columns']}
+    return pd.DataFrame(data, index=index, columns=list(data), copy=False)
+
+def write_tables(path, tables, header=None, arrays=None, checksums=False):
+    '''Write a dict of dataframes to a single binary file at `path`. The file
+    is written to a temporary name first and moved into place, so concurrent
+    readers never see a partial file. Arrays already in `arrays` are stored
+    ahead of those of the tables; with `checksums`, the SHA-256 of every
+    array is recorded in the header.
+    '''
+    if arrays is None:
+        arrays = []
+    if header is None:
+        header = {}
+    header['version'] = DF_CACHE_VERSION
+    header['tables'] = {key: encode_df(df, arrays) for key, df in tables.items()}
+    if checksums:
+        header['checksums'] = [hashlib.sha256(arr.tobytes()).hexdigest() for arr in arrays]
+    specs, offset = [], 0
+    for arr in arrays:
+        offset += -offset % DF_CACHE_ALIGNMENT
+        specs.append((arr.dtype.str, offset, int(arr.size)))
+        offset += arr.nbytes
+    header['arrays'] = specs
+    header_bytes = json.dumps(header).encode('utf-8')
+    data_start = len(DF_CACHE_MAGIC) + 8 + len(header_bytes)
+    data_start += -data_start % DF_CACHE_ALIGNMENT
+
+    folder = os.path.dirname(path)
+    if folder and not os.path.exists(folder):
+        os.makedirs(folder)
+    tmp_path = '%s.%d.tmp' %(path, os.getpid())
+    with open(tmp_path, 'wb') as f:
+        f.write(DF_CACHE_MAGIC)
+        f.write(len(header_bytes).to_bytes(8, 'little'))
+        f.write(header_bytes)
+        for arr, (_, offset, _) in zip(arrays, specs):
+            f.seek(data_start + offset)
+            f.write(arr.tobytes())
+    os.replace(tmp_path, path)
+
+def read_tables_header(buf):
+    '''Parse the header of a binary table file held in `buf`, and return it
+    along with views of each stored array.
+    '''
+    magic_len = len(DF_CACHE_MAGIC)
+    if bytes(buf[0:magic_len]) != DF_CACHE_MAGIC:
+        raise ValueError('Not a chemicals binary table file')
+    header_len = int.from_bytes(bytes(buf[magic_len:magic_len + 8]), 'little')
+    header = json.loads(bytes(buf[magic_len + 8:magic_len + 8 + header_len]).decode('utf-8'))
+    if header.get('version') != DF_CACHE_VERSION:
+        raise ValueError('Unsupported binary table file version')
+    data_start = magic_len + 8 + header_len
+    data_start += -data_start % DF_CACHE_ALIGNMENT
+    arrays = [np.frombuffer(buf, dtype=np.dtype(dtype), count=count, offset=data_start + offset)
+              for dtype, offset, count in header['arrays']]
+    return header, arrays
+
+def write_df_cache(key, df, source_hash, folder=None):
+    write_tables(df_cache_path(key, folder), {key: df}, {'hash': source_hash})
+
+def read_df_cache(key, source_hash=None, folder=None):
+    '''Load a data source from its binary cache. Returns None if there is no
+    cache file, or if it was made from a different version of the source.
+    '''
+    global pd
+    if pd is None:
+        import pandas as pd
+    if source_hash is None:
+        source_hash = df_source_hash(key)
+    try:
+        with open(df_cache_path(key, folder), 'rb') as f:
+            buf = f.read()
+        header, arrays = read_tables_header(buf)
+    except (OSError, ValueError):
+        return None
+    if header.get('hash') != source_hash:
+        return None
+    return decode_df(header['tables'][key], arrays)
+
+def build_df_cache(keys=None, folder=None):
+    '''Parse registered data sources and write each of them to the binary
+    cache. All sources are processed by default; the sources of a module are
+    only registered once that module has been imported.
+
+    Parameters
+    ----------
+    keys : list[str], optional
+        Names of the data sources to cache, [-]
+    folder : str, optional
+        Folder to write the cache files in; defaults to `df_cache_folder`, [-]
+
+    Returns
+    -------
+    paths : list[str]
+        The cache files written, [-]
+    '''
+    if keys is None:
+        keys = list(load_cmds)
+    paths = []
+    for key in keys:
+        write_df_cache(key, parse_df_source(key), df_source_hash(key), folder)
+        paths.append(df_cache_path(key, folder))
+    return paths
+
+
+# %% Shared snapshot of data sources
+
+'''Each worker process of a server normally parses and holds its own copy of
+every table. A snapshot writes the tables to one file in the binary cache
+format; once it is attached, sources are decoded from a read-only memory
+map of that file instead of being parsed. Numeric and sparse columns, which
+hold most of the data, become views of the mapped file, so every process
+attached to the same snapshot shares a single copy of them through the page
+cache; only string columns and small bookkeeping objects are per process.
+
+Typical use is to call `write_shared_snapshot` once after
+`chemicals.complete_lazy_loading()`, and `attach_shared_snapshot` in the
+parent process before forking, or in each worker on start. Setting the
+environment variable `CHEDL_SHARED_SNAPSHOT` to the path of a snapshot
+attaches it on import. A table whose text file has changed size or
+modification time since the snapshot was written is parsed normally.
+'''
+shared_snapshot = None
+
+def source_file_signature(key):
+    folder, name = load_cmds[key][0:2]
+    st = os.stat(path_join(folder, name))
+    return [st.st_size, st.st_mtime_ns]
+
+def write_shared_snapshot(path, keys=None):
+    '''Write the given data sources, loading them if needed, to a snapshot
+    file which other processes can attach to.
+
+    Parameters
+    ----------
+    path : str
+        File to write, [-]
+    keys : list[str], optional
+        Names of the data sources to include; defaults to all registered
+        sources, [-]
+
+    Returns
+    -------
+    path : str
+        The file written, [-]
+    '''
+    if keys is None:
+        keys = list(load_cmds)
+    tables = {key: data_source(key) for key in keys}
+    signatures = {key: source_file_signature(key) for key in keys}
+    write_tables(path, tables, {'snapshot': True, 'signatures': signatures})
+    return path
+
+def attach_shared_snapshot(path):
+    '''Memory-map a snapshot written by `write_shared_snapshot` and use it
+    for every data source which is not yet loaded; sources already loaded
+    are kept. Returns the names of the sources in the snapshot.
+    '''
+    global shared_snapshot, pd
+    if pd is None:
+        import pandas as pd
+    import mmap
+    with open(path, 'rb') as f:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    header, arrays = read_tables_header(buf)
+    if not header.get('snapshot'):
+        raise ValueError("%s is not a shared snapshot" %(path))
+    shared_snapshot = (path, buf, header, arrays)
+    return list(header['tables'])
+
+def read_shared_snapshot(key):
+    path, buf, header, arrays = shared_snapshot
+    meta = header['tables'].get(key)
+    if meta is None or key not in load_cmds:
+        return None
+    try:
+        if header['signatures'][key] != source_file_signature(key):
+            return None
+    except OSError:
+        return None
+    return decode_df(meta, arrays, copy=False, sparse=False)
+
+if os.environ.get('CHEDL_SHARED_SNAPSHOT'):
+    try:
+        attach_shared_snapshot(os.environ['CHEDL_SHARED_SNAPSHOT'])
+    except (OSError, ValueError):
+        pass
+
+
+# %% Compiled data bundle
+
+'''The data of the library is spread over many folders of text files, some
+read as registered data sources and some read directly by the loader of a
+module (JSON dictionaries, coefficient tables). `compile_data_bundle` writes
+all of them to one versioned file: every registered source as a table in
+the binary cache format, and every registered data file as its raw bytes.
+The header of the bundle holds a manifest of what it contains, the hashes
+of the files each entry was made from, and the SHA-256 of every stored
+array.
+
+Once a bundle is attached with `attach_data_bundle`, or by setting the
+environment variable `CHEDL_DATA_BUNDLE` to its path, data sources are
+decoded from a memory map of it and `open_data_file` serves the other files
+from it, so the text files need not be installed at all. Unlike a shared
+snapshot, the tables of a bundle are not checked against the text files;
+a bundle should be recompiled whenever the data changes. Setting
+`CHEDL_VERIFY_DATA_BUNDLE` to 1 checks every checksum when the bundle is
+attached from the environment.
+'''
+DATA_BUNDLE_VERSION = 1
+
+data_bundle = None
+data_files = {}
+
+def register_data_file(folder, name):
+    '''Register a data file which a loader reads with `open_data_file`, so
+    that it is included in compiled data bundles.
+    '''
+    path = path_join(folder, name)
+    data_files[data_file_key(path)] = path
+
+def data_file_key(path):
+    return os.path.relpath(os.path.abspath(path), source_path).replace(os.sep, '/')
+
+def file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        h.update(f.read())
+    return h.hexdigest()
+
+def compile_data_bundle(path, keys=None, files=None):
+    '''Parse the given data sources and read the given data files, and write
+    them all to a single bundle file which `attach_data_bundle` can serve
+    every loader from. The sources and files of a module are registered when
+    that module is imported; call `chemicals.complete_lazy_loading()` first
+    to be sure all of them are.
+
+    Parameters
+    ----------
+    path : str
+        File to write, [-]
+    keys : list[str], optional
+        Names of the data sources to include; defaults to all registered
+        sources, [-]
+    files : list[str], optional
+        Paths of the data files to include; defaults to all registered
+        data files which exist, [-]
+
+    Returns
+    -------
+    manifest : dict
+        The manifest stored in the bundle, [-]
+    '''
+    import datetime
+    from chemicals import __version__
+    if keys is None:
+        keys = list(load_cmds)
+    if files is None:
+        files = [p for p in data_files.values() if os.path.exists(p)]
+    arrays, file_manifest = [], {}
+    for file in files:
+        with open(file, 'rb') as f:
+            raw = f.read()
+        file_manifest[data_file_key(file)] = {'array': len(arrays), 'size': len(raw),
+                                              'sha256': hashlib.sha256(raw).hexdigest()}
+        arrays.append(np.frombuffer(raw, dtype=np.uint8))
+    tables, table_manifest = {}, {}
+    for key in keys:
+        folder, name = load_cmds[key][0:2]
+        tables[key] = parse_df_source(key)
+        table_manifest[key] = {'source': data_file_key(path_join(folder, name)),
+                               'hash': df_source_hash(key)}
+    created = datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0)
+    manifest = {'bundle': DATA_BUNDLE_VERSION, 'chemicals_version': __version__,
+                'created': created.isoformat(), 'sources': table_manifest,
+                'files': file_manifest}
+    write_tables(path, tables, dict(manifest), arrays=arrays, checksums=True)
+    return manifest
+
+def open_data_bundle(path):
+    import mmap
+    with open(path, 'rb') as f:
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    header, arrays = read_tables_header(buf)
+    if header.get('bundle') != DATA_BUNDLE_VERSION:
+        raise ValueError("%s is not a supported data bundle" %(path))
+    return buf, header, arrays
+
+def bundle_checksum_failures(header, arrays):
+    checksums = header['checksums']
+    bad = set(i for i, (arr, checksum) in enumerate(zip(arrays, checksums))
+              if hashlib.sha256(arr.tobytes()).hexdigest() != checksum)
+    if len(checksums) != len(arrays):
+        bad.update(range(min(len(checksums), len(arrays)), max(len(checksums), len(arrays))))
+    failures = [name for name, spec in header['files'].items() if spec['array'] in bad]
+    for key, meta in header['tables'].items():
+        specs = [meta['index']] + meta['columns']
+        used = set(spec[k] for spec in specs for k in ('data', 'offsets', 'nulls') if k in spec)
+        if used & bad:
+            failures.append(key)
+    return failures
+
+def verify_data_bundle(path=None):
+    '''Check every array of a data bundle against the checksums recorded
+    when it was compiled.
+
+    Parameters
+    ----------
+    path : str, optional
+        Bundle to check; defaults to the attached bundle, [-]
+
+    Returns
+    -------
+    failures : list[str]
+        Names of the data sources and data files whose stored data does not
+        match its checksum; empty if the bundle is intact, [-]
+    '''
+    if path is None:
+        if data_bundle is None:
+            raise ValueError("No data bundle is attached")
+        _, _, header, arrays = data_bundle
+    else:
+        _, header, arrays = open_data_bundle(path)
+    return bundle_checksum_failures(header, arrays)
+
+def attach_data_bundle(path, verify=False):
+    '''Memory-map a bundle written by `compile_data_bundle` and serve every
+    data source which is not yet loaded, and every data file opened with
+    `open_data_file`, from it. Sources already loaded are kept.
+
+    Parameters
+    ----------
+    path : str
+        Bundle to attach, [-]
+    verify : bool, optional
+        Whether to check every checksum first and raise a ValueError if any
+        data is corrupt, [-]
+
+    Returns
+    -------
+    manifest : dict
+        The manifest of the bundle, [-]
+    '''
+    global data_bundle, pd
+    if pd is None:
+        import pandas as pd
+    buf, header, arrays = open_data_bundle(path)
+    if verify:
+        failures = bundle_checksum_failures(header, arrays)
+        if failures:
+            raise ValueError("Data bundle %s is corrupt: %s" %(path, ', '.join(failures)))
+    data_bundle = (path, buf, header, arrays)
+    return {k: header[k] for k in ('bundle', 'chemicals_version', 'created', 'sources', 'files')}
+
+def read_data_bundle(key):
+    path, buf, header, arrays = data_bundle
+    meta = header['tables'].get(key)
+    if meta is None:
+        return None
+    return decode_df(meta, arrays, copy=False, sparse=False)
+
+def bundled_data_file(path):
+    '''Return the bytes of a data file held by the attached data bundle, or
+    None if no bundle holding it is attached.
+    '''
+    if data_bundle is not None:
+        spec = data_bundle[2]['files'].get(data_file_key(path))
+        if spec is not None:
+            return data_bundle[3][spec['array']].tobytes()
+    return None
+
+def open_data_file(path, encoding=None):
+    '''Open a data file for reading as text, from the attached data bundle
+    if it holds the file and otherwise from disk.
+    '''
+    raw = bundled_data_file(path)
+    if raw is not None:
+        return io.StringIO(raw.decode(encoding or 'utf-8'), newline=None)
+    return open(path, encoding=encoding)
+
+# The identifiers module cannot import this one, so its files are listed here
+for name in ('chemical identifiers pubchem large.tsv', 'chemical identifiers pubchem small.tsv',
+             'chemical identifiers example user db.tsv', 'Cation db.tsv', 'Anion db.tsv',
+             'Inorganic db.tsv', 'dippr_2014.csv', 'Mixtures Compositions.tsv'):
+    register_data_file(path_join(source_path, 'Identifiers'), name)
+del name
+
+if os.environ.get('CHEDL_DATA_BUNDLE'):
+    try:
+        attach_data_bundle(os.environ['CHEDL_DATA_BUNDLE'],
+                           verify=os.environ.get('CHEDL_VERIFY_DATA_BUNDLE', '0') == '1')
+    except (OSError, ValueError):
+        pass
+
+
+# %% Packed per-chemical arrays
+
+'''Some data files are JSON dictionaries of numeric arrays per chemical, such
+as tabulated heat capacities. Parsed with `json`, every number becomes a
+Python float inside nested lists, and the whole file is parsed the first
+time any entry is needed. `PackedArrays` stores such a file as one
+contiguous float64 array of rows and an array of offsets, with an index of
+the row segments of each key; the file is only read on first access, and
+with `CHEDL_DF_CACHE` enabled the arrays are stored in the binary cache so
+the JSON is not parsed again. `PackedArrayDict` presents the arrays as a
+dict, creating the value of a key only when it is looked up.
+'''
+
+class PackedArrays(object):
+    '''The numeric arrays of a JSON data file of per-chemical values, read on
+    first use.
+
+    Parameters
+    ----------
+    path : str
+        JSON file holding a dict of values, [-]
+    pack : callable
+        Converts a value of the file into a list of `groups` segments, each
+        a list of rows of `width` numbers, [-]
+    width : int
+        Number of values in each row, [-]
+    groups : int, optional
+        Number of segments each value is split into, [-]
+    '''
+    __slots__ = ('path', 'pack', 'width', 'groups', 'keys', 'offsets', 'data', 'lock')
+
+    def __init__(self, path, pack, width, groups=1):
+        self.path = path
+        self.pack = pack
+        self.width = width
+        self.groups = groups
+        self.keys = None
+        self.lock = threading.Lock()
+
+    def __getstate__(self):
+        # The lock cannot be pickled; a new one is made when unpickling
+        return {name: getattr(self, name) for name in self.__slots__
+                if name != 'lock' and hasattr(self, name)}
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+        self.lock = threading.Lock()
+
+    def load(self):
+        if self.keys is None:
+            with self.lock:
+                if self.keys is None:
+                    self._load()
+        return self
+
+    def _load(self):
+        source_hash = None
+        if use_df_cache:
+            source_hash = self.source_hash()
+            cached = self.read_cache(source_hash)
+            if cached is not None:
+                self.offsets, self.data, self.keys = cached
+                return
+        with open_data_file(self.path) as f:
+            values = json.loads(f.read())
+        keys, offsets, rows = list(values), [0], []
+        for key in keys:
+            for segment in self.pack(values[key]):
+                rows.extend(segment)
+                offsets.append(len(rows))
+        self.offsets = np.array(offsets, dtype=np.int64)
+        self.data = np.array(rows, dtype=np.float64).reshape(len(rows), self.width)
+        if use_df_cache:
+            try:
+                write_tables(self.cache_path(), {}, {'hash': source_hash, 'keys': keys},
+                             arrays=[self.offsets, self.data])
+            except Exception:
+                pass
+        self.keys = keys
+
+    def source_hash(self):
+        h = hashlib.sha256()
+        raw = bundled_data_file(self.path)
+        if raw is None:
+            with open(self.path, 'rb') as f:
+                raw = f.read()
+        h.update(raw)
+        h.update(repr((DF_CACHE_VERSION, self.width, self.groups)).encode('utf-8'))
+        return h.hexdigest()
+
+    def cache_path(self):
+        # Files of the same name in different folders have their own caches
+        key = hashlib.sha256(data_file_key(self.path).encode('utf-8')).hexdigest()[:16]
+        return df_cache_path('%s.%s' %(os.path.basename(self.path), key))
+
+    def read_cache(self, source_hash):
+        try:
+            with open(self.cache_path(), 'rb') as f:
+                buf = f.read()
+            header, arrays = read_tables_header(buf)
+        except (OSError, ValueError):
+            return None
+        if header.get('hash') != source_hash:
+            return None
+        return arrays[0], arrays[1].reshape(-1, self.width), header['keys']
+
+    def segments(self, i):
+        offsets, data = self.offsets, self.data
+        return data[offsets[i]:offsets[i + 1]]
+
+class PackedArrayDict(MutableMapping):
+    '''Dict view of `PackedArrays`. Each value is created by `convert` from
+    the segments of its key the first time it is looked up, and kept. With
+    `group` given, only that segment of each value is passed to `convert`,
+    and keys where that segment is empty are left out. Keys may be assigned
+    and deleted as in a dict, without changing the arrays; `copy` returns a
+    `dict` of every value. It is not a subclass of `dict`.
+
+    Examples
+    --------
+    >>> import os
+    >>> from chemicals.heat_capacity import folder
+    >>> arrays = PackedArrays(os.path.join(folder, 'JANAF_1998_gas_Cp.json'),
+    ...                       lambda v: [list(zip(*v))], width=2)
+    >>> d = PackedArrayDict(arrays, lambda segments: segments[0][:, 1].tolist())
+    >>> d['7732-18-5'][:3]
+    [0.0, 33.299, 33.349]
+    '''
+    __slots__ = ('arrays', 'convert', 'group', 'index', 'materialized')
+
+    def __init__(self, arrays, convert, group=None):
+        self.arrays = arrays
+        self.convert = convert
+        self.group = group
+        self.index = None
+        self.materialized = {}
+
+    def get_index(self):
+        index = self.index
+        if index is None:
+            arrays = self.arrays.load()
+            groups, group, offsets = arrays.groups, self.group, arrays.offsets
+            if group is None:
+                index = {key: i*groups for i, key in enumerate(arrays.keys)}
+            else:
+                index = {key: i*groups + group for i, key in enumerate(arrays.keys)
+                         if offsets[i*groups + group + 1] > offsets[i*groups + group]}
+            self.index = index
+        return index
+
+    def __getitem__(self, key):
+        try:
+            return self.materialized[key]
+        except KeyError:
+            pass
+        start = self.get_index()[key]
+        arrays = self.arrays
+        count = arrays.groups if self.group is None else 1
+        value = self.convert([arrays.segments(i) for i in range(start, start + count)])
+        self.materialized[key] = value
+        return value
+
+    def __setitem__(self, key, value):
+        index = self.get_index()
+        if key not in index:
+            # Assigned values are always found in `materialized`
+            index[key] = None
+        self.materialized[key] = value
+
+    def __delitem__(self, key):
+        del self.get_index()[key]
+        self.materialized.pop(key, None)
+
+    def copy(self):
+        return dict(self.items())
+
+    def __contains__(self, key):
+        return key in self.get_index()
+
+    def __iter__(self):
+        return iter(self.get_index())
+
+    def __len__(self):
+        return len(self.get_index())
+
+    def __repr__(self):
+        return '<%s of %s>' %(self.__class__.__name__, os.path.basename(self.arrays.path))
 
 
 # %% Retrieving data from files
 
+'''Looking up a single value through pandas (`index in df.index`, `df.at`)
+costs several microseconds. With `USE_FAST_LOOKUP` enabled (environment
+variable `CHEDL_FAST_LOOKUP` set to 1), each dataframe is converted the first
+time it is searched into a dict of row numbers keyed by CAS and one numpy
+array per column, built as each column is first requested; a lookup is then a
+dict hit and an array read. Dataframes should not be modified in place after
+they have been searched in this mode.
+'''
+try:
+    USE_FAST_LOOKUP = bool(int(os.environ.get('CHEDL_FAST_LOOKUP', '0')))
+except:
+    USE_FAST_LOOKUP = False
+
+class DataFrameLookup(object):
+    '''Pandas-free lookup structure for one dataframe. The row index is a
+    dict mapping each index value to its row number; column arrays are
+    created on demand. Numeric and sparse columns are stored as float64.
+    '''
+    __slots__ = ('df', 'rows', 'int_index', 'columns')
+    def __init__(self, df):
+        self.df = df
+        self.int_index = df.index.dtype is int64_dtype
+        self.rows = {k: i for i, k in enumerate(df.index.tolist())}
+        self.columns = {}
+
+    def column(self, key):
+        try:
+            return self.columns[key]
+        except KeyError:
+            pass
+        series = self.df[key]
+        dtype = series.dtype
+        numeric = isinstance(dtype, pd.SparseDtype) or (isinstance(dtype, np.dtype) and dtype.kind in 'biuf')
+        if numeric:
+            values = series.to_numpy(dtype=float64_dtype, na_value=nan)
+        else:
+            values = series.to_numpy(dtype=object)
+        self.columns[key] = column = (values, numeric)
+        return column
+
+    def row(self, index):
+        if self.int_index and isinstance(index, str):
+            try: index = CAS_to_int(index)
+            except: return None
+        return self.rows.get(index)
+
+    def value(self, row, key):
+        values, numeric = self.column(key)
+        value = values[row]
+        if numeric:
+            return None if isnan(value) else float(value)
+        try:
+            return None if isnan(value) else float(value)
+        except TypeError: # Not a number
+            return value
+
+    def values(self, row, key):
+        if isinstance(key, (int, str)):
+            return self.value(row, key)
+        else: # Assume its an iterable of strings
+            return [float(self.column(i)[0][row]) for i in key]
+
+    def retrieve(self, index, key):
+        row = self.row(index)
+        if row is not None:
+            return self.values(row, key)
+
+df_lookups = {}
+def get_df_lookup(df):
+    '''Return the `DataFrameLookup` of a dataframe, creating it if needed.
+    The lookup holds a reference to its dataframe, so the id used as the key
+    cannot be reused while the entry exists.
+    '''
+    try:
+        return df_lookups[id(df)]
+    except KeyError:
+        global pd
+        if pd is None:
+            import pandas as pd
+        lookup = df_lookups[id(df)] = DataFrameLookup(df)
+        return lookup
+
+'''A lookup of a chemical which is in none of the sources of a property
+searches every one of them, on every call. Such definitive misses are
+remembered, per dictionary of sources, keyed by (property, CAS, method) with
+a method of None for a search of all methods, so a repeated miss costs one
+set lookup. The misses of a dictionary are discarded when a data source is
+registered or loaded, and when the methods or dataframes in the dictionary
+change, but not when a dataframe is modified in place, such as by adding a
+row to one of the `*_data_*` dataframes; call `clear_negative_cache` after
+doing so. This is enabled by setting `CHEDL_NEGATIVE_CACHE` to 1;
+`CHEDL_NEGATIVE_CACHE_SIZE` bounds the misses remembered per dictionary of
+sources.
+'''
+try:
+    USE_NEGATIVE_CACHE = bool(int(os.environ.get('CHEDL_NEGATIVE_CACHE', '0')))
+except:
+    USE_NEGATIVE_CACHE = False
+try:
+    NEGATIVE_CACHE_SIZE = int(os.environ.get('CHEDL_NEGATIVE_CACHE_SIZE', '100000'))
+except:
+    NEGATIVE_CACHE_SIZE = 100000
+
+# Incremented whenever a data source is registered or loaded
+sources_generation = 0
+
+def sources_match(df_dict, sources):
+    if len(df_dict) != len(sources):
+        return False
+    for (method, df), (method_now, df_now) in zip(sources, df_dict.items()):
+        if method is not method_now and method != method_now or df is not df_now:
+            return False
+    return True
+
+class NegativeLookups(object):
+    '''The misses recorded for one dictionary of sources, valid as long as
+    its contents and the registered sources are unchanged.'''
+    __slots__ = ('df_dict', 'sources', 'generation', 'misses')
+    def __init__(self, df_dict):
+        self.df_dict = df_dict
+        self.sources = tuple(df_dict.items())
+        self.generation = sources_generation
+        self.misses = set()
+
+    def valid(self, df_dict):
+        return (self.generation == sources_generation and df_dict is self.df_dict
+                and sources_match(df_dict, self.sources))
+
+negative_lookups = {}
+
+def is_known_miss(df_dict, index, key, method):
+    negative = negative_lookups.get(id(df_dict))
+    if negative is None or (key, index, method) not in negative.misses:
+        return False
+    if negative.valid(df_dict):
+        return True
+    del negative_lookups[id(df_dict)]
+    return False
+
+def record_miss(df_dict, index, key, method):
+    negative = negative_lookups.get(id(df_dict))
+    if negative is None or not negative.valid(df_dict):
+        negative = negative_lookups[id(df_dict)] = NegativeLookups(df_dict)
+    misses = negative.misses
+    if len(misses) >= NEGATIVE_CACHE_SIZE:
+        misses.clear()
+    misses.add((key, index, method))
+
+def clear_negative_cache():
+    '''Forget every recorded lookup miss.'''
+    negative_lookups.clear()
+
 def retrieve_from_df_dict(df_dict, index, key, method):
     try:
         df = df_dict[method]
@@ -154,14 +1284,60 @@ def retrieve_from_df_dict(df_dict, index, key, method):
                 method, list(df_dict)))
     except TypeError: # pragma: no cover
         raise TypeError("Method must be a string, not a %s object" %(type(method).__name__))
+    if USE_NEGATIVE_CACHE and type(key) is str:
+        if is_known_miss(df_dict, index, key, method):
+            return None
+        value = retrieve_from_df(df, index, key)
+        if value is None:
+            record_miss(df_dict, index, key, method)
+        return value
     return retrieve_from_df(df, index, key)
 
 def retrieve_any_from_df_dict(df_dict, index, key):
+    if USE_NEGATIVE_CACHE and type(key) is str:
+        if is_known_miss(df_dict, index, key, None):
+            return None
+        value = search_df_dict(df_dict, index, key)
+        if value is None:
+            record_miss(df_dict, index, key, None)
+        return value
+    return search_df_dict(df_dict, index, key)
+
+def search_df_dict(df_dict, index, key):
+    if projected_sources: ensure_dict_columns(df_dict, key)
+    # Once a method availability index exists, the first method with a value
+    # is known without searching the sources
+    if type(key) is str:
+        availability = method_availability.get((id(df_dict), key))
+        if availability is not None and availability.valid(df_dict):
+            mask = availability.mask(index)
+            if not mask:
+                return None
+            method = availability.methods[(mask & -mask).bit_length() - 1]
+            return retrieve_from_df(df_dict[method], index, key)
+    if USE_FAST_LOOKUP:
+        int_index = index
+        if isinstance(index, str):
+            try: int_index = CAS_to_int(index)
+            except: int_index = None
+        for df in df_dict.values():
+            try:
+                lookup = df_lookups[id(df)]
+            except KeyError:
+                lookup = get_df_lookup(df)
+            row = lookup.rows.get(int_index if lookup.int_index else index)
+            if row is not None:
+                value = lookup.values(row, key)
+                if value is not None: return value
+        return None
     for df in df_dict.values():
         value = retrieve_from_df(df, index, key)
         if value is not None: return value
 
 def retrieve_from_df(df, index, key):
+    if projected_sources and id(df) in projected_sources: ensure_columns(df, key)
+    if USE_FAST_LOOKUP:
+        return get_df_lookup(df).retrieve(index, key)
     df_index = df.index
     if df_index.dtype is int64_dtype and isinstance(index, str):
         try: index = CAS_to_int(index)
@@ -173,6 +1349,16 @@ def retrieve_from_df(df, index, key):
             return [float(df.at[index, i]) for i in key]
 
 def retrieve_any_from_df(df, index, keys):
+    if projected_sources and id(df) in projected_sources: ensure_columns(df, keys)
+    if USE_FAST_LOOKUP:
+        lookup = get_df_lookup(df)
+        row = lookup.row(index)
+        if row is None: return None
+        for key in keys:
+            value = lookup.value(row, key)
+            if value is not None:
+                return value
+        return None
     df_index = df.index
     if df_index.dtype is int64_dtype and isinstance(index, str):
         try: index = CAS_to_int(index)
@@ -193,21 +1379,178 @@ def get_value_from_df(df, index, key):
     except TypeError: # Not a number
         return value
 
+class MethodAvailability:
+    '''Index of which methods of a dictionary of sources have a value of one
+    property for each chemical, stored as a bitmask over the methods in the
+    order of the dictionary. Chemicals are keyed by integer CAS number where
+    the index allows it.
+    '''
+    __slots__ = ('df_dict', 'sources', 'methods', 'masks', 'decoded', 'int_index')
+    def __init__(self, df_dict, key):
+        global pd
+        if pd is None:
+            import pandas as pd
+        self.df_dict = df_dict
+        self.sources = tuple(df_dict.items())
+        self.methods = tuple(df_dict)
+        self.decoded = {}
+        if projected_sources: ensure_dict_columns(df_dict, key)
+        masks = {}
+        self.int_index = False
+        for bit, df in enumerate(df_dict.values()):
+            flag = 1 << bit
+            indexes = df.index[pd.notna(df[key]).to_numpy()]
+            if indexes.dtype is not int64_dtype:
+                indexes = [availability_key(i) for i in indexes.tolist()]
+            else:
+                self.int_index = True
+                indexes = indexes.tolist()
+            get = masks.get
+            for i in indexes:
+                masks[i] = get(i, 0) | flag
+        self.masks = masks
+
+    def valid(self, df_dict):
+        return df_dict is self.df_dict and sources_match(df_dict, self.sources)
+
+    def mask(self, index):
+        return self.masks.get(availability_key(index), 0)
+
+    def decode(self, mask):
+        try:
+            return self.decoded[mask]
+        except KeyError:
+            pass
+        methods = self.methods
+        decoded = tuple(methods[i] for i in range(len(methods)) if mask >> i & 1)
+        self.decoded[mask] = decoded
+        return decoded
+
+def availability_key(index):
+    if isinstance(index, str):
+        try:
+            return CAS_to_int(index)
+        except:
+            return index
+    return index
+
+method_availability = {}
+def get_method_availability(df_dict, key):
+    '''Return the :obj:`MethodAvailability` of `key` in `df_dict`, building
+    it the first time or when the sources in the dictionary have changed.'''
+    k = (id(df_dict), key)
+    try:
+        availability = method_availability[k]
+        if availability.valid(df_dict):
+            return availability
+    except KeyError:
+        pass
+    availability = method_availability[k] = MethodAvailability(df_dict, key)
+    return availability
+
 def list_available_methods_from_df_dict(df_dict, index, key):
-    methods = []
-    int_index = None if type(index) is str else index # Assume must be string or int
-    for method, df in df_dict.items():
+    availability = get_method_availability(df_dict, key)
+    if availability.int_index and type(index) is str:
+        # An invalid CAS number raises, as when the sources were searched
+        mask = availability.masks.get(CAS_to_int(index), 0)
+    else:
+        mask = availability.mask(index)
+    return list(availability.decode(mask))
+
+def list_indexes_with_methods(df_dict, key, methods):
+    '''Return the CAS numbers of every chemical which has a value of `key`
+    from any of the given `methods` of `df_dict`, sorted as strings.
+    '''
+    availability = get_method_availability(df_dict, key)
+    if isinstance(methods, str):
+        methods = [methods]
+    wanted = 0
+    for method in methods:
+        try:
+            wanted |= 1 << availability.methods.index(method)
+        except ValueError:
+            raise ValueError('Invalid method: %s, allowed methods are %s' %(
+                    method, list(df_dict)))
+    found = [int_to_CAS(i) if type(i) is not str else i
+             for i, mask in availability.masks.items() if mask & wanted]
+    found.sort()
+    return found
+
+CONSTANTS_DATABASE = 'CONSTANTS_DATABASE'
+
+def retrieve_many_from_df_dict(df_dict, indexes, key, method=None):
+    '''Vectorized counterpart of `retrieve_any_from_df_dict` and
+    `retrieve_from_df_dict`. The CAS numbers are converted once, and each
+    source is searched in order with a single index alignment for the
+    chemicals which do not yet have a value. As in the single lookups, the
+    constants database is consulted first when it is enabled and no method
+    is specified; values from it are labeled `CONSTANTS_DATABASE`.
+
+    Returns a float64 array of values, NaN where missing, and an object array
+    of the method which supplied each value, None where missing.
+    '''
+    global pd
+    if pd is None:
+        import pandas as pd
+    if method is not None:
+        try:
+            df_dict = {method: df_dict[method]}
+        except KeyError:
+            raise ValueError('Invalid method: %s, allowed methods are %s' %(
+                    method, list(df_dict)))
+        except TypeError: # pragma: no cover
+            raise TypeError("Method must be a string, not a %s object" %(type(method).__name__))
+    if projected_sources: ensure_dict_columns(df_dict, key)
+    indexes = list(indexes)
+    N = len(indexes)
+    int_indexes = np.full(N, -1, dtype=np.int64)
+    str_indexes = []
+    for i, index in enumerate(indexes):
+        if isinstance(index, str):
+            try: int_indexes[i] = CAS_to_int(index)
+            except: pass
+            str_indexes.append(index)
+        else:
+            int_indexes[i] = index
+            str_indexes.append(int_to_CAS(index))
+    str_indexes = np.array(str_indexes, dtype=object)
+
+    values = np.full(N, nan)
+    methods = np.full(N, None, dtype=object)
+    missing = np.ones(N, dtype=bool)
+    if USE_CONSTANTS_DATABASE and method is None and key in CONSTANT_DATABASE_NAME_TO_IDX:
+        db_values, found = database_constant_lookup_many(int_indexes, key)
+        missing[found] = False
+        hit = found & ~np.isnan(db_values)
+        values[hit] = db_values[hit]
+        methods[hit] = CONSTANTS_DATABASE
+
+    for name, df in df_dict.items():
+        todo = np.flatnonzero(missing)
+        if not len(todo):
+            break
         df_index = df.index
-        if df_index.dtype is int64_dtype:
-            if int_index is None:
-                int_index = CAS_to_int(index)
-            if int_index in df_index and not isnan(df.at[int_index, key]):
-                methods.append(method)
-        elif (index in df_index) and not isnan(df.at[index, key]):
-            methods.append(method)
-    return methods
+        positions = df_index.get_indexer(int_indexes[todo] if df_index.dtype is int64_dtype else str_indexes[todo])
+        found = positions != -1
+        todo, positions = todo[found], positions[found]
+        column = df[key].to_numpy(dtype=float64_dtype, na_value=nan)[positions]
+        hit = ~np.isnan(column)
+        todo = todo[hit]
+        values[todo] = column[hit]
+        methods[todo] = name
+        missing[todo] = False
+    return values, methods
 
 def list_available_methods_from_df(df, index, keys_by_method):
+    if projected_sources and id(df) in projected_sources:
+        ensure_columns(df, list(keys_by_method.values()))
+    if USE_FAST_LOOKUP:
+        lookup = get_df_lookup(df)
+        row = lookup.row(index)
+        if row is None:
+            return []
+        return [method for method, key in keys_by_method.items()
+                if lookup.value(row, key) is not None]
     if index in df.index:
         return [method for method, key in keys_by_method.items()
                 if not pd.isnull(df.at[index, key])]
@@ -216,8 +1559,24 @@ def list_available_methods_from_df(df, index, keys_by_method):
 
 ### Database
 
+CONSTANTS_DB_FOLDER = path_join(source_path, 'Misc')
+CONSTANTS_SQLITE_FILE = 'default.sqlite'
+CONSTANTS_MEMMAP_CAS_FILE = 'default_constants_CAS.npy'
+CONSTANTS_MEMMAP_DATA_FILE = 'default_constants.npy'
+
+# None selects the memory-mapped store when it has been generated, otherwise
+# sqlite; 'memmap' or 'sqlite' force one backend
+CONSTANTS_DATABASE_BACKEND = os.environ.get('CHEDL_CONSTANTS_BACKEND', None)
+
+def constants_memmap_exists(folder=None):
+    if folder is None:
+        folder = CONSTANTS_DB_FOLDER
+    return (os.path.exists(path_join(folder, CONSTANTS_MEMMAP_CAS_FILE))
+            and os.path.exists(path_join(folder, CONSTANTS_MEMMAP_DATA_FILE)))
+
 try:
-    USE_CONSTANTS_DATABASE = os.path.exists(path_join(source_path, 'Misc', 'default.sqlite'))
+    USE_CONSTANTS_DATABASE = (os.path.exists(path_join(CONSTANTS_DB_FOLDER, CONSTANTS_SQLITE_FILE))
+                              or constants_memmap_exists())
 except:
     USE_CONSTANTS_DATABASE = False
 
@@ -231,17 +1590,142 @@ CONSTANT_DATABASE_COLUMNS = ['index', 'MW', 'Tt', 'Tm', 'Tb', 'Tc', 'Pt', 'Pc',
 
 
 CONSTANT_DATABASE_NAME_TO_IDX = {k: i for i, k in enumerate(CONSTANT_DATABASE_COLUMNS)}
-CONSTANTS_CURSOR = None
-    
-DATABASE_CONSTANTS_CACHE = {}
+# 'memmap' or 'sqlite' once the database has been opened
+CONSTANTS_BACKEND_ACTIVE = None
+# Errors which mean the database is unusable; anything else propagates.
+# sqlite3.Error is added when the sqlite backend is opened.
+CONSTANTS_DB_ERRORS = (OSError, ValueError, ImportError)
+CONSTANTS_DB_LAST_ERROR = None
+# Sorted int64 CAS numbers and the matching float64 rows of
+# CONSTANT_DATABASE_COLUMNS[1:], both memory-mapped read-only
+CONSTANTS_CAS_ARRAY = None
+CONSTANTS_MATRIX = None
+
+def write_constants_memmap(CASs, data, folder=None):
+    '''Write the memory-mapped constants store. `CASs` are integer CAS numbers
+    and `data` has one row per CAS with the columns of
+    `CONSTANT_DATABASE_COLUMNS` after the index, NaN where missing. The rows
+    are sorted by CAS so lookups can use a binary search.
+    '''
+    if folder is None:
+        folder = CONSTANTS_DB_FOLDER
+    CASs = np.asarray(CASs, dtype=np.int64)
+    data = np.asarray(data, dtype=np.float64)
+    if data.shape != (len(CASs), len(CONSTANT_DATABASE_COLUMNS) - 1):
+        raise ValueError("Expected data of shape %s, got %s" %(
+                (len(CASs), len(CONSTANT_DATABASE_COLUMNS) - 1), data.shape))
+    order = np.argsort(CASs, kind='stable')
+    CASs, data = CASs[order], np.ascontiguousarray(data[order])
+    if len(CASs) > 1 and not (CASs[1:] != CASs[:-1]).all():
+        raise ValueError("Duplicate CAS numbers in constants store")
+    os.makedirs(folder, exist_ok=True)
+    paths = []
+    for name, arr in ((CONSTANTS_MEMMAP_CAS_FILE, CASs), (CONSTANTS_MEMMAP_DATA_FILE, data)):
+        path = path_join(folder, name)
+        tmp = path + '.%d.tmp' %(os.getpid())
+        with open(tmp, 'wb') as f:
+            np.save(f, arr)
+        os.replace(tmp, path)
+        paths.append(path)
+    return paths
+
+def init_constants_memmap(folder=None):
+    global CONSTANTS_CAS_ARRAY, CONSTANTS_MATRIX
+    if folder is None:
+        folder = CONSTANTS_DB_FOLDER
+    CASs = np.load(path_join(folder, CONSTANTS_MEMMAP_CAS_FILE), mmap_mode='r')
+    data = np.load(path_join(folder, CONSTANTS_MEMMAP_DATA_FILE), mmap_mode='r')
+    if data.shape != (len(CASs), len(CONSTANT_DATABASE_COLUMNS) - 1):
+        raise ValueError("Constants store does not match CONSTANT_DATABASE_COLUMNS")
+    CONSTANTS_CAS_ARRAY, CONSTANTS_MATRIX = CASs, data
+
+def memmap_constant_lookup(CASi, prop):
+    prop_idx = CONSTANT_DATABASE_NAME_TO_IDX[prop] - 1
+    CASs = CONSTANTS_CAS_ARRAY
+    i = int(CASs.searchsorted(CASi))
+    if i == len(CASs) or CASs[i] != CASi:
+        return None, False
+    value = float(CONSTANTS_MATRIX[i, prop_idx])
+    return (None if isnan(value) else value), True
+
+# Rows fetched from the sqlite backend, keyed by integer CAS; None is cached
+# for compounds not in the database. The memmap backend does not need it.
+try:
+    CONSTANTS_CACHE_SIZE = int(os.environ.get('CHEDL_CONSTANTS_CACHE_SIZE', 20000))
+except ValueError:
+    CONSTANTS_CACHE_SIZE = 20000
+DATABASE_CONSTANTS_CACHE = LRUCache(CONSTANTS_CACHE_SIZE)
+_cache_miss = object()
+
+# Each thread gets its own read-only sqlite connection; a new process after
+# a fork, or a call to `close_constants_db`, makes them be reopened
+_constants_local = threading.local()
+_constants_lock = threading.Lock()
+_constants_connections = []
+_constants_generation = 0
+_constants_pid = os.getpid()
+
+def check_constants_fork():
+    '''Drop the sqlite connections and locks inherited from a parent process;
+    they must not be used in the child.'''
+    global _constants_pid, _constants_lock, _constants_connections
+    pid = os.getpid()
+    if pid != _constants_pid:
+        _constants_pid = pid
+        _constants_lock = threading.Lock()
+        _constants_connections = []
+        DATABASE_CONSTANTS_CACHE.lock = threading.RLock()
+
+def constants_db_uri(path):
+    from urllib.request import pathname2url
+    return 'file:%s?mode=ro' %(pathname2url(os.path.abspath(path)))
+
+def get_constants_cursor():
+    '''Return the sqlite cursor of the calling thread, opening a read-only
+    connection the first time it is needed by that thread or process.'''
+    local = _constants_local
+    if getattr(local, 'generation', None) == _constants_generation and local.pid == os.getpid():
+        return local.cursor
+    check_constants_fork()
+    import sqlite3
+    conn = sqlite3.connect(constants_db_uri(path_join(CONSTANTS_DB_FOLDER, CONSTANTS_SQLITE_FILE)),
+                           uri=True, check_same_thread=False)
+    with _constants_lock:
+        _constants_connections.append(conn)
+    local.cursor = conn.cursor()
+    local.generation, local.pid = _constants_generation, os.getpid()
+    return local.cursor
+
+def fetch_constant_row(CASi):
+    cursor = get_constants_cursor()
+    cursor.execute("SELECT * FROM constants WHERE `index`=?", (str(CASi),))
+    return cursor.fetchone()
+
+# Kept below SQLite's default limit of 999 bound parameters per statement
+CONSTANTS_PREFETCH_CHUNK = 900
+
+def fetch_constant_rows(CASis):
+    '''Fetch the rows of many integer CAS numbers with chunked `IN` queries.
+    Returns a dictionary of CAS to row, with None for those not present.'''
+    cursor = get_constants_cursor()
+    CASis = list(CASis)
+    rows = dict.fromkeys(CASis)
+    chunk = CONSTANTS_PREFETCH_CHUNK
+    for start in range(0, len(CASis), chunk):
+        part = CASis[start:start+chunk]
+        cursor.execute("SELECT * FROM constants WHERE `index` IN (%s)" %(','.join('?'*len(part))), part)
+        for row in cursor.fetchall():
+            rows[int(row[0])] = row
+    return rows
+
 def cached_constant_lookup(CASi, prop):
-    if CONSTANTS_CURSOR is None: init_constants_db()
-    if CASi in DATABASE_CONSTANTS_CACHE:
-        result = DATABASE_CONSTANTS_CACHE[CASi]
-    else:
+    if CONSTANTS_BACKEND_ACTIVE is None: init_constants_db()
+    if CONSTANTS_CAS_ARRAY is not None:
+        return memmap_constant_lookup(CASi, prop)
+    result = DATABASE_CONSTANTS_CACHE.get(CASi, _cache_miss)
+    if result is _cache_miss:
         # Fetch and store the whole row
-        CONSTANTS_CURSOR.execute("SELECT * FROM constants WHERE `index`=?", (str(CASi),))
-        result = CONSTANTS_CURSOR.fetchone()
+        result = fetch_constant_row(CASi)
         DATABASE_CONSTANTS_CACHE[CASi] = result
     if result is None:
         # Result the value, and whether the compound was in the index
@@ -250,11 +1734,94 @@ def cached_constant_lookup(CASi, prop):
         prop_idx = CONSTANT_DATABASE_NAME_TO_IDX[prop]
         return result[prop_idx], True
 
+def constants_cache_stats():
+    '''Return the size, limit, hits, misses, evictions and hit rate of the
+    cache of rows read from the sqlite constants database.'''
+    return DATABASE_CONSTANTS_CACHE.stats()
+
+def set_constants_cache_size(maxsize):
+    '''Change the maximum number of rows kept from the sqlite constants
+    database; None or a value <= 0 removes the limit.'''
+    global CONSTANTS_CACHE_SIZE
+    CONSTANTS_CACHE_SIZE = maxsize
+    DATABASE_CONSTANTS_CACHE.resize(maxsize)
+
+def prefetch_constants(CASs):
+    '''Read the rows of the given CAS numbers from the sqlite constants
+    database into the cache with a few batched queries, instead of one query
+    per chemical on first use. Does nothing for the memory-mapped store,
+    which needs no cache. Returns the number of rows read.'''
+    if not USE_CONSTANTS_DATABASE:
+        return 0
+    try:
+        if CONSTANTS_BACKEND_ACTIVE is None: init_constants_db()
+        if CONSTANTS_CAS_ARRAY is not None:
+            return 0
+        need = set()
+        for CASi in CASs:
+            if type(CASi) is str:
+                try:
+                    CASi = CAS_to_int(CASi)
+                except:
+                    continue
+            if CASi >= 0 and CASi not in DATABASE_CONSTANTS_CACHE:
+                need.add(CASi)
+        rows = fetch_constant_rows(sorted(need))
+        for CASi, row in rows.items():
+            DATABASE_CONSTANTS_CACHE[CASi] = row
+        return len(rows)
+    except CONSTANTS_DB_ERRORS as e:
+        disable_constants_db(e)
+        return 0
+
+def warm_constants_cache(CASs):
+    '''Read the rows of the given CAS numbers from the sqlite constants
+    database into the cache ahead of time; see :obj:`prefetch_constants`.'''
+    return prefetch_constants(CASs)
+
 def init_constants_db():
-    global CONSTANTS_CURSOR
-    import sqlite3
-    conn = sqlite3.connect(path_join(source_path, 'Misc', 'default.sqlite'))
-    CONSTANTS_CURSOR = conn.cursor()
+    global CONSTANTS_BACKEND_ACTIVE, CONSTANTS_DB_ERRORS
+    check_constants_fork()
+    with _constants_lock:
+        if CONSTANTS_BACKEND_ACTIVE is not None:
+            return
+        backend = CONSTANTS_DATABASE_BACKEND
+        if backend is None:
+            backend = 'memmap' if constants_memmap_exists() else 'sqlite'
+        if backend == 'memmap':
+            init_constants_memmap()
+            CONSTANTS_BACKEND_ACTIVE = backend
+            return
+        elif backend != 'sqlite':
+            raise ValueError("Unknown constants database backend %s" %(backend))
+        import sqlite3
+        CONSTANTS_DB_ERRORS = (OSError, ValueError, ImportError, sqlite3.Error)
+    # Opening the connection checks the database exists and is readable
+    get_constants_cursor()
+    CONSTANTS_BACKEND_ACTIVE = backend
+
+def close_constants_db():
+    '''Close the connections of every thread and forget the open constants
+    database so the next lookup reopens it, for example after changing
+    `CONSTANTS_DATABASE_BACKEND`.
+    '''
+    global CONSTANTS_BACKEND_ACTIVE, CONSTANTS_CAS_ARRAY, CONSTANTS_MATRIX, _constants_generation
+    check_constants_fork()
+    with _constants_lock:
+        _constants_generation += 1
+        for conn in _constants_connections:
+            conn.close()
+        del _constants_connections[:]
+        CONSTANTS_BACKEND_ACTIVE = CONSTANTS_CAS_ARRAY = CONSTANTS_MATRIX = None
+    DATABASE_CONSTANTS_CACHE.clear()
+
+def disable_constants_db(error=None):
+    # Prevent database lookup after first failure considering it should work everytime.
+    # It will possibly fail for users every time if database has not been created.
+    # The error is kept in CONSTANTS_DB_LAST_ERROR for diagnosis.
+    global USE_CONSTANTS_DATABASE, CONSTANTS_DB_LAST_ERROR
+    USE_CONSTANTS_DATABASE = False
+    CONSTANTS_DB_LAST_ERROR = error
 
 def database_constant_lookup(CASi, prop):
     if type(CASi) is str: # Assume it must be either an int or string
@@ -264,11 +1831,58 @@ def database_constant_lookup(CASi, prop):
             return None, False
     try:
         return cached_constant_lookup(CASi, prop)
-    except (TypeError, KeyError) as e:
-        raise e
-    except Exception:
-        # Prevent database lookup after first failure considering it should work everytime.
-        # It will possibly fail for users every time if database has not been created.
-        global USE_CONSTANTS_DATABASE
-        USE_CONSTANTS_DATABASE = False
+    except CONSTANTS_DB_ERRORS as e:
+        disable_constants_db(e)
         return None, False
+
+def database_constant_lookup_many(CASis, prop):
+    '''Vectorized `database_constant_lookup` over an array of integer CAS
+    numbers, negative for invalid ones. Returns a float64 array of values,
+    NaN where missing, and a boolean array of whether each compound was in
+    the database.
+    '''
+    CASis = np.asarray(CASis, dtype=np.int64)
+    N = len(CASis)
+    values = np.full(N, nan)
+    found = np.zeros(N, dtype=bool)
+    try:
+        if CONSTANTS_BACKEND_ACTIVE is None: init_constants_db()
+        if CONSTANTS_CAS_ARRAY is not None:
+            prop_idx = CONSTANT_DATABASE_NAME_TO_IDX[prop] - 1
+            CASs = CONSTANTS_CAS_ARRAY
+            if not len(CASs):
+                return values, found
+            positions = CASs.searchsorted(CASis)
+            np.minimum(positions, len(CASs) - 1, out=positions)
+            found = CASs[positions] == CASis
+            values[found] = CONSTANTS_MATRIX[positions[found], prop_idx]
+        else:
+            prop_idx = CONSTANT_DATABASE_NAME_TO_IDX[prop]
+            cache = DATABASE_CONSTANTS_CACHE
+            rows, need = {}, []
+            for CASi in set(CASis.tolist()):
+                if CASi < 0:
+                    continue
+                row = cache.get(CASi, _cache_miss)
+                if row is _cache_miss:
+                    need.append(CASi)
+                else:
+                    rows[CASi] = row
+            if need:
+                # Kept locally as well, the cache may be smaller than the batch
+                fetched = fetch_constant_rows(sorted(need))
+                for CASi, row in fetched.items():
+                    cache[CASi] = row
+                rows.update(fetched)
+            for i, CASi in enumerate(CASis.tolist()):
+                row = rows.get(CASi)
+                if row is not None:
+                    found[i] = True
+                    value = row[prop_idx]
+                    if value is not None:
+                        values[i] = value
+    except CONSTANTS_DB_ERRORS as e:
+        disable_constants_db(e)
+        found[:] = False
+        values[:] = nan
+    return values, found
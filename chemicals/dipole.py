@@ -32,11 +32,12 @@ Lookup Functions
 ----------------
 .. autofunction:: chemicals.dipole.dipole_moment
 .. autofunction:: chemicals.dipole.dipole_moment_methods
+.. autofunction:: chemicals.dipole.dipole_moment_many
 .. autodata:: chemicals.dipole.dipole_moment_all_methods
 
 """
 __all__ = ['dipole_moment',
-           'dipole_moment_methods',
+           'dipole_moment_methods', 'dipole_moment_many',
            'dipole_moment_all_methods']
 
 from chemicals import data_reader as dr
@@ -44,9 +45,10 @@ from chemicals.data_reader import (data_source, database_constant_lookup,
                                    retrieve_any_from_df_dict,
                                    list_available_methods_from_df_dict,
                                    register_df_source,
-                                   retrieve_from_df_dict)
+                                   retrieve_from_df_dict,
+                                   retrieve_many_from_df_dict)
 from chemicals.miscdata import PSI4_2022A
-from chemicals.utils import (PY37, can_load_data, mark_numba_incompatible,
+from chemicals.utils import (PY37, can_load_data, single_flight_loader, mark_numba_incompatible,
                              os_path_join, source_path)
 
 # %% Register data sources and lazy load them
@@ -65,8 +67,9 @@ register_df_source(folder, 'psi4_dipoles.tsv')
 
 _dipole_data_loaded = False
 @mark_numba_incompatible
+@single_flight_loader
 def _load_dipole_data():
-    global dipole_data_CCDB, dipole_data_Muller, dipole_data_Poling, dipole_sources
+    global _dipole_data_loaded, dipole_data_CCDB, dipole_data_Muller, dipole_data_Poling, dipole_sources
     dipole_data_CCDB = data_source('cccbdb.nist.gov Dipoles.csv')
     dipole_data_Muller = data_source('Muller Supporting Info Dipoles.csv')
     dipole_data_Poling = data_source('Poling Dipole.csv')
@@ -77,6 +80,7 @@ def _load_dipole_data():
         POLING: dipole_data_Poling,
         PSI4_2022A: dipole_data_psi4_2022a,
     }
+    _dipole_data_loaded = True
 
 if PY37:
     def __getattr__(name):
@@ -195,3 +199,40 @@ def dipole_moment(CASRN, method=None):
         return retrieve_from_df_dict(dipole_sources, CASRN, 'dipole_moment', method)
     else:
         return retrieve_any_from_df_dict(dipole_sources, CASRN, 'dipole_moment')
+
+@mark_numba_incompatible
+def dipole_moment_many(CASRNs, method=None):
+    r'''Retrieve the dipole moments of many chemicals, preferring the
+    experimental values of CCCBDB over the Muller and Poling compilations
+    and the values calculated with psi4, as :obj:`dipole_moment` does.
+
+    Parameters
+    ----------
+    CASRNs : list[str]
+        CASRNs, [-]
+
+    Returns
+    -------
+    dipoles : ndarray
+        Dipole moments, NaN where not available, [debye]
+    methods : ndarray
+        Method which provided each value, None where not available, [-]
+
+    Other Parameters
+    ----------------
+    method : string, optional
+        A single method to use for all of the chemicals; see :obj:`dipole_moment`.
+
+    Examples
+    --------
+    >>> dipoles, methods = dipole_moment_many(['64-17-5', '7732-18-5'])
+    >>> dipoles.tolist(), methods.tolist()
+    ([1.44, 1.85], ['CCCBDB', 'CCCBDB'])
+
+    See Also
+    --------
+    dipole_moment
+    chemicals.data_reader.retrieve_many_from_df_dict
+    '''
+    if not _dipole_data_loaded: _load_dipole_data()
+    return retrieve_many_from_df_dict(dipole_sources, CASRNs, 'dipole_moment', method)
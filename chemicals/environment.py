@@ -47,21 +47,22 @@ Octanol-Water Partition Coefficient
 -----------------------------------
 .. autofunction:: chemicals.environment.logP
 .. autofunction:: chemicals.environment.logP_methods
+.. autofunction:: chemicals.environment.logP_many
 .. autodata:: chemicals.environment.logP_all_methods
 
 """
 
 __all__ = ['GWP', 'ODP', 'logP',
            'GWP_all_methods', 'ODP_all_methods', 'logP_all_methods',
-           'GWP_methods', 'ODP_methods', 'logP_methods']
+           'GWP_methods', 'ODP_methods', 'logP_methods', 'logP_many']
 from chemicals import data_reader as dr
 from chemicals import miscdata
 from chemicals.data_reader import (
     data_source, list_available_methods_from_df, database_constant_lookup,
     list_available_methods_from_df_dict, register_df_source,
     retrieve_any_from_df, retrieve_any_from_df_dict, retrieve_from_df,
-    retrieve_from_df_dict)
-from chemicals.utils import (PY37, can_load_data, mark_numba_incompatible,
+    retrieve_from_df_dict, retrieve_many_from_df_dict)
+from chemicals.utils import (PY37, can_load_data, single_flight_loader, mark_numba_incompatible,
                              os_path_join, source_path)
 
 ### Register data sources and lazy load them
@@ -89,6 +90,7 @@ GWP_all_methods = (IPCC_2014_100YR_GWP, IPCC_2014_20YR_GWP,
 
 _GWP_ODP_data_loaded = False
 @mark_numba_incompatible
+@single_flight_loader
 def _load_GWP_ODP_data():
     global _GWP_ODP_data_loaded, IPCC_2007_GWPs, IPCC_2014_GWPs, ODP_data
     global _IPCC_2007_GWP_keys_by_method, _IPCC_2014_GWP_keys_by_method, _ODP_keys_by_method
@@ -96,7 +98,6 @@ def _load_GWP_ODP_data():
     IPCC_2014_GWPs = data_source('Official Global Warming Potentials 2014.tsv')
 
     ODP_data = data_source('Ozone Depletion Potentials.tsv')
-    _GWP_ODP_data_loaded = True
     _IPCC_2007_GWP_keys_by_method = {
         IPCC_2007_20YR_GWP: '20yr GWP',
         IPCC_2007_100YR_GWP : '100yr GWP',
@@ -118,19 +119,21 @@ def _load_GWP_ODP_data():
         'ODP2 string': 'ODP2',
         'ODP1 string': 'ODP1',
     }
+    _GWP_ODP_data_loaded = True
 
 _logP_data_loaded = False
 @mark_numba_incompatible
+@single_flight_loader
 def _load_logP_data():
     global _logP_data_loaded, logP_data_CRC, logP_data_Syrres, logP_sources
     logP_data_CRC = data_source('CRC logP table.tsv')
     logP_data_Syrres = data_source('Syrres logP data.csv.gz')
-    _logP_data_loaded = True
     logP_sources = {
         'CRC': logP_data_CRC,
         'SYRRES': logP_data_Syrres,
         miscdata.WIKIDATA: miscdata.wikidata_data
     }
+    _logP_data_loaded = True
 
 if PY37:
     def __getattr__(name):
@@ -459,3 +462,40 @@ def logP(CASRN, method=None):
         return retrieve_from_df_dict(logP_sources, CASRN, 'logP', method)
     else:
         return retrieve_any_from_df_dict(logP_sources, CASRN, 'logP')
+
+@mark_numba_incompatible
+def logP_many(CASRNs, method=None):
+    r'''Retrieve the octanol-water partition coefficients of many chemicals
+    from the CRC Handbook, the Syracuse Research Corporation database and
+    Wikidata, in that order.
+
+    Parameters
+    ----------
+    CASRNs : list[str]
+        CASRNs, [-]
+
+    Returns
+    -------
+    logPs : ndarray
+        Octanol-water partition coefficients, NaN where not available, [-]
+    methods : ndarray
+        Method which provided each value, None where not available, [-]
+
+    Other Parameters
+    ----------------
+    method : string, optional
+        A single method to use for all of the chemicals; see :obj:`logP`.
+
+    Examples
+    --------
+    >>> logPs, methods = logP_many(['64-17-5', '7732-18-5'])
+    >>> logPs.tolist(), methods.tolist()
+    ([-0.3, -1.38], ['CRC', 'SYRRES'])
+
+    See Also
+    --------
+    logP
+    chemicals.data_reader.retrieve_many_from_df_dict
+    '''
+    if not _logP_data_loaded: _load_logP_data()
+    return retrieve_many_from_df_dict(logP_sources, CASRNs, 'logP', method)
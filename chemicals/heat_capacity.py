@@ -144,6 +144,15 @@ attribute of this module.
     Theoretically calculated chatacteristic temperatures from vibrational
     frequencies using psi4, adjusted using a recommended coefficient
 
+.. note::
+
+    `Cp_dict_JANAF_gas`, `Cp_dict_JANAF_liquid`, `Cp_dict_JANAF_solid`, the
+    psi4 characteristic temperature dictionaries and the `WebBook_Shomate`
+    dictionaries are :obj:`~chemicals.data_reader.PackedArrayDict` mappings
+    which convert each entry when it is first looked up. They support item
+    assignment, deletion, `update` and `copy` (which returns a `dict`), but
+    are not instances of `dict`.
+
 
 .. [1] Kabo, G. J., and G. N. Roganov. Thermodynamics of Organic Compounds
     in the Gas State, Volume II: V. 2. College Station, Tex: CRC Press, 1994.
@@ -211,8 +220,9 @@ from fluids.numerics import brenth
 from fluids.numerics import numpy as np
 from fluids.numerics import polylog2, secant
 
-from chemicals.data_reader import data_source, register_df_source
-from chemicals.utils import (PY37, can_load_data, exp, log,
+from chemicals.data_reader import (PackedArrayDict, PackedArrays, data_source, open_data_file,
+                                   register_data_file, register_df_source)
+from chemicals.utils import (PY37, can_load_data, single_flight_loader, exp, log,
                              mark_numba_uncacheable, os_path_join,
                              source_path, to_num)
 
@@ -760,8 +770,43 @@ register_df_source(folder, 'TRC Thermodynamics of Organic Compounds in the Gas S
              'I': float, 'J': float, 'Hfg': float}})
 
 register_df_source(folder, 'CRC Standard Thermodynamic Properties of Chemical Substances.tsv')
+register_data_file(folder, 'Zabransky.tsv')
+register_data_file(folder, 'Perrys Table 2-151.json')
+register_data_file(folder, 'psi4_unadjusted_characteristic_temperatures.json')
+register_data_file(folder, 'psi4_adjusted_characteristic_temperatures.json')
+register_data_file(folder, 'JANAF_1998_liq_Cp.json')
+register_data_file(folder, 'JANAF_1998_gas_Cp.json')
+register_data_file(folder, 'JANAF_1998_solid_Cp.json')
+register_data_file(folder, 'webbook_shomate_coefficients.json')
+
+def _pack_thetas(thetas):
+    return [[[theta] for theta in thetas]]
+
+def _unpack_thetas(segments):
+    return segments[0][:, 0].tolist()
+
+def _pack_JANAF(values):
+    Ts, Cps = values
+    return [list(zip(Ts, Cps))]
+
+def _unpack_JANAF(segments):
+    rows = segments[0]
+    return [rows[:, 0].tolist(), rows[:, 1].tolist()]
+
+def _pack_shomate(phases):
+    return [[] if ranges is None else ranges for ranges in phases]
+
+def _unpack_shomate(segments):
+    return [rows.tolist() if len(rows) else None for rows in segments]
+
+def _shomate_model(segments):
+    ranges = [ShomateRange(tuple(row[2:]), row[0], row[1]) for row in segments[0].tolist()]
+    if len(ranges) == 1:
+        return ranges[0]
+    return PiecewiseHeatCapacity(ranges)
 
 _Cp_data_loaded = False
+@single_flight_loader
 def _load_Cp_data():
     global Cp_data_Poling, Cp_values_Poling, TRC_gas_data, TRC_gas_values
     global CRC_standard_data, Cp_dict_PerryI
@@ -812,7 +857,7 @@ def _load_Cp_data():
         ZABRANSKY_SPLINE_SAT: zabransky_dict_sat_s,
         ZABRANSKY_QUASIPOLYNOMIAL_SAT: zabransky_dict_sat_p
     }
-    with open(os.path.join(folder, 'Zabransky.tsv'), encoding='utf-8') as f:
+    with open_data_file(os.path.join(folder, 'Zabransky.tsv'), encoding='utf-8') as f:
         next(f)
         for line in f:
             values = to_num(line.strip('\n').split('\t'))
@@ -874,38 +919,35 @@ def _load_Cp_data():
     Warning: 11 duplicated chemicals are present and currently clobbered.
     '''
     import json
-    with open(os.path.join(folder, 'Perrys Table 2-151.json')) as f:
+    with open_data_file(os.path.join(folder, 'Perrys Table 2-151.json')) as f:
         Cp_dict_PerryI = json.loads(f.read())
 
-    with open(os.path.join(folder, 'psi4_unadjusted_characteristic_temperatures.json')) as f:
-        Cp_dict_characteristic_temperatures_psi4_2022a = json.loads(f.read())
-
-    with open(os.path.join(folder, 'psi4_adjusted_characteristic_temperatures.json')) as f:
-        Cp_dict_characteristic_temperatures_adjusted_psi4_2022a = json.loads(f.read())
-
-    with open(os.path.join(folder, 'JANAF_1998_liq_Cp.json')) as f:
-        Cp_dict_JANAF_liquid = json.loads(f.read())
-
-    with open(os.path.join(folder, 'JANAF_1998_gas_Cp.json')) as f:
-        Cp_dict_JANAF_gas = json.loads(f.read())
-
-    with open(os.path.join(folder, 'JANAF_1998_solid_Cp.json')) as f:
-        Cp_dict_JANAF_solid = json.loads(f.read())
-
-    with open(os.path.join(folder, 'webbook_shomate_coefficients.json')) as f:
-        WebBook_Shomate_coefficients = json.loads(f.read())
-        WebBook_Shomate_solids, WebBook_Shomate_liquids, WebBook_Shomate_gases = {}, {}, {}
-        for i, d in zip(range(3), [WebBook_Shomate_solids, WebBook_Shomate_liquids, WebBook_Shomate_gases]):
-            for CAS, phase_values in WebBook_Shomate_coefficients.items():
-                Cp_dat = phase_values[i]
-                if Cp_dat is not None:
-                    if len(Cp_dat) == 1:
-                        d[CAS] = ShomateRange(tuple(Cp_dat[0][2:]), Cp_dat[0][0], Cp_dat[0][1])
-                    else:
-                        phase_models = [ShomateRange(tuple(Cp_dat[i][2:]), Cp_dat[i][0], Cp_dat[i][1]) for i in range(len(Cp_dat))]
-                        d[CAS] = PiecewiseHeatCapacity(phase_models)
-            
-        
+    # The per-chemical arrays are read on first access, and only the
+    # chemicals looked up are converted to lists or heat capacity objects
+    psi4_unadjusted = PackedArrays(os.path.join(folder, 'psi4_unadjusted_characteristic_temperatures.json'),
+                                   _pack_thetas, width=1)
+    Cp_dict_characteristic_temperatures_psi4_2022a = PackedArrayDict(psi4_unadjusted, _unpack_thetas)
+
+    psi4_adjusted = PackedArrays(os.path.join(folder, 'psi4_adjusted_characteristic_temperatures.json'),
+                                 _pack_thetas, width=1)
+    Cp_dict_characteristic_temperatures_adjusted_psi4_2022a = PackedArrayDict(psi4_adjusted, _unpack_thetas)
+
+    JANAF_liquid = PackedArrays(os.path.join(folder, 'JANAF_1998_liq_Cp.json'), _pack_JANAF, width=2)
+    Cp_dict_JANAF_liquid = PackedArrayDict(JANAF_liquid, _unpack_JANAF)
+
+    JANAF_gas = PackedArrays(os.path.join(folder, 'JANAF_1998_gas_Cp.json'), _pack_JANAF, width=2)
+    Cp_dict_JANAF_gas = PackedArrayDict(JANAF_gas, _unpack_JANAF)
+
+    JANAF_solid = PackedArrays(os.path.join(folder, 'JANAF_1998_solid_Cp.json'), _pack_JANAF, width=2)
+    Cp_dict_JANAF_solid = PackedArrayDict(JANAF_solid, _unpack_JANAF)
+
+    shomate = PackedArrays(os.path.join(folder, 'webbook_shomate_coefficients.json'), _pack_shomate,
+                           width=7, groups=3)
+    WebBook_Shomate_coefficients = PackedArrayDict(shomate, _unpack_shomate)
+    WebBook_Shomate_solids = PackedArrayDict(shomate, _shomate_model, group=0)
+    WebBook_Shomate_liquids = PackedArrayDict(shomate, _shomate_model, group=1)
+    WebBook_Shomate_gases = PackedArrayDict(shomate, _shomate_model, group=2)
+
     _Cp_data_loaded = True
 
 if PY37:
@@ -916,7 +958,9 @@ if PY37:
                     'zabransky_dict_iso_p', 'type_to_zabransky_dict', 'zabransky_dicts',
                     'WebBook_Shomate_liquids', 'WebBook_Shomate_gases', 'WebBook_Shomate_solids',
                     'WebBook_Shomate_coefficients',
-                    'Cp_dict_JANAF_liquid', 'Cp_dict_JANAF_gas', 'Cp_dict_JANAF_solid'):
+                    'Cp_dict_JANAF_liquid', 'Cp_dict_JANAF_gas', 'Cp_dict_JANAF_solid',
+                    'Cp_dict_characteristic_temperatures_adjusted_psi4_2022a',
+                    'Cp_dict_characteristic_temperatures_psi4_2022a'):
             _load_Cp_data()
             return globals()[name]
         raise AttributeError("module %s has no attribute %s" %(__name__, name))
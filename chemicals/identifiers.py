@@ -34,6 +34,8 @@ Search Functions
 .. autofunction:: chemicals.identifiers.CAS_from_any
 .. autofunction:: chemicals.identifiers.MW
 .. autofunction:: chemicals.identifiers.search_chemical
+.. autofunction:: chemicals.identifiers.search_chemicals
+.. autofunction:: chemicals.identifiers.warm_search_cache
 .. autofunction:: chemicals.identifiers.IDs_to_CASs
 
 CAS Number Utilities
@@ -68,18 +70,40 @@ from __future__ import division
 
 __all__ = ['check_CAS', 'CAS_from_any', 'MW', 'search_chemical',
            'mixture_from_any', 'cryogenics', 'inerts', 'dippr_compounds', 'IDs_to_CASs',
-           'get_pubchem_db', 'CAS_to_int', 'sorted_CAS_key', 'int_to_CAS']
+           'get_pubchem_db', 'CAS_to_int', 'sorted_CAS_key', 'int_to_CAS',
+           'search_chemicals', 'warm_search_cache']
 
 import os
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from collections.abc import Mapping
+from heapq import nlargest, nsmallest
 from io import open
+from threading import RLock
+from unicodedata import normalize
+from zlib import crc32
 
 from chemicals.elements import (charge_from_formula, homonuclear_elements_CASs_set,
                                 periodic_table, serialize_formula)
-from chemicals.utils import (PY37, can_load_data, mark_numba_incompatible,
+from chemicals.utils import (PY37, LRUCache, can_load_data, mark_numba_incompatible,
                              os_path_join, source_path, to_num)
 
 folder = os_path_join(source_path, 'Identifiers')
 
+'''With columnar metadata, the chemicals of the identifier databases are
+stored in compact arrays - the CAS numbers, pubchem ids and molecular weights
+as arrays of numbers, and all of their text as one UTF-8 blob with offsets -
+and a :obj:`ChemicalMetadata` is only a view of one row, created when it is
+found. This is enabled by `CHEDL_LOW_MEMORY`, or on its own by setting
+`CHEDL_COLUMNAR_METADATA` to 1.
+'''
+try:
+    COLUMNAR_METADATA = (bool(int(os.environ.get('CHEDL_LOW_MEMORY', '0')))
+                         or bool(int(os.environ.get('CHEDL_COLUMNAR_METADATA', '0'))))
+except:
+    COLUMNAR_METADATA = False
+
 @mark_numba_incompatible
 def check_CAS(CASRN):
     """Checks if a CAS number is valid. Returns False if the parser cannot parse
@@ -289,14 +313,724 @@ class ChemicalMetadata(object):
         self.synonyms = synonyms
 
 
+class MetadataColumns(object):
+    """Columnar storage of the chemicals of a metadata file. The CAS numbers
+    and pubchem ids are stored as arrays of 64-bit integers and the molecular
+    weights as an array of doubles; the text fields of every row, in the
+    order of `text_fields`, are concatenated into one UTF-8 blob, with the
+    position of each in `offsets`. The synonyms of a row are stored as one
+    field separated by tabs.
+    """
+    __slots__ = ('count', 'CASs', 'pubchemids', 'MWs', 'text', 'offsets')
+    text_fields = ('formula', 'smiles', 'InChI', 'InChI_key', 'iupac_name',
+                   'common_name', 'synonyms')
+
+    def __init__(self, count, CASs, pubchemids, MWs, text, offsets):
+        self.count = count
+        self.CASs = CASs
+        self.pubchemids = pubchemids
+        self.MWs = MWs
+        self.text = text
+        self.offsets = offsets
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Create the columns from rows as returned by
+        :obj:`parse_metadata_file`.
+        """
+        pieces = []
+        offsets = array('q', [0])
+        position = 0
+        for (pubchemid, CAS, formula, MW, smiles, InChI, InChI_key, iupac_name,
+             common_name, synonyms) in rows:
+            for value in (formula, smiles, InChI, InChI_key, iupac_name,
+                          common_name, '\t'.join(synonyms)):
+                value = value.encode('utf-8')
+                pieces.append(value)
+                position += len(value)
+                offsets.append(position)
+        return cls(len(rows), array('q', [row[1] for row in rows]),
+                   array('q', [row[0] for row in rows]),
+                   array('d', [row[3] for row in rows]), b''.join(pieces), offsets)
+
+    def serialize(self):
+        import marshal
+        return marshal.dumps((self.count, self.CASs.tobytes(), self.pubchemids.tobytes(),
+                              self.MWs.tobytes(), self.text, self.offsets.tobytes()))
+
+    @classmethod
+    def deserialize(cls, data):
+        import marshal
+        count, CASs, pubchemids, MWs, text, offsets = marshal.loads(data)
+        return cls(count, array('q', CASs), array('q', pubchemids), array('d', MWs),
+                   text, array('q', offsets))
+
+    def field(self, row, i):
+        """Decode the text field `i` of row `row`."""
+        i += 7*row
+        offsets = self.offsets
+        return self.text[offsets[i]:offsets[i+1]].decode('utf-8')
+
+    def synonyms(self, row):
+        synonyms = self.field(row, 6)
+        return synonyms.split('\t') if synonyms else []
+
+    def row(self, row):
+        """Return the values of a row, in the order of the arguments of
+        :obj:`ChemicalMetadata`.
+        """
+        field = self.field
+        return (self.pubchemids[row], self.CASs[row], field(row, 0), self.MWs[row],
+                field(row, 1), field(row, 2), field(row, 3), field(row, 4),
+                field(row, 5), self.synonyms(row))
+
+    def __len__(self):
+        return self.count
+
+
+def _column_field(i):
+    return property(lambda self: self.columns.field(self.row, i))
+
+class ChemicalMetadataView(ChemicalMetadata):
+    """:obj:`ChemicalMetadata` of one row of a :obj:`MetadataColumns`; each
+    attribute is read from the columns when it is accessed, so only the row
+    number is stored.
+    """
+    __slots__ = ('columns', 'row')
+
+    def __init__(self, columns, row):
+        self.columns = columns
+        self.row = row
+
+    pubchemid = property(lambda self: self.columns.pubchemids[self.row])
+    CAS = property(lambda self: self.columns.CASs[self.row])
+    MW = property(lambda self: self.columns.MWs[self.row])
+    formula = _column_field(0)
+    smiles = _column_field(1)
+    InChI = _column_field(2)
+    InChI_key = _column_field(3)
+    iupac_name = _column_field(4)
+    common_name = _column_field(5)
+    synonyms = property(lambda self: self.columns.synonyms(self.row))
+
+
+# Keys of the indexes of a ChemicalMetadataDB in a parsed metadata file
+METADATA_INDEX_KEYS = ('CAS', 'pubchem', 'smiles', 'InChI', 'InChI_key', 'name', 'formula')
+METADATA_INDEX_VERSION = 2
+
+class MetadataIndex(dict):
+    """Index of a :obj:`ChemicalMetadataDB`. The values are row numbers into
+    a :obj:`MetadataRows`; the :obj:`ChemicalMetadata` of a row is only
+    created when it is looked up.
+    """
+    __slots__ = ('store',)
+    def __init__(self, store):
+        self.store = store
+
+    def __getitem__(self, key):
+        value = dict.__getitem__(self, key)
+        if type(value) is int:
+            return self.store.materialize(value)
+        return value
+
+    def get(self, key, default=None):
+        value = dict.get(self, key, default)
+        if type(value) is int:
+            return self.store.materialize(value)
+        return value
+
+    def values(self):
+        return [self[key] for key in self]
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+    def row_items(self):
+        """Iterate over the keys of the index and their row numbers."""
+        return dict.items(self)
+
+    def set_rows(self, index):
+        self.clear()
+        self.update(index)
+
+class CompactIndex(Mapping):
+    """Index of a columnar :obj:`ChemicalMetadataDB`, holding no Python
+    object per key: the keys are sorted and stored as an array of integers,
+    or as one UTF-8 blob with offsets which is searched comparing bytes (the
+    same order as for `str`), along with an array of the row of each key.
+    Keys of any other type, such as the missing pubchem ids of some
+    elements, are kept in a dict.
+    """
+    __slots__ = ('store', 'int_keys', 'keys', 'offsets', 'rows', 'extra')
+    def __init__(self, store):
+        self.store = store
+        self.set_rows({})
+
+    def set_rows(self, index):
+        """Replace the contents of the index with `index`, a dict of key to
+        row number."""
+        int_keys = [k for k in index if type(k) is int]
+        text_keys = [k for k in index if type(k) is str]
+        self.int_keys = len(int_keys) >= len(text_keys)
+        keys = sorted(int_keys if self.int_keys else text_keys)
+        self.extra = {k: row for k, row in index.items()
+                      if type(k) is not (int if self.int_keys else str)}
+        self.rows = array('q', [index[k] for k in keys])
+        if self.int_keys:
+            self.keys = array('q', keys)
+            self.offsets = None
+        else:
+            encoded = [k.encode('utf-8') for k in keys]
+            self.offsets = offsets = array('q', [0])
+            position = 0
+            for k in encoded:
+                position += len(k)
+                offsets.append(position)
+            self.keys = b''.join(encoded)
+
+    def clear(self):
+        self.set_rows({})
+
+    def position(self, key):
+        """Return the position of `key` in the sorted keys, or -1."""
+        if self.int_keys:
+            if type(key) is not int:
+                return -1
+            keys = self.keys
+            i = bisect_left(keys, key)
+            return i if i < len(keys) and keys[i] == key else -1
+        if type(key) is not str:
+            return -1
+        key = key.encode('utf-8')
+        text, offsets = self.keys, self.offsets
+        low, high = 0, len(self.rows)
+        while low < high:
+            mid = (low + high) >> 1
+            if text[offsets[mid]:offsets[mid+1]] < key:
+                low = mid + 1
+            else:
+                high = mid
+        if low < len(self.rows) and text[offsets[low]:offsets[low+1]] == key:
+            return low
+        return -1
+
+    def key_at(self, i):
+        if self.int_keys:
+            return self.keys[i]
+        return self.keys[self.offsets[i]:self.offsets[i+1]].decode('utf-8')
+
+    def row_items(self):
+        """Iterate over the keys of the index and their row numbers."""
+        for i, row in enumerate(self.rows):
+            yield self.key_at(i), row
+        for item in self.extra.items():
+            yield item
+
+    def __getitem__(self, key):
+        i = self.position(key)
+        if i == -1:
+            try:
+                row = self.extra[key]
+            except TypeError:
+                raise KeyError(key)
+        else:
+            row = self.rows[i]
+        return self.store.materialize(row)
+
+    def __contains__(self, key):
+        try:
+            return self.position(key) != -1 or key in self.extra
+        except TypeError:
+            return False
+
+    def __iter__(self):
+        for i in range(len(self.rows)):
+            yield self.key_at(i)
+        for key in self.extra:
+            yield key
+
+    def __len__(self):
+        return len(self.rows) + len(self.extra)
+
+# Hyphens, dashes and minus signs, which are all removed from normalized names
+_name_dashes = dict.fromkeys([ord(c) for c in '-\u2010\u2011\u2012\u2013\u2014\u2015\u2212'])
+
+def normalize_name(name):
+    """Return the form of a chemical name used as the key of the normalized
+    name index of a :obj:`ChemicalMetadataDB`: unicode normalized (NFKC) and
+    casefolded, with all whitespace, hyphens and dashes removed. Other
+    punctuation is kept, as it distinguishes isomers.
+
+    Examples
+    --------
+    >>> normalize_name('1,1-Difluoro ethane')
+    '1,1difluoroethane'
+    """
+    try:
+        # str.isascii is only available from Python 3.7
+        name.encode('ascii')
+    except UnicodeEncodeError:
+        return ''.join(normalize('NFKC', name).casefold().translate(_name_dashes).split())
+    return ''.join(name.lower().replace('-', '').split())
+
+def normalized_name_rows(name_rows):
+    """Return a dict of the :obj:`normalize_name` form of names to row
+    numbers, from an iterable of (name, row) pairs. Where names of different
+    chemicals have the same normalized form, a name in lower case is
+    preferred, and then the chemical of the highest row.
+    """
+    # Lower case names take precedence, as they are what a search for a name
+    # in another case found before the normalized index existed
+    rows, lower = {}, {}
+    for name, row in name_rows:
+        key = normalize_name(name)
+        is_lower = name == name.lower()
+        if key not in rows or (is_lower, row) > (lower[key], rows[key]):
+            rows[key] = row
+            lower[key] = is_lower
+    return rows
+
+def name_trigrams(name):
+    """Return the set of trigrams of a :obj:`normalize_name` form of a name,
+    padded so its start and end count for more.
+
+    Examples
+    --------
+    >>> sorted(name_trigrams('co2'))
+    ['  c', ' co', 'co2', 'o2 ']
+    """
+    name = '  ' + name + ' '
+    return {name[i:i+3] for i in range(len(name) - 2)}
+
+class NameSearchIndex(object):
+    """Index of the :obj:`normalize_name` forms of the names of a
+    :obj:`ChemicalMetadataDB` for searches by the start of a name, from the
+    names sorted, and for names similar to a misspelled one, from an
+    inverted index of the positions of the names with each trigram. The
+    rows are those of `store`, the :obj:`MetadataRows` it was built from.
+    """
+    __slots__ = ('store', 'keys', 'rows', 'trigrams', 'counts')
+    def __init__(self, store, name_rows):
+        self.store = store
+        items = sorted(name_rows)
+        self.keys = [key for key, _ in items]
+        self.rows = array('q', [row for _, row in items])
+        self.counts = counts = array('i')
+        trigrams = {}
+        for i, key in enumerate(self.keys):
+            key_trigrams = name_trigrams(key)
+            counts.append(len(key_trigrams))
+            for trigram in key_trigrams:
+                try:
+                    trigrams[trigram].append(i)
+                except KeyError:
+                    trigrams[trigram] = array('i', [i])
+        self.trigrams = trigrams
+
+    def prefix(self, prefix, limit=10):
+        """Return up to `limit` (score, position) pairs of the names starting
+        with the normalized `prefix`, with a score of the fraction of the name
+        matched; the best first, and then in alphabetical order."""
+        keys = self.keys
+        start = bisect_left(keys, prefix)
+        end = bisect_left(keys, prefix + '\U0010ffff', start)
+        best = nsmallest(limit, range(start, end), key=lambda i: (len(keys[i]), i))
+        return [(len(prefix)/len(keys[i]) if keys[i] else 1.0, i) for i in best]
+
+    def similar(self, name, limit=10, min_score=0.3):
+        """Return up to `limit` (score, position) pairs of the names most
+        similar to the normalized `name`, with a score of the Sørensen-Dice
+        coefficient of their trigrams at least `min_score`; the best first."""
+        query = name_trigrams(name)
+        counts = Counter()
+        for trigram in query:
+            postings = self.trigrams.get(trigram)
+            if postings is not None:
+                counts.update(postings)
+        # The names sharing too few trigrams cannot score `min_score` whatever
+        # their length
+        n = len(query)
+        min_common = min_score*n/(2.0 - min_score)
+        lengths = self.counts
+        scored = []
+        for i, common in counts.items():
+            if common >= min_common:
+                score = 2.0*common/(n + lengths[i])
+                if score >= min_score:
+                    scored.append((score, -i))
+        return [(score, -i) for score, i in nlargest(limit, scored)]
+
+def parse_metadata_file(file_name):
+    """Parse a chemical metadata file into its rows and, for each index of
+    a :obj:`ChemicalMetadataDB`, a dict of key to row number. Later lines of
+    the file take precedence over earlier ones, as when they are loaded.
+    """
+    from chemicals.data_reader import open_data_file
+    rows = []
+    CAS_index, pubchem_index, smiles_index, InChI_index = {}, {}, {}, {}
+    InChI_key_index, name_index, formula_index = {}, {}, {}
+    with open_data_file(file_name, encoding='utf-8') as f:
+        for line in f:
+            # This is effectively the documentation for the file format of the file
+            values = line.rstrip('\n').split('\t')
+            (pubchemid, CAS, formula, MW, smiles, InChI, InChI_key, iupac_name, common_name) = values[0:9]
+            CAS = int(CAS.replace('-', '')) # Store as int for easier lookup
+            synonyms = values[7:]
+            pubchemid = int(pubchemid)
+            row = len(rows)
+            rows.append((pubchemid, CAS, formula, float(MW), smiles, InChI, InChI_key,
+                         iupac_name, common_name, synonyms))
+            CAS_index[CAS] = row
+            pubchem_index[pubchemid] = row
+            smiles_index[smiles] = row
+            InChI_index[InChI] = row
+            InChI_key_index[InChI_key] = row
+            for name in synonyms:
+                name_index[name] = row
+            formula_index[formula] = row
+    return {'count': len(rows), 'rows': rows, 'CAS': CAS_index, 'pubchem': pubchem_index,
+            'smiles': smiles_index, 'InChI': InChI_index, 'InChI_key': InChI_key_index,
+            'name': name_index, 'formula': formula_index}
+
+def decode_metadata_index(data):
+    if type(data) is bytes:
+        import marshal
+        data = marshal.loads(data)
+    return data
+
+def metadata_file_signature(file_name):
+    st = os.stat(file_name)
+    return [st.st_size, st.st_mtime_ns]
+
+def metadata_file_hash(file_name):
+    import hashlib
+    with open(file_name, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def metadata_index_path(file_name, folder=None):
+    if folder is None:
+        from chemicals.data_reader import df_cache_folder as folder
+    return os_path_join(folder, os.path.basename(file_name) + '.idx')
+
+def write_metadata_index(file_name, folder=None, index=None):
+    """Parse a chemical metadata file and write its indexes to the binary
+    cache folder, from which :obj:`ChemicalMetadataDB` loads them instead
+    of the text file while the file is unchanged. Each index is serialized
+    separately so it is only decoded once it is searched, and the rows as
+    a :obj:`MetadataColumns`. Returns the path written.
+    """
+    import marshal
+    if index is None:
+        index = parse_metadata_file(file_name)
+    header = metadata_header(file_name)
+    path = metadata_index_path(file_name, folder)
+    cache_folder = os.path.dirname(path)
+    if cache_folder and not os.path.exists(cache_folder):
+        os.makedirs(cache_folder)
+    tmp_path = '%s.%d.tmp' %(path, os.getpid())
+    with open(tmp_path, 'wb') as f:
+        data = {k: marshal.dumps(v) for k, v in index.items() if k in METADATA_INDEX_KEYS}
+        data['count'] = index['count']
+        rows = index['rows']
+        if type(rows) is list:
+            rows = MetadataColumns.from_rows(rows)
+        data['rows'] = rows.serialize()
+        f.write(marshal.dumps((header, data)))
+    os.replace(tmp_path, path)
+    return path
+
+def read_metadata_index(file_name, folder=None):
+    """Load the prebuilt indexes of a chemical metadata file. Returns None if
+    there are none, or if the file has changed since they were written; a
+    file whose size and modification time match is assumed unchanged, and
+    otherwise its hash is compared. The rows and each index are returned
+    still serialized; see :obj:`decode_metadata_index` and
+    :obj:`MetadataColumns.deserialize`.
+    """
+    import marshal
+    try:
+        with open(metadata_index_path(file_name, folder), 'rb') as f:
+            header, index = marshal.loads(f.read())
+        if not metadata_header_valid(header, file_name):
+            return None
+    except (OSError, ValueError, EOFError, TypeError):
+        return None
+    return index
+
+def metadata_header(file_name):
+    import sys
+    return (METADATA_INDEX_VERSION, tuple(sys.version_info[:2]),
+            metadata_file_signature(file_name), metadata_file_hash(file_name))
+
+def metadata_header_valid(header, file_name):
+    import sys
+    version, python, signature, file_hash = header
+    if version != METADATA_INDEX_VERSION or list(python) != list(sys.version_info[:2]):
+        return False
+    if list(signature) != metadata_file_signature(file_name):
+        if file_hash != metadata_file_hash(file_name):
+            return False
+    return True
+
+'''The large PubChem database can be split into shards so that a search
+which misses the smaller databases loads only the part of it which could
+contain the answer, instead of all of it. There is one set of shards per
+identifier type, each a dict of key to row number holding the keys whose
+hash falls in it, and the rows themselves are stored in blocks of
+consecutive rows; a search loads one shard of its identifier type and the
+block of the row found. The names are sharded by their normalized form, so
+the shard of a name also holds its normalized names. This is enabled by
+setting `CHEDL_SHARDED_METADATA` to 1; the shards are written to the binary
+cache folder (`CHEDL_DF_CACHE_DIR`) the first time they are needed, or with
+:obj:`write_metadata_shards`. Shards whose source file is not present at all
+are used as they are, so a deployment may ship only the shards.
+'''
+try:
+    SHARDED_METADATA = bool(int(os.environ.get('CHEDL_SHARDED_METADATA', '0')))
+except:
+    SHARDED_METADATA = False
+
+def metadata_shard(key, shards):
+    """Return the shard in which the identifier `key` is stored."""
+    if type(key) is int:
+        return key % shards
+    return crc32(key.encode('utf-8')) % shards
+
+def metadata_shards_path(file_name, folder=None):
+    return metadata_index_path(file_name, folder)[:-len('.idx')] + '.shards'
+
+def write_metadata_shards(file_name, folder=None, shards=64, block_size=4096, index=None):
+    """Parse a chemical metadata file and write it to the binary cache folder
+    split into `shards` shards per identifier type, with its rows in blocks
+    of `block_size`. Returns the folder written.
+    """
+    import marshal
+    if index is None:
+        index = parse_metadata_file(file_name)
+    path = metadata_shards_path(file_name, folder)
+    if not os.path.exists(path):
+        os.makedirs(path)
+    def write(name, data):
+        tmp_path = os.path.join(path, '%s.%d.tmp' %(name, os.getpid()))
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, os.path.join(path, name))
+
+    rows = index['rows']
+    for block, start in enumerate(range(0, len(rows), block_size)):
+        write('rows-%d' %(block), MetadataColumns.from_rows(rows[start:start+block_size]).serialize())
+    for kind in METADATA_INDEX_KEYS:
+        parts = [{} for _ in range(shards)]
+        if kind == 'name':
+            for name, row in index['name'].items():
+                parts[metadata_shard(normalize_name(name), shards)][name] = row
+            parts = [(part, normalized_name_rows(part.items())) for part in parts]
+        else:
+            for key, row in index[kind].items():
+                parts[metadata_shard(key, shards)][key] = row
+        for i, part in enumerate(parts):
+            write('%s-%d' %(kind, i), marshal.dumps(part))
+    # Once the main database is loaded, the names of a chemical which is
+    # also an element refer to the element; see `load_elements`
+    element_names = {}
+    for ele in periodic_table:
+        row = index['InChI_key'].get(ele.InChI_key)
+        if row is not None and ele.CAS not in homonuclear_elements_CASs_set:
+            for name in rows[row][9]:
+                element_names[name] = ele.InChI_key
+    write('elements', marshal.dumps(element_names))
+    # The manifest is written last, so incomplete shards are never used
+    header = metadata_header(file_name) if os.path.exists(file_name) else None
+    write('manifest', marshal.dumps((header, shards, block_size, index['count'])))
+    return path
+
+class MetadataShards(object):
+    """The shards of a chemical metadata file written by
+    :obj:`write_metadata_shards`. Shards and blocks of rows are loaded when
+    a search first needs them and kept afterwards.
+    """
+    def __init__(self, path, shards, block_size, count, columnar=False):
+        self.path = path
+        self.shards = shards
+        self.block_size = block_size
+        self.count = count
+        self.columnar = columnar
+        self.loaded = {}
+        self.blocks = {}
+        self.objects = {}
+        self.lock = RLock()
+        self.element_names = self._load('elements')
+
+    @classmethod
+    def open(cls, file_name, folder=None, columnar=False):
+        """Return the shards of a file, or None if there are none or they
+        are out of date."""
+        import marshal
+        path = metadata_shards_path(file_name, folder)
+        try:
+            with open(os.path.join(path, 'manifest'), 'rb') as f:
+                header, shards, block_size, count = marshal.loads(f.read())
+            if os.path.exists(file_name) and (header is None or not metadata_header_valid(header, file_name)):
+                return None
+        except (OSError, ValueError, EOFError, TypeError):
+            return None
+        return cls(path, shards, block_size, count, columnar)
+
+    def _load(self, name):
+        import marshal
+        data = self.loaded.get(name)
+        if data is None:
+            with self.lock:
+                data = self.loaded.get(name)
+                if data is None:
+                    with open(os.path.join(self.path, name), 'rb') as f:
+                        data = marshal.loads(f.read())
+                    self.loaded[name] = data
+        return data
+
+    def find(self, kind, key):
+        """Return the row number of the chemical with identifier `key` of
+        type `kind` (one of `METADATA_INDEX_KEYS`, or 'normalized_name'), or
+        None."""
+        if kind == 'normalized_name':
+            names, normalized = self._load('name-%d' %(metadata_shard(key, self.shards)))
+            return normalized.get(key)
+        if kind == 'name':
+            names, normalized = self._load('name-%d' %(metadata_shard(normalize_name(key), self.shards)))
+            return names.get(key)
+        try:
+            return self._load('%s-%d' %(kind, metadata_shard(key, self.shards))).get(key)
+        except TypeError:
+            return None
+
+    def materialize(self, row):
+        obj = self.objects.get(row)
+        if obj is None:
+            with self.lock:
+                obj = self.objects.get(row)
+                if obj is None:
+                    block, i = divmod(row, self.block_size)
+                    columns = self.blocks.get(block)
+                    if columns is None:
+                        with open(os.path.join(self.path, 'rows-%d' %(block)), 'rb') as f:
+                            columns = self.blocks[block] = MetadataColumns.deserialize(f.read())
+                    if self.columnar:
+                        obj = ChemicalMetadataView(columns, i)
+                    else:
+                        obj = ChemicalMetadata(*columns.row(i))
+                    self.objects[row] = obj
+        return obj
+
+    def search(self, kind, key):
+        """Return the :obj:`ChemicalMetadata` with identifier `key` of type
+        `kind`, or None."""
+        row = self.find(kind, key)
+        if row is None:
+            return None
+        return self.materialize(row)
+
+class MetadataRows(object):
+    """The rows of a :obj:`ChemicalMetadataDB`, in blocks of one per file
+    loaded; each block is a list of rows as returned by
+    :obj:`parse_metadata_file`, a :obj:`MetadataColumns` (or its serialized
+    form, until it is first needed), or a list of :obj:`ChemicalMetadata`.
+    The :obj:`ChemicalMetadata` of each row is created when it is first
+    looked up and kept in `objects`.
+    """
+    __slots__ = ('blocks', 'offsets', 'objects', 'columnar', 'lock')
+    def __init__(self, columnar=False):
+        self.blocks = []
+        self.offsets = []
+        self.objects = []
+        self.columnar = columnar
+        self.lock = RLock()
+
+    def add(self, rows, count, objects=None):
+        """Add a block of `count` rows; returns the number of its first row."""
+        with self.lock:
+            offset = len(self.objects)
+            if objects is not None:
+                rows = objects
+            elif self.columnar and type(rows) is list:
+                rows = MetadataColumns.from_rows(rows)
+            self.offsets.append(offset)
+            self.blocks.append(rows)
+            self.objects.extend([None]*count if objects is None else objects)
+            return offset
+
+    def materialize(self, row):
+        """Return the :obj:`ChemicalMetadata` of a row, creating it on first
+        use."""
+        obj = self.objects[row]
+        if obj is None:
+            with self.lock:
+                obj = self.objects[row]
+                if obj is not None:
+                    return obj
+                block = bisect_right(self.offsets, row) - 1
+                rows = self.blocks[block]
+                if type(rows) is bytes:
+                    rows = self.blocks[block] = MetadataColumns.deserialize(rows)
+                i = row - self.offsets[block]
+                if type(rows) is list:
+                    obj = ChemicalMetadata(*rows[i])
+                elif self.columnar:
+                    obj = ChemicalMetadataView(rows, i)
+                else:
+                    obj = ChemicalMetadata(*rows.row(i))
+                self.objects[row] = obj
+        return obj
+
+    def __len__(self):
+        return len(self.objects)
+
 class ChemicalMetadataDB(object):
     '''Object which holds the main database of chemical metadata.
 
     .. warning:: To allow the `chemicals` to grow and improve, the details of
        this class may change in the future without notice!
 
+    The database may be searched from several threads. Indexes are never
+    modified once they are in use: merging the files loaded into an index,
+    and loading the main database, build new indexes under a lock and then
+    replace the old ones, and each index refers to the rows it was built
+    for. Only one thread loads the main database; others needing it wait
+    for that load.
     '''
     loaded_main_db = False
+    columnar = False
+
+    def _get_index(key):
+        def get(self):
+            index = self.indexes[key]
+            if self.pending_indexes[key]:
+                with self.lock:
+                    pending = self.pending_indexes[key]
+                    index = self.indexes[key]
+                    if pending:
+                        # Merge the indexes of the files loaded so far, in order
+                        merged = dict(index.row_items())
+                        for data, offset in pending:
+                            data = decode_metadata_index(data)
+                            if offset:
+                                data = {k: row + offset for k, row in data.items()}
+                            merged.update(data)
+                        index = type(index)(self.rows)
+                        index.set_rows(merged)
+                        self.indexes[key] = index
+                        self.pending_indexes[key] = []
+            return index
+        return property(get)
+
+    pubchem_index = _get_index('pubchem')
+    smiles_index = _get_index('smiles')
+    InChI_index = _get_index('InChI')
+    InChI_key_index = _get_index('InChI_key')
+    name_index = _get_index('name')
+    CAS_index = _get_index('CAS')
+    formula_index = _get_index('formula')
+    del _get_index
+
     def __init__(self,
                  elements=True,
                  main_db=os_path_join(folder, 'chemical identifiers pubchem large.tsv'),
@@ -304,19 +1038,23 @@ class ChemicalMetadataDB(object):
                            os_path_join(folder, 'chemical identifiers example user db.tsv'),
                            os_path_join(folder, 'Cation db.tsv'),
                            os_path_join(folder, 'Anion db.tsv'),
-                           os_path_join(folder, 'Inorganic db.tsv')]):
+                           os_path_join(folder, 'Inorganic db.tsv')],
+                 columnar=None, sharded=None):
         '''Construct the database from its parameters, loading all of the files in
         `user_dbs`, the periodic table, and defering loading of `main_db`
         as it is very large until a search doesn't find a chemical in the smaller
-        database.
+        database. With `columnar`, which defaults to `COLUMNAR_METADATA`, the
+        chemicals are stored as :obj:`MetadataColumns`. With `sharded`, which
+        defaults to `SHARDED_METADATA`, searches which miss load only the
+        shard of `main_db` which could hold the chemical; see
+        :obj:`MetadataShards`.
         '''
-        self.pubchem_index = {}
-        self.smiles_index = {}
-        self.InChI_index = {}
-        self.InChI_key_index = {}
-        self.name_index = {}
-        self.CAS_index = {}
-        self.formula_index = {}
+        self.columnar = COLUMNAR_METADATA if columnar is None else columnar
+        self.sharded = SHARDED_METADATA if sharded is None else sharded
+        self.main_shards = None
+        self.element_rows = {}
+        self.lock = RLock()
+        self.reset_indexes()
 
         self.main_db = main_db
         self.user_dbs = user_dbs
@@ -325,6 +1063,12 @@ class ChemicalMetadataDB(object):
         for db in self.user_dbs:
             self.load(db)
         self.load_elements()
+        if self.sharded and self.main_db is not None:
+            try:
+                self.open_main_shards()
+            except OSError:
+                # Reported by the first search needing the main database
+                pass
 
     def load_elements(self):
         '''Load elements into the indexes.
@@ -332,9 +1076,14 @@ class ChemicalMetadataDB(object):
         if not self.elements:
             return None
         
-        InChI_key_index, CAS_index, pubchem_index = self.InChI_key_index, self.CAS_index, self.pubchem_index
-        smiles_index, InChI_index, formula_index = self.smiles_index, self.InChI_index, self.formula_index
-        name_index = self.name_index
+        # The elements are merged into the other indexes only when they are
+        # used, like the indexes of the files
+        loaded_InChI_key_index = self.InChI_key_index
+        InChI_key_index, CAS_index, pubchem_index = {}, {}, {}
+        smiles_index, InChI_index, formula_index = {}, {}, {}
+        name_index = {}
+        objs = []
+        element_rows = {}
         
         for ele in periodic_table:
             CAS = int(ele.CAS.replace('-', '')) # Store as int for easier lookup
@@ -345,56 +1094,124 @@ class ChemicalMetadataDB(object):
                                    iupac_name=ele_lower_name,
                                    common_name=ele_lower_name,
                                    synonyms=[ele_lower_name])
+            row = len(objs)
+            objs.append(obj)
 
-
-            if obj.InChI_key in InChI_key_index:
+            if ele.CAS not in homonuclear_elements_CASs_set:
+                element_rows[obj.InChI_key] = row
+            if obj.InChI_key in loaded_InChI_key_index:
                 if ele.CAS not in homonuclear_elements_CASs_set:
-                    obj_old = InChI_key_index[obj.InChI_key]
+                    obj_old = loaded_InChI_key_index[obj.InChI_key]
                     for name in obj_old.synonyms:
-                        name_index[name] = obj
+                        name_index[name] = row
 
-            InChI_key_index[obj.InChI_key] = obj
-            CAS_index[obj.CAS] = obj
-            pubchem_index[obj.pubchemid] = obj
-            smiles_index[obj.smiles] = obj
-            InChI_index[obj.InChI] = obj
+            InChI_key_index[obj.InChI_key] = row
+            CAS_index[obj.CAS] = row
+            pubchem_index[obj.pubchemid] = row
+            smiles_index[obj.smiles] = row
+            InChI_index[obj.InChI] = row
             if ele.CAS in homonuclear_elements_CASs_set:
                 for name in obj.synonyms:
-                    name_index['monatomic ' + name] = obj
+                    name_index['monatomic ' + name] = row
             else:
                 for name in obj.synonyms:
-                    name_index[name] = obj
-            formula_index[obj.formula] = obj
+                    name_index[name] = row
+            formula_index[obj.formula] = row
 
+        offset = len(self.rows)
+        self.add_index({'count': len(objs), 'rows': objs, 'InChI_key': InChI_key_index,
+                        'CAS': CAS_index, 'pubchem': pubchem_index, 'smiles': smiles_index,
+                        'InChI': InChI_index, 'formula': formula_index, 'name': name_index},
+                       objects=objs)
+        self.element_rows = {key: row + offset for key, row in element_rows.items()}
 
-    def load(self, file_name):
-        '''Load a particular file into the indexes.
+
+    def reset_indexes(self):
+        '''Replace the indexes and the rows of the database with empty ones.
         '''
-        f = open(file_name, encoding='utf-8')
-        for line in f:
-            # This is effectively the documentation for the file format of the file
-            values = line.rstrip('\n').split('\t')
-            (pubchemid, CAS, formula, MW, smiles, InChI, InChI_key, iupac_name, common_name) = values[0:9]
-            CAS = int(CAS.replace('-', '')) # Store as int for easier lookup
+        with self.lock:
+            self.rows = MetadataRows(self.columnar)
+            self.pending_indexes = {key: [] for key in METADATA_INDEX_KEYS}
+            index_type = CompactIndex if self.columnar else MetadataIndex
+            self.indexes = {key: index_type(self.rows) for key in METADATA_INDEX_KEYS}
+            self.indexes['normalized_name'] = self.indexes['name_search'] = None
+
+    def materialize(self, row):
+        '''Return the :obj:`ChemicalMetadata` of a row, creating it on first
+        use.
+        '''
+        return self.rows.materialize(row)
 
-            synonyms = values[7:]
-            pubchemid = int(pubchemid)
+    def load(self, file_name):
+        '''Load a particular file into the indexes. With the binary cache
+        enabled (`CHEDL_DF_CACHE`), the indexes of the file are read from the
+        cache while the file is unchanged, and written to it otherwise; each
+        index is then only decoded when it is first used, and each chemical
+        only created when it is found.
+        '''
+        self.add_index(self.read_index(file_name))
 
-            obj = ChemicalMetadata(pubchemid, CAS, formula, float(MW), smiles,
-                                    InChI, InChI_key, iupac_name, common_name,
-                                    synonyms)
+    def read_index(self, file_name):
+        '''Return the rows and indexes of a file, from the binary cache if
+        enabled and up to date, otherwise by parsing it.
+        '''
+        from chemicals import data_reader
+        index = None
+        if data_reader.use_df_cache:
+            index = read_metadata_index(file_name)
+        if index is None:
+            index = parse_metadata_file(file_name)
+            if data_reader.use_df_cache:
+                try:
+                    write_metadata_index(file_name, index=index)
+                except Exception:
+                    # The cache is an optimization only
+                    pass
+        return index
+
+    def add_index(self, index, objects=None):
+        '''Add the rows and indexes of a file to the database; they take
+        precedence over those already added. The :obj:`ChemicalMetadata` of
+        the rows may be given as `objects` if they already exist.
+        '''
+        with self.lock:
+            offset = self.rows.add(index['rows'], index['count'], objects)
+            for key in METADATA_INDEX_KEYS:
+                self.pending_indexes[key] = self.pending_indexes[key] + [(index[key], offset)]
+            self.indexes['normalized_name'] = self.indexes['name_search'] = None
 
-            # Lookup indexes
-            self.CAS_index[CAS] = obj
-            self.pubchem_index[pubchemid] = obj
-            self.smiles_index[smiles] = obj
-            self.InChI_index[InChI] = obj
-            self.InChI_key_index[InChI_key] = obj
-            for name in synonyms:
-                self.name_index[name] = obj
-            self.formula_index[obj.formula] = obj
+    @property
+    def normalized_name_index(self):
+        '''Index of every name in `name_index` by its :obj:`normalize_name`
+        form, built when first used. Where names of different chemicals have
+        the same normalized form, a name in lower case is preferred, and then
+        the chemical loaded last, as for `name_index`.
+        '''
+        index = self.indexes['normalized_name']
+        if index is None:
+            with self.lock:
+                index = self.indexes['normalized_name']
+                if index is None:
+                    name_index = self.name_index
+                    index = type(name_index)(name_index.store)
+                    index.set_rows(normalized_name_rows(name_index.row_items()))
+                    self.indexes['normalized_name'] = index
+        return index
 
-        f.close()
+    @property
+    def name_search_index(self):
+        '''The :obj:`NameSearchIndex` of the names in
+        `normalized_name_index`, built when first used.
+        '''
+        index = self.indexes['name_search']
+        if index is None:
+            with self.lock:
+                index = self.indexes['name_search']
+                if index is None:
+                    normalized_name_index = self.normalized_name_index
+                    index = NameSearchIndex(normalized_name_index.store, normalized_name_index.row_items())
+                    self.indexes['name_search'] = index
+        return index
 
     def __iter__(self):
         if not self.finished_loading:
@@ -414,61 +1231,158 @@ class ChemicalMetadataDB(object):
             self.autoload_main_db()
 
     def autoload_main_db(self):
-        '''Load the main database when needed.
+        '''Load the main database when needed. The new indexes are built
+        completely before they replace the current ones.
         '''
-        self.load(self.main_db)
-        for db in self.user_dbs:
-            self.load(db)
-        self.load_elements()
-        self.loaded_main_db = True
+        with self.lock:
+            if self.loaded_main_db:
+                # Loaded by another thread while this one waited
+                return True
+            # The user databases and elements take precedence over the main
+            # database, so they are loaded again after it
+            db = ChemicalMetadataDB(elements=False, main_db=None, user_dbs=[],
+                                    columnar=self.columnar)
+            db.add_index(self.read_index(self.main_db))
+            for file_name in self.user_dbs:
+                db.load(file_name)
+            db.elements = self.elements
+            db.load_elements()
+            for key in METADATA_INDEX_KEYS:
+                getattr(db, key + '_index')
+            self.rows = db.rows
+            self.pending_indexes = db.pending_indexes
+            self.indexes = db.indexes
+            self.loaded_main_db = True
         return True
 
-    def _search_autoload(self, identifier, index, autoload=True):
+    def open_main_shards(self):
+        '''Return the :obj:`MetadataShards` of `main_db`, writing them
+        first if they do not exist or are out of date.
+        '''
+        shards = self.main_shards
+        if shards is None:
+            with self.lock:
+                shards = self.main_shards
+                if shards is None:
+                    shards = MetadataShards.open(self.main_db, columnar=self.columnar)
+                    if shards is None:
+                        write_metadata_shards(self.main_db)
+                        shards = MetadataShards.open(self.main_db, columnar=self.columnar)
+                    # Once the main database is loaded, the names of a
+                    # chemical which is also an element refer to the element;
+                    # see `load_elements`
+                    names = {name: self.element_rows[InChI_key]
+                             for name, InChI_key in shards.element_names.items()
+                             if InChI_key in self.element_rows}
+                    if names:
+                        self.pending_indexes['name'] = self.pending_indexes['name'] + [(names, 0)]
+                        self.indexes['normalized_name'] = self.indexes['name_search'] = None
+                    self.main_shards = shards
+        return shards
+
+    def search_main_shards(self, identifier, index_name):
+        '''Search for a chemical in the shards of `main_db`; returns False
+        if it is not found.
+        '''
+        obj = self.open_main_shards().search(index_name[:-len('_index')], identifier)
+        return False if obj is None else obj
+
+    def _search_autoload(self, identifier, index_name, autoload=True):
+        index = getattr(self, index_name)
         if index:
             if identifier in index:
                 return index[identifier]
             else:
                 if autoload and not self.finished_loading:
+                    if self.sharded:
+                        return self.search_main_shards(identifier, index_name)
                     self.autoload_main_db()
-                    return self._search_autoload(identifier, index, autoload)
+                    return self._search_autoload(identifier, index_name, autoload)
         return False
 
     def search_pubchem(self, pubchem, autoload=True):
         '''Search for a chemical by its pubchem number. Accepts strings or ints.
         '''
-        return self._search_autoload(int(pubchem), self.pubchem_index, autoload=autoload)
+        return self._search_autoload(int(pubchem), 'pubchem_index', autoload=autoload)
 
     def search_CAS(self, CAS, autoload=True):
         '''Search for a chemical by its CAS number. Accepts strings or ints.
         '''
         if type(CAS) != int:
             CAS = CAS_to_int(CAS)
-        return self._search_autoload(CAS, self.CAS_index, autoload=autoload)
+        return self._search_autoload(CAS, 'CAS_index', autoload=autoload)
 
     def search_smiles(self, smiles, autoload=True):
         '''Search for a chemical by its smiles string.
         '''
-        return self._search_autoload(smiles, self.smiles_index, autoload=autoload)
+        return self._search_autoload(smiles, 'smiles_index', autoload=autoload)
 
     def search_InChI(self, InChI, autoload=True):
         '''Search for a chemical by its InChI string.
         '''
-        return self._search_autoload(InChI, self.InChI_index, autoload=autoload)
+        return self._search_autoload(InChI, 'InChI_index', autoload=autoload)
 
     def search_InChI_key(self, InChI_key, autoload=True):
         '''Search for a chemical by its InChI key.
         '''
-        return self._search_autoload(InChI_key, self.InChI_key_index, autoload=autoload)
+        return self._search_autoload(InChI_key, 'InChI_key_index', autoload=autoload)
 
     def search_name(self, name, autoload=True):
         '''Search for a chemical by its name.
         '''
-        return self._search_autoload(name, self.name_index, autoload=autoload)
+        return self._search_autoload(name, 'name_index', autoload=autoload)
+
+    def search_normalized_name(self, name, autoload=True):
+        '''Search for a chemical by its name, ignoring case, whitespace and
+        dashes; see :obj:`normalize_name`.
+        '''
+        return self._search_autoload(normalize_name(name), 'normalized_name_index',
+                                     autoload=autoload)
 
     def search_formula(self, formula, autoload=True):
         '''Search for a chemical by its serialized formula.
         '''
-        return self._search_autoload(formula, self.formula_index, autoload=autoload)
+        return self._search_autoload(formula, 'formula_index', autoload=autoload)
+
+    def _name_search_results(self, index, hits):
+        results = []
+        for score, i in hits:
+            key = index.keys[i]
+            obj = index.store.materialize(index.rows[i])
+            for name in obj.synonyms:
+                if normalize_name(name) == key:
+                    break
+            else:
+                name = key
+            results.append((name, score, obj))
+        return results
+
+    def search_name_prefix(self, prefix, limit=10, autoload=False):
+        '''Search for the chemicals with a name starting with `prefix`,
+        ignoring case, whitespace and dashes as :obj:`normalize_name` does.
+        Returns up to `limit` (name, score, :obj:`ChemicalMetadata`) tuples,
+        the score being the fraction of the name matched; the shortest names
+        come first, and then the others in alphabetical order. Only the
+        chemicals loaded are searched, unless `autoload` is True.
+        '''
+        if autoload and not self.finished_loading:
+            self.autoload_main_db()
+        index = self.name_search_index
+        return self._name_search_results(index, index.prefix(normalize_name(prefix), limit))
+
+    def search_similar_names(self, name, limit=10, min_score=0.3, autoload=False):
+        '''Search for the chemicals with a name similar to `name`, such as
+        a misspelled or incomplete one. Names are compared in their
+        :obj:`normalize_name` form by their trigrams; returns up to `limit`
+        (name, score, :obj:`ChemicalMetadata`) tuples with a score, the
+        Sørensen-Dice coefficient of the trigrams, of at least `min_score`,
+        the most similar first. Only the chemicals loaded are searched, unless
+        `autoload` is True.
+        '''
+        if autoload and not self.finished_loading:
+            self.autoload_main_db()
+        index = self.name_search_index
+        return self._name_search_results(index, index.similar(normalize_name(name), limit, min_score))
 
 @mark_numba_incompatible
 def CAS_from_any(ID, autoload=False, cache=True):
@@ -553,8 +1467,33 @@ def MW(ID, autoload=False, cache=True):
     """
     return search_chemical(ID, autoload=autoload, cache=cache).MW
 
-chemical_search_cache = {}
-chemical_search_cache_max_size = 200
+'''The results of `search_chemical` are kept in `chemical_search_cache`, a
+:obj:`chemicals.utils.LRUCache` of at most `CHEDL_SEARCH_CACHE_SIZE` (200 by
+default) identifiers, whose `stats` method reports its hits, misses and
+evictions. Setting `CHEDL_SEARCH_CACHE_TTL` makes results expire after that
+many seconds. Identifiers which are not recognized are cached as well, so
+searching for them again raises the same exception without repeating the
+search; set `cache_search_misses` to False to disable this. The cache can be
+filled ahead of time with :obj:`warm_search_cache`.
+'''
+try:
+    chemical_search_cache_max_size = int(os.environ.get('CHEDL_SEARCH_CACHE_SIZE', 200))
+except ValueError:
+    chemical_search_cache_max_size = 200
+try:
+    chemical_search_cache_ttl = float(os.environ['CHEDL_SEARCH_CACHE_TTL'])
+except (KeyError, ValueError):
+    chemical_search_cache_ttl = None
+chemical_search_cache = LRUCache(chemical_search_cache_max_size, chemical_search_cache_ttl)
+cache_search_misses = True
+
+class _SearchMiss(object):
+    # Cached in place of the result of a search which raised `error`
+    __slots__ = ('error',)
+    def __init__(self, error):
+        self.error = error
+
+_not_cached = object()
 
 @mark_numba_incompatible
 def search_chemical(ID, autoload=False, cache=True):
@@ -614,92 +1553,93 @@ def search_chemical(ID, autoload=False, cache=True):
     >>> search_chemical('O') # only elements can be specified by symbol
     <ChemicalMetadata, name=oxygen, formula=O, smiles=[O], MW=15.9994>
     """
-    if cache and ID in chemical_search_cache:
-        return chemical_search_cache[ID]
+    if cache:
+        hit = chemical_search_cache.get(ID, _not_cached)
+        if hit is not _not_cached:
+            if type(hit) is _SearchMiss:
+                raise ValueError(*hit.error.args)
+            return hit
     if not _pubchem_db_loaded: get_pubchem_db()  # pragma: no cover
-    hit = _search_chemical(ID, autoload)
+    try:
+        hit = _search_chemical(ID, autoload)
+    except ValueError as e:
+        if cache and cache_search_misses:
+            chemical_search_cache[ID] = _SearchMiss(e)
+        raise
     if cache:
-        if len(chemical_search_cache) > chemical_search_cache_max_size:
-            # invalidate cache by time - first entry is removed relying on
-            # dict ordering new in Python 3.7
-            chemical_search_cache.pop(next(chemical_search_cache.keys().__iter__()))
         chemical_search_cache[ID] = hit
     return hit
 
 def _search_chemical(ID, autoload):
-    ID_arg = ID
+    kind, key = _classify_identifier(ID)
+    hit = _lookup_identifier(kind, key, autoload)
+    if hit or kind == 'element':
+        return hit
+    if not autoload:
+        return _search_chemical(ID, autoload=True)
+    raise ValueError(_identifier_not_found_messages[kind] %(key))
+
+_identifier_not_found_messages = {
+    'CAS': 'A valid CAS number (%s) was recognized, but is not in the database',
+    'InChI': 'A valid InChI name (%s) was recognized, but it is not in the database',
+    'InChI_key': 'A valid InChI Key (%s) was recognized, but it is not in the database',
+    'pubchem': 'A PubChem integer (%s) identifier was recognized, but it is not in the database.',
+    'smiles': 'A SMILES identifier (%s) was recognized, but it is not in the database.',
+    'name': 'Chemical name (%s) not recognized',
+}
+
+def _classify_identifier(ID):
+    '''Return the kind of identifier `ID` is, as searched for by
+    `search_chemical`, and the part of it to search for.
+    '''
     ID = ID.strip()
-    ID_lower = ID.lower()
     if ID in periodic_table:
+        return 'element', ID
+    if check_CAS(ID):
+        return 'CAS', ID
+    ID_lower = ID.lower()
+    ID_len = len(ID)
+    if ID_len > 9:
+        # normal upper case is 'InChI=1S/'
+        if ID_lower[0:9] == 'inchi=1s/':
+            return 'InChI', ID[9:]
+        elif ID_lower[0:8] == 'inchi=1/':
+            return 'InChI', ID[8:]
+        if ID_lower[0:9] == 'inchikey=':
+            return 'InChI_key', ID[9:]
+    if ID_len > 8 and ID_lower[0:8] == 'pubchem=':
+        return 'pubchem', ID[8:]
+    if ID_len > 7 and ID_lower[0:7] == 'smiles=':
+        return 'smiles', ID[7:]
+    return 'name', ID
+
+def _lookup_identifier(kind, ID, autoload):
+    '''Search for an identifier classified by `_classify_identifier`;
+    returns False or None if it is not found.
+    '''
+    if kind == 'element':
         '''Special handling for homonuclear elements. Search '1'> H, 'H'> H, monotomic CAS > H
         but "Hydrogen"> H2.
         pubchem_db does not contain atomic numbers, so searching in the periodic table is necessary.
         '''
         if (ID in periodic_table._symbol_to_elements or ID in periodic_table._number_to_elements
             or ID in periodic_table._CAS_to_elements):
-            obj = pubchem_db.search_CAS(periodic_table[ID].CAS)
-        else:
-            obj = pubchem_db.search_CAS(periodic_table[ID].CAS_standard)
-        return obj
-    if check_CAS(ID):
+            return pubchem_db.search_CAS(periodic_table[ID].CAS)
+        return pubchem_db.search_CAS(periodic_table[ID].CAS_standard)
+    elif kind == 'CAS':
         CAS_lookup = pubchem_db.search_CAS(ID, autoload)
         if CAS_lookup:
             return CAS_lookup
         # handle the case of synonyms
-        CAS_alternate_loopup = pubchem_db.search_name(ID, autoload)
-        if CAS_alternate_loopup:
-            return CAS_alternate_loopup
-
-        if not autoload:
-            return search_chemical(ID, autoload=True)
-        raise ValueError('A valid CAS number (%s) was recognized, but is not in the database' %(ID))
-
-
-
-    ID_len = len(ID)
-    if ID_len > 9:
-        inchi_search = False
-        # normal upper case is 'InChI=1S/'
-        if ID_lower[0:9] == 'inchi=1s/':
-            inchi_search = ID[9:]
-        elif ID_lower[0:8] == 'inchi=1/':
-            inchi_search = ID[8:]
-        if inchi_search:
-            inchi_lookup = pubchem_db.search_InChI(inchi_search, autoload)
-            if inchi_lookup:
-                return inchi_lookup
-            else:
-                if not autoload:
-                    return search_chemical(ID, autoload=True)
-                raise ValueError('A valid InChI name (%s) was recognized, but it is not in the database' %(inchi_search))
-        if ID_lower[0:9] == 'inchikey=':
-            inchi_key_lookup = pubchem_db.search_InChI_key(ID[9:], autoload)
-            if inchi_key_lookup:
-                return inchi_key_lookup
-            else:
-                if not autoload:
-                    obj = search_chemical(ID, autoload=True)
-                    return obj
-                raise ValueError('A valid InChI Key (%s) was recognized, but it is not in the database' %(inchi_key_lookup))
-    if ID_len > 8:
-        if ID_lower[0:8] == 'pubchem=':
-            pubchem_lookup = pubchem_db.search_pubchem(ID[8:], autoload)
-            if pubchem_lookup:
-                return pubchem_lookup
-
-            else:
-                if not autoload:
-                    return search_chemical(ID, autoload=True)
-                raise ValueError('A PubChem integer (%s) identifier was recognized, but it is not in the database.' %(ID[8:]))
-    if ID_len > 7:
-        if ID_lower[0:7] == 'smiles=':
-            smiles_lookup = pubchem_db.search_smiles(ID[7:], autoload)
-            if smiles_lookup:
-                return smiles_lookup
-            else:
-                if not autoload:
-                    return search_chemical(ID, autoload=True)
-                raise ValueError('A SMILES identifier (%s) was recognized, but it is not in the database.' %(ID[7:]))
+        return pubchem_db.search_name(ID, autoload)
+    elif kind == 'InChI':
+        return pubchem_db.search_InChI(ID, autoload)
+    elif kind == 'InChI_key':
+        return pubchem_db.search_InChI_key(ID, autoload)
+    elif kind == 'pubchem':
+        return pubchem_db.search_pubchem(ID, autoload)
+    elif kind == 'smiles':
+        return pubchem_db.search_smiles(ID, autoload)
 
     # Try the smiles lookup anyway
     # Parsing SMILES is an option, but this is faster
@@ -710,7 +1650,7 @@ def _search_chemical(ID, autoload):
 
     try:
         formula_query = pubchem_db.search_formula(serialize_formula(ID), autoload)
-        if formula_query and type(formula_query) == ChemicalMetadata:
+        if formula_query and isinstance(formula_query, ChemicalMetadata):
             return formula_query
     except:
         pass
@@ -720,15 +1660,10 @@ def _search_chemical(ID, autoload):
     if name_lookup:
         return name_lookup
 
-#     Permutate through various name options
-    ID_no_space = ID.replace(' ', '')
-    ID_no_space_dash = ID_no_space.replace('-', '')
-
-    for name in [ID, ID_no_space, ID_no_space_dash]:
-        for name2 in [name, name.lower()]:
-            name_lookup = pubchem_db.search_name(name2, autoload)
-            if name_lookup:
-                return name_lookup
+    # Any variation of the name in case, spacing or dashes
+    name_lookup = pubchem_db.search_normalized_name(ID, autoload)
+    if name_lookup:
+        return name_lookup
 
     if ID[-1] == ')' and '(' in ID:#
         # Try to match in the form 'water (H2O)'
@@ -741,11 +1676,122 @@ def _search_chemical(ID, autoload):
                 return CAS
         except:
             pass
+    return None
 
-    if not autoload:
-        return _search_chemical(ID, autoload=True)
+@mark_numba_incompatible
+def search_chemicals(IDs, cache=True):
+    """Looks up metadata about many chemicals at once, accepting the same
+    identifiers as `search_chemical`. Repeated identifiers are searched for
+    only once, and identifiers not found in the databases already loaded
+    cause the main database to be loaded only once, after all of the others
+    have been found. No exception is raised for identifiers which cannot be
+    found; the exception `search_chemical` would raise is returned instead.
+
+    Parameters
+    ----------
+    IDs : list[str]
+        Identifiers in any of the formats described by `search_chemical`, [-]
+    cache : bool, optional
+        Whether or not to use and add to the cache of `search_chemical`, [-]
 
-    raise ValueError('Chemical name (%s) not recognized' %(ID))
+    Returns
+    -------
+    chemical_metadatas : list[ChemicalMetadata]
+        The metadata of each identifier, or None for those not found, [-]
+    errors : list[Exception]
+        The exception raised searching for each identifier not found, or None
+        for those found, [-]
+
+    Examples
+    --------
+    >>> hits, errors = search_chemicals(['water', '64-17-5', 'water', 'not a chemical'])
+    >>> [hit.CASs if hit else None for hit in hits]
+    ['7732-18-5', '64-17-5', '7732-18-5', None]
+    >>> errors[:3], type(errors[3]) is not None
+    ([None, None, None], True)
+    """
+    if not _pubchem_db_loaded: get_pubchem_db()  # pragma: no cover
+    found, failed, searches = {}, {}, {}
+    for ID in IDs:
+        if ID in found or ID in failed or ID in searches:
+            continue
+        if cache:
+            hit = chemical_search_cache.get(ID, _not_cached)
+            if type(hit) is _SearchMiss:
+                failed[ID] = ValueError(*hit.error.args)
+                continue
+            elif hit is not _not_cached:
+                found[ID] = hit
+                continue
+        try:
+            searches[ID] = _classify_identifier(ID)
+        except Exception as e:
+            failed[ID] = e
+
+    # Search the identifiers of each kind together; only those not found are
+    # searched again once the main database is loaded
+    for autoload in (False, True):
+        misses = {}
+        for ID, (kind, key) in sorted(searches.items(), key=lambda item: item[1][0]):
+            try:
+                hit = _lookup_identifier(kind, key, autoload)
+            except Exception as e:
+                failed[ID] = e
+                continue
+            if hit or kind == 'element':
+                found[ID] = hit
+                if cache:
+                    chemical_search_cache[ID] = hit
+            else:
+                misses[ID] = (kind, key)
+        searches = misses
+        if not searches:
+            break
+        if not autoload:
+            try:
+                if not pubchem_db.sharded:
+                    pubchem_db.finish_loading()
+            except Exception as e:
+                for ID in searches:
+                    failed[ID] = e
+                break
+    for ID, (kind, key) in searches.items():
+        if ID not in failed:
+            failed[ID] = ValueError(_identifier_not_found_messages[kind] %(key))
+    if cache and cache_search_misses:
+        for ID, error in failed.items():
+            if type(error) is ValueError:
+                chemical_search_cache[ID] = _SearchMiss(error)
+    return [found.get(ID) for ID in IDs], [failed.get(ID) for ID in IDs]
+
+@mark_numba_incompatible
+def warm_search_cache(IDs):
+    """Search for many chemicals with :obj:`search_chemicals` so that later
+    calls to `search_chemical` with the same identifiers are answered from
+    `chemical_search_cache`. The cache is enlarged if needed to hold all of
+    them.
+
+    Parameters
+    ----------
+    IDs : list[str]
+        Identifiers in any of the formats described by `search_chemical`, [-]
+
+    Returns
+    -------
+    found : int
+        Number of the identifiers which were recognized, [-]
+
+    Examples
+    --------
+    >>> warm_search_cache(['water', 'ethanol', 'water'])
+    2
+    """
+    IDs = list(dict.fromkeys(IDs))
+    maxsize = chemical_search_cache.maxsize
+    if maxsize is not None and maxsize < len(IDs):
+        chemical_search_cache.resize(len(IDs))
+    hits, errors = search_chemicals(IDs, cache=True)
+    return sum(1 for hit in hits if hit)
 
 
 
@@ -766,7 +1812,8 @@ def dippr_compounds():
         A set of CAS numbers from the 2014 edition of the DIPPR database.
     """
     dippr_compounds = set()
-    with open(os.path.join(folder, 'dippr_2014.csv')) as f:
+    from chemicals.data_reader import open_data_file
+    with open_data_file(os.path.join(folder, 'dippr_2014.csv')) as f:
         dippr_compounds.update(f.read().split('\n'))
     return dippr_compounds
 
@@ -891,7 +1938,11 @@ def IDs_to_CASs(IDs):
         except:
             if hasattr(IDs, 'strip'): # It it one chemical?
                 return [CAS_from_any(IDs)]
-    return [CAS_from_any(ID) for ID in IDs]
+    hits, errors = search_chemicals(IDs)
+    for error in errors:
+        if error is not None:
+            raise error
+    return [hit.CASs for hit in hits]
 
 cryogenics = {'132259-10-0': 'Air', '7440-37-1': 'Argon', '630-08-0':
 'carbon monoxide', '7782-39-0': 'deuterium', '7782-41-4': 'fluorine',
@@ -931,7 +1982,8 @@ def load_mixture_composition():
     global mixture_composition_loaded, common_mixtures_by_synonym, common_mixtures
     common_mixtures = {}
     common_mixtures_by_synonym = {}
-    with open(os.path.join(folder, 'Mixtures Compositions.tsv')) as f:
+    from chemicals.data_reader import open_data_file
+    with open_data_file(os.path.join(folder, 'Mixtures Compositions.tsv')) as f:
         """Read in a dict of 90 or so mixutres, their components, and synonyms.
 
         Small errors in mole fractions not adding to 1 are known. Errors in
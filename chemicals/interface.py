@@ -149,7 +149,7 @@ from fluids.constants import N_A, k, root_two
 from fluids.numerics import numpy as np
 
 from chemicals.data_reader import data_source, register_df_source
-from chemicals.utils import (PY37, can_load_data, exp, log,
+from chemicals.utils import (PY37, can_load_data, single_flight_loader, exp, log,
                              mark_numba_incompatible, os_path_join,
                              source_path, sqrt)
 
@@ -164,6 +164,7 @@ register_df_source(folder, 'VDI PPDS surface tensions.tsv')
 
 _interface_dfs_loaded = False
 @mark_numba_incompatible
+@single_flight_loader
 def load_interface_dfs():
     global _interface_dfs_loaded, sigma_data_Mulero_Cachadina, sigma_values_Mulero_Cachadina
     global sigma_data_Jasper_Lange, sigma_values_Jasper_Lange
@@ -184,6 +185,7 @@ def load_interface_dfs():
 
     sigma_data_VDI_PPDS_11 = data_source('VDI PPDS surface tensions.tsv')
     sigma_values_VDI_PPDS_11 = np.array(sigma_data_VDI_PPDS_11.values[:, 1:], dtype=float)
+    _interface_dfs_loaded = True
 
 if PY37:
     def __getattr__(name):
@@ -0,0 +1,355 @@
+# -*- coding: utf-8 -*-
+# Generated by dev/generate_lazy_names.py; do not edit.
+"""Map of the names exported by the `chemicals` package to the submodules
+defining them, for importing with `CHEDL_LAZY_IMPORT`.
+"""
+
+submodule_names = (
+    'utils', 'critical', 'elements', 'reaction', 'dipole', 'dippr',
+    'temperature', 'miscdata', 'environment', 'refractivity', 'solubility',
+    'lennard_jones', 'heat_capacity', 'vapor_pressure', 'virial',
+    'phase_change', 'triple', 'exceptions', 'acentric', 'viscosity',
+    'interface', 'permittivity', 'thermal_conductivity', 'combustion',
+    'volume', 'rachford_rice', 'flash_basic', 'identifiers', 'safety', 'iapws',
+    'air', 'molecular_geometry',
+)
+
+exported_names = {
+    'acentric': (
+        'omega', 'LK_omega', 'Stiel_polar_factor', 'omega_methods',
+        'omega_many', 'omega_all_methods', 'omega_definition',
+    ),
+    'air': (
+        'lemmon2000_air_A0', 'lemmon2000_air_dA0_dtau',
+        'lemmon2000_air_d2A0_dtau2', 'lemmon2000_air_d3A0_dtau3',
+        'lemmon2000_air_d4A0_dtau4', 'lemmon2000_air_Ar',
+        'lemmon2000_air_dAr_dtau', 'lemmon2000_air_d2Ar_dtau2',
+        'lemmon2000_air_d3Ar_dtau3', 'lemmon2000_air_d4Ar_dtau4',
+        'lemmon2000_air_dAr_ddelta', 'lemmon2000_air_d2Ar_ddelta2',
+        'lemmon2000_air_d3Ar_ddelta3', 'lemmon2000_air_d4Ar_ddelta4',
+        'lemmon2000_air_d2Ar_ddeltadtau', 'lemmon2000_air_d3Ar_ddeltadtau2',
+        'lemmon2000_air_d3Ar_ddelta2dtau', 'lemmon2000_air_d4Ar_ddelta2dtau2',
+        'lemmon2000_air_d4Ar_ddeltadtau3', 'lemmon2000_air_d4Ar_ddelta3dtau',
+        'lemmon2000_air_rho_dew', 'lemmon2000_air_rho_bubble',
+        'lemmon2000_air_P_dew', 'lemmon2000_air_P_bubble', 'lemmon2000_air_R',
+        'lemmon2000_air_T_reducing', 'lemmon2000_air_P_reducing',
+        'lemmon2000_air_rho_reducing', 'lemmon2000_air_MW',
+        'lemmon2000_air_P_max', 'lemmon2000_air_T_max', 'lemmon2000_rho',
+        'lemmon2000_P', 'lemmon2000_T', 'TEOS10_BAW_derivatives',
+        'TEOS10_CAWW_derivatives', 'TEOS10_CAAW_derivatives',
+        'iapws04_Henry_air', 'iapws04_dHenry_air_dT',
+    ),
+    'combustion': (
+        'combustion_stoichiometry', 'CombustionData', 'combustion_data',
+        'HHV_modified_Dulong', 'HHV_stoichiometry', 'LHV_from_HHV',
+        'combustion_products_mixture', 'air_fuel_ratio_solver',
+        'fuel_air_spec_solver', 'combustion_spec_solver', 'RON', 'RON_methods',
+        'MON', 'MON_methods', 'Perez_Boehman_RON_from_ignition_delay',
+        'Perez_Boehman_MON_from_ignition_delay', 'octane_sensitivity', 'AKI',
+        'ignition_delay_all_methods', 'ignition_delay_methods',
+        'ignition_delay', 'IDT_to_DCN',
+    ),
+    'critical': (
+        'Tc', 'Pc', 'Vc', 'Zc', 'Mersmann_Kind_predictor', 'third_property',
+        'critical_surface', 'Ihmels', 'Meissner', 'Grigoras',
+        'Hekayati_Raeissi', 'Li', 'Tb_Tc_relationship', 'Chueh_Prausnitz_Tc',
+        'Grieves_Thodos', 'modified_Wilson_Tc', 'Chueh_Prausnitz_Vc',
+        'modified_Wilson_Vc', 'Tc_methods', 'Tc_many', 'Pc_methods', 'Pc_many',
+        'Vc_methods', 'Vc_many', 'Zc_methods', 'Zc_many',
+        'critical_surface_methods', 'Tc_all_methods', 'Pc_all_methods',
+        'Vc_all_methods', 'Zc_all_methods', 'critical_surface_all_methods',
+    ),
+    'dipole': (
+        'dipole_moment', 'dipole_moment_methods', 'dipole_moment_many',
+        'dipole_moment_all_methods',
+    ),
+    'dippr': (
+        'EQ100', 'EQ101', 'EQ102', 'EQ104', 'EQ105', 'EQ106', 'EQ107', 'EQ114',
+        'EQ115', 'EQ116', 'EQ127', 'EQ101_fitting_jacobian',
+        'EQ102_fitting_jacobian', 'EQ106_fitting_jacobian',
+        'EQ105_fitting_jacobian', 'EQ107_fitting_jacobian', 'EQ106_AB',
+        'EQ106_ABC',
+    ),
+    'elements': (
+        'PeriodicTable', 'molecular_weight', 'mass_fractions',
+        'atom_fractions', 'mixture_atomic_composition', 'atom_matrix',
+        'similarity_variable', 'atoms_to_Hill', 'index_hydrogen_deficiency',
+        'simple_formula_parser', 'nested_formula_parser', 'CAS_by_number',
+        'periods', 'groups', 'homonuclear_elements', 'blocks',
+        'homonuclear_elemental_gases', 'charge_from_formula',
+        'serialize_formula', 'mixture_atomic_composition_ordered',
+        'periodic_table',
+    ),
+    'environment': (
+        'GWP', 'ODP', 'logP', 'GWP_all_methods', 'ODP_all_methods',
+        'logP_all_methods', 'GWP_methods', 'ODP_methods', 'logP_methods',
+        'logP_many',
+    ),
+    'exceptions': (
+        'TrivialSolutionError', 'PhaseCountReducedError',
+        'PhaseExistenceImpossible', 'UnderspecifiedError', 'OverspeficiedError',
+    ),
+    'flash_basic': (
+        'K_value', 'Wilson_K_value', 'PR_water_K_value', 'flash_wilson',
+        'flash_Tb_Tc_Pc', 'flash_ideal',
+    ),
+    'heat_capacity': (
+        'heat_capacity_gas_methods', 'Poling', 'Poling_integral',
+        'Poling_integral_over_T', 'Lastovka_Shaw', 'Lastovka_Shaw_integral',
+        'Lastovka_Shaw_integral_over_T', 'Lastovka_Shaw_T_for_Hm',
+        'Lastovka_Shaw_T_for_Sm', 'Lastovka_Shaw_term_A', 'TRCCp',
+        'TRCCp_integral', 'TRCCp_integral_over_T',
+        'heat_capacity_liquid_methods', 'PPDS2', 'PPDS15', 'TDE_CSExpansion',
+        'Rowlinson_Poling', 'Rowlinson_Bondi', 'Dadgostar_Shaw',
+        'Zabransky_quasi_polynomial', 'Zabransky_quasi_polynomial_integral',
+        'Zabransky_quasi_polynomial_integral_over_T', 'Zabransky_cubic',
+        'Zabransky_cubic_integral', 'Zabransky_cubic_integral_over_T',
+        'Dadgostar_Shaw_integral', 'Dadgostar_Shaw_integral_over_T',
+        'Dadgostar_Shaw_terms', 'heat_capacity_solid_methods',
+        'Lastovka_solid', 'Lastovka_solid_integral',
+        'Lastovka_solid_integral_over_T', 'ZabranskySpline',
+        'ZabranskyQuasipolynomial', 'PiecewiseHeatCapacity',
+        'Shomate_integral_over_T', 'Shomate_integral', 'Shomate',
+        'Cpg_statistical_mechanics', 'Cpg_statistical_mechanics_integral',
+        'Cpg_statistical_mechanics_integral_over_T',
+        'vibration_frequency_cm_to_characteristic_temperature',
+    ),
+    'iapws': (
+        'iapws97_boundary_2_3', 'iapws97_boundary_2_3_reverse',
+        'iapws97_identify_region_TP', 'iapws97_region_3',
+        'iapws97_region3_rho', 'iapws97_region1_rho', 'iapws97_region2_rho',
+        'iapws97_region5_rho', 'iapws95_rho', 'iapws95_P', 'iapws95_T',
+        'iapws97_rho_extrapolated', 'iapws97_rho', 'iapws97_P', 'iapws97_T',
+        'iapws95_Psat', 'iapws95_dPsat_dT', 'iapws95_Tsat', 'iapws92_rhol_sat',
+        'iapws92_rhog_sat', 'iapws95_rhol_sat', 'iapws95_rhog_sat',
+        'iapws95_saturation', 'iapws95_A0', 'iapws95_dA0_dtau',
+        'iapws95_d2A0_dtau2', 'iapws95_d3A0_dtau3',
+        'iapws95_A0_tau_derivatives', 'iapws95_Ar', 'iapws95_d3Ar_ddeltadtau2',
+        'iapws95_d3Ar_ddelta2dtau', 'iapws95_dAr_ddelta',
+        'iapws95_d2Ar_ddelta2', 'iapws95_d3Ar_ddelta3', 'iapws95_dAr_dtau',
+        'iapws95_d2Ar_dtau2', 'iapws95_d2Ar_ddeltadtau', 'iapws95_MW',
+        'iapws95_Pc', 'iapws95_Tc', 'iapws95_rhoc', 'iapws95_R', 'iapws97_R',
+        'iapws97_G_region1', 'iapws95_drhol_sat_dT', 'iapws97_dG_dpi_region1',
+        'iapws97_d2G_dpi2_region1', 'iapws97_dG_dtau_region1',
+        'iapws97_d2G_dtau2_region1', 'iapws97_d2G_dpidtau_region1',
+        'iapws97_Gr_region2', 'iapws97_dGr_dpi_region2',
+        'iapws97_d2Gr_dpi2_region2', 'iapws97_dGr_dtau_region2',
+        'iapws97_d2Gr_dtau2_region2', 'iapws97_d2Gr_dpidtau_region2',
+        'iapws97_G0_region2', 'iapws97_dG0_dtau_region2',
+        'iapws97_d2G0_dtau2_region2', 'iapws97_Gr_region5',
+        'iapws97_dGr_dpi_region5', 'iapws97_d2Gr_dpi2_region5',
+        'iapws95_d4Ar_ddelta2dtau2', 'iapws97_dGr_dtau_region5',
+        'iapws97_d2Gr_dtau2_region5', 'iapws97_d2Gr_dpidtau_region5',
+        'iapws97_G0_region5', 'iapws97_dG0_dtau_region5',
+        'iapws97_d2G0_dtau2_region5', 'iapws97_A_region3',
+        'iapws97_dA_ddelta_region3', 'iapws97_d2A_ddelta2_region3',
+        'iapws97_dA_dtau_region3', 'iapws97_d2A_dtau2_region3',
+        'iapws97_d2A_ddeltadtau_region3', 'iapws97_boundary_3uv',
+        'iapws97_boundary_3ef', 'iapws97_boundary_3cd', 'iapws97_boundary_3gh',
+        'iapws97_boundary_3ij', 'iapws97_boundary_3jk', 'iapws97_boundary_3mn',
+        'iapws97_boundary_3qu', 'iapws97_boundary_3rx', 'iapws97_boundary_3wx',
+        'iapws97_boundary_3ab', 'iapws97_boundary_3op', 'iapws97_region3_a',
+        'iapws97_region3_b', 'iapws97_region3_c', 'iapws97_region3_d',
+        'iapws97_region3_e', 'iapws97_region3_f', 'iapws97_region3_g',
+        'iapws97_region3_h', 'iapws97_region3_i', 'iapws97_region3_j',
+        'iapws97_region3_k', 'iapws97_region3_l', 'iapws97_region3_m',
+        'iapws97_region3_n', 'iapws97_region3_o', 'iapws97_region3_p',
+        'iapws97_region3_q', 'iapws97_region3_r', 'iapws97_region3_s',
+        'iapws97_region3_t', 'iapws97_region3_u', 'iapws97_region3_v',
+        'iapws97_region3_w', 'iapws97_region3_x', 'iapws97_region3_y',
+        'iapws97_region3_z', 'iapws95_properties', 'iapws92_Psat',
+        'iapws92_dPsat_dT', 'iapws11_Psub',
+    ),
+    'identifiers': (
+        'check_CAS', 'CAS_from_any', 'MW', 'search_chemical',
+        'mixture_from_any', 'cryogenics', 'inerts', 'dippr_compounds',
+        'IDs_to_CASs', 'get_pubchem_db', 'CAS_to_int', 'sorted_CAS_key',
+        'int_to_CAS', 'search_chemicals', 'warm_search_cache',
+    ),
+    'interface': (
+        'REFPROP_sigma', 'Somayajulu', 'Jasper', 'Brock_Bird', 'Pitzer_sigma',
+        'Sastri_Rao', 'Zuo_Stenby', 'sigma_IAPWS', 'PPDS14', 'Watson_sigma',
+        'Mersmann_Kind_sigma', 'API10A32', 'Hakim_Steinberg_Stiel', 'Miqueu',
+        'Aleem', 'Winterfeld_Scriven_Davis', 'Diguilio_Teja', 'Weinaug_Katz',
+        'Meybodi_Daryasafar_Karimi', 'ISTExpansion', 'sigma_Gharagheizi_1',
+        'sigma_Gharagheizi_2',
+    ),
+    'lennard_jones': (
+        'Stockmayer_all_methods', 'Stockmayer_methods', 'Stockmayer',
+        'molecular_diameter_all_methods', 'molecular_diameter',
+        'molecular_diameter_methods', 'sigma_Flynn',
+        'sigma_Bird_Stewart_Lightfoot_critical_2',
+        'sigma_Bird_Stewart_Lightfoot_critical_1',
+        'sigma_Bird_Stewart_Lightfoot_boiling',
+        'sigma_Bird_Stewart_Lightfoot_melting', 'sigma_Stiel_Thodos',
+        'sigma_Tee_Gotoh_Steward_1', 'sigma_Tee_Gotoh_Steward_2',
+        'sigma_Silva_Liu_Macedo', 'epsilon_Flynn',
+        'epsilon_Bird_Stewart_Lightfoot_critical',
+        'epsilon_Bird_Stewart_Lightfoot_boiling',
+        'epsilon_Bird_Stewart_Lightfoot_melting', 'epsilon_Stiel_Thodos',
+        'epsilon_Tee_Gotoh_Steward_1', 'epsilon_Tee_Gotoh_Steward_2',
+        'collision_integral_Neufeld_Janzen_Aziz', 'As_collision',
+        'Bs_collision', 'Cs_collision', 'collision_integral_Kim_Monroe',
+        'T_star',
+    ),
+    'miscdata': (
+        'lookup_VDI_tabular_data',
+    ),
+    'molecular_geometry': (
+        'RG', 'RG_methods', 'RG_all_methods', 'linear', 'linear_methods',
+        'linear_all_methods',
+    ),
+    'permittivity': (
+        'permittivity_IAPWS', 'permittivity_CRC',
+    ),
+    'phase_change': (
+        'Tb_methods', 'Tb_many', 'Tb', 'Tm_methods', 'Tm_many', 'Tm',
+        'Clapeyron', 'Pitzer', 'SMK', 'MK', 'Velasco', 'Riedel', 'Chen', 'Liu',
+        'Vetere', 'Alibakhshi', 'PPDS12', 'Watson', 'Watson_n', 'Hfus',
+        'Hfus_methods', 'Hfus_many',
+    ),
+    'rachford_rice': (
+        'Rachford_Rice_flash_error', 'Rachford_Rice_solution',
+        'Rachford_Rice_polynomial', 'Rachford_Rice_solution_polynomial',
+        'Rachford_Rice_solution_LN2', 'Rachford_Rice_solution2',
+        'Rachford_Rice_solutionN', 'Rachford_Rice_flashN_f_jac',
+        'Rachford_Rice_flash2_f_jac', 'Li_Johns_Ahmadi_solution',
+        'flash_inner_loop', 'flash_inner_loop_all_methods',
+        'flash_inner_loop_methods', 'Rachford_Rice_solution_mpmath',
+        'Rachford_Rice_solution_binary_dd',
+        'Rachford_Rice_solution_Leibovici_Neoschil',
+        'Rachford_Rice_solution_Leibovici_Neoschil_dd',
+    ),
+    'reaction': (
+        'Hfg', 'Hfl', 'Hfs', 'S0g', 'S0l', 'S0s', 'Hfl_methods', 'Hfl_many',
+        'Hfg_methods', 'Hfg_many', 'Hfs_methods', 'Hfs_many', 'S0l_methods',
+        'S0l_many', 'S0g_methods', 'S0g_many', 'S0s_methods', 'S0s_many',
+        'Hfl_all_methods', 'Hfg_all_methods', 'Hfs_all_methods',
+        'S0l_all_methods', 'S0g_all_methods', 'S0s_all_methods',
+        'Gibbs_formation', 'entropy_formation', 'Hf_basis_converter',
+        'balance_stoichiometry', 'stoichiometric_matrix',
+    ),
+    'refractivity': (
+        'RI', 'RI_methods', 'RI_all_methods', 'polarizability_from_RI',
+        'molar_refractivity_from_RI', 'RI_from_molar_refractivity', 'RI_IAPWS',
+        'RI_to_brix', 'brix_to_RI', 'TDE_RIXExpansion',
+    ),
+    'safety': (
+        'ppmv_to_mgm3', 'mgm3_to_ppmv', 'NTP_codes', 'IARC_codes',
+        'Skin_all_methods', 'Ceiling_all_methods', 'STEL_all_methods',
+        'TWA_all_methods', 'TWA_methods', 'TWA', 'STEL', 'STEL_methods',
+        'Ceiling', 'Ceiling_methods', 'Skin', 'Skin_methods',
+        'Carcinogen_methods', 'Carcinogen_all_methods', 'Carcinogen',
+        'T_flash_all_methods', 'T_flash_methods', 'T_flash_many', 'T_flash',
+        'T_autoignition_methods', 'T_autoignition_many',
+        'T_autoignition_all_methods', 'T_autoignition', 'LFL_methods',
+        'LFL_all_methods', 'LFL', 'UFL_methods', 'UFL_all_methods', 'UFL',
+        'fire_mixing', 'Suzuki_LFL', 'Suzuki_UFL', 'Crowl_Louvar_LFL',
+        'Crowl_Louvar_UFL', 'LFL_ISO_10156_2017', 'NFPA_30_classification',
+    ),
+    'solubility': (
+        'solubility_parameter', 'solubility_eutectic',
+        'Tm_depression_eutectic', 'Henry_converter', 'Henry_pressure',
+        'Henry_pressure_mixture', 'Henry_constants', 'dHenry_constants_dT',
+        'd2Henry_constants_dT2',
+    ),
+    'temperature': (
+        'T_converter', 'T_scales', 'ITS90_68_difference', 'Ts_68', 'diffs_68',
+        'Ts_48', 'diffs_48', 'Ts_76', 'diffs_76', 'Ts_27', 'diffs_27',
+    ),
+    'thermal_conductivity': (
+        'Sheffy_Johnson', 'Sato_Riedel', 'Lakshmi_Prasad',
+        'Gharagheizi_liquid', 'Nicola_original', 'Nicola', 'Bahadori_liquid',
+        'kl_Mersmann_Kind', 'DIPPR9G', 'DIPPR9I', 'k_IAPWS', 'Missenard',
+        'DIPPR9H', 'Filippov', 'Eucken', 'Eucken_modified', 'DIPPR9B', 'Chung',
+        'Eli_Hanley', 'Gharagheizi_gas', 'Bahadori_gas', 'PPDS8', 'PPDS3',
+        'Stiel_Thodos_dense', 'Eli_Hanley_dense', 'Chung_dense',
+        'Lindsay_Bromley', 'Wassiljewa_Herning_Zipperer', 'k_air_lemmon',
+        'Chemsep_16',
+    ),
+    'triple': (
+        'Tt_all_methods', 'Tt_methods', 'Tt_many', 'Tt', 'Pt_all_methods',
+        'Pt_methods', 'Pt_many', 'Pt',
+    ),
+    'utils': (
+        'isobaric_expansion', 'isothermal_compressibility', 'Cp_minus_Cv',
+        'speed_of_sound', 'Joule_Thomson', 'phase_identification_parameter',
+        'phase_identification_parameter_phase', 'isentropic_exponent',
+        'isentropic_exponent_TV', 'isentropic_exponent_PT',
+        'isentropic_exponent_PV', 'Vm_to_rho', 'rho_to_Vm', 'Z', 'zs_to_ws',
+        'ws_to_zs', 'zs_to_Vfs', 'Vfs_to_zs', 'none_and_length_check',
+        'normalize', 'remove_zeros', 'mixing_simple', 'mixing_logarithmic',
+        'mixing_power', 'to_num', 'Parachor', 'property_molar_to_mass',
+        'property_mass_to_molar', 'SG_to_API', 'API_to_SG', 'API_to_rho',
+        'rho_to_API', 'SG', 'Watson_K', 'dxs_to_dns', 'dns_to_dn_partials',
+        'dxs_to_dn_partials', 'd2ns_to_dn2_partials', 'd2xs_to_dxdn_partials',
+        'dxs_to_dxsn1', 'd2xs_to_d2xsn1', 'vapor_mass_quality',
+        'mix_component_flows', 'mix_multiple_component_flows',
+        'mix_component_partial_flows', 'solve_flow_composition_mix',
+        'radius_of_gyration', 'v_to_v_molar', 'v_molar_to_v',
+        'molar_velocity_to_velocity', 'velocity_to_molar_velocity', 'PY37',
+    ),
+    'vapor_pressure': (
+        'Antoine', 'dAntoine_dT', 'd2Antoine_dT2', 'Wagner_original',
+        'dWagner_original_dT', 'd2Wagner_original_dT2', 'Wagner', 'dWagner_dT',
+        'd2Wagner_dT2', 'TRC_Antoine_extended', 'dTRC_Antoine_extended_dT',
+        'd2TRC_Antoine_extended_dT2', 'dYaws_Psat_dT',
+        'boiling_critical_relation', 'Lee_Kesler', 'Ambrose_Walton', 'Edalat',
+        'Sanjari', 'Psat_IAPWS', 'dPsat_IAPWS_dT', 'Tsat_IAPWS',
+        'Psub_Clapeyron', 'Yaws_Psat', 'd2Yaws_Psat_dT2',
+        'Antoine_coeffs_from_point', 'Antoine_AB_coeffs_from_point',
+        'DIPPR101_ABC_coeffs_from_point', 'Wagner_original_fitting_jacobian',
+        'Wagner_fitting_jacobian', 'Yaws_Psat_fitting_jacobian',
+        'Antoine_fitting_jacobian', 'TRC_Antoine_extended_fitting_jacobian',
+        'TDE_PVExpansion',
+    ),
+    'virial': (
+        'BVirial_Pitzer_Curl', 'BVirial_Pitzer_Curl_fast',
+        'BVirial_Pitzer_Curl_vec', 'BVirial_Pitzer_Curl_mat', 'BVirial_Abbott',
+        'BVirial_Abbott_fast', 'BVirial_Abbott_vec', 'BVirial_Abbott_mat',
+        'BVirial_Tsonopoulos', 'BVirial_Tsonopoulos_fast',
+        'BVirial_Tsonopoulos_vec', 'BVirial_Tsonopoulos_mat',
+        'BVirial_Tsonopoulos_extended', 'BVirial_Tsonopoulos_extended_fast',
+        'BVirial_Tsonopoulos_extended_vec', 'BVirial_Tsonopoulos_extended_mat',
+        'Meng_virial_a', 'BVirial_Meng', 'BVirial_Meng_vec',
+        'BVirial_Meng_mat', 'BVirial_Oconnell_Prausnitz',
+        'BVirial_Oconnell_Prausnitz_vec', 'BVirial_Oconnell_Prausnitz_mat',
+        'BVirial_Xiang', 'BVirial_Xiang_vec', 'BVirial_Xiang_mat',
+        'BVirial_mixture', 'dBVirial_mixture_dzs', 'd2BVirial_mixture_dzizjs',
+        'd3BVirial_mixture_dzizjzks',
+        'dCVirial_mixture_Orentlicher_Prausnitz_dzs',
+        'd2CVirial_mixture_Orentlicher_Prausnitz_dzizjs',
+        'd3CVirial_mixture_Orentlicher_Prausnitz_dzizjzks', 'B_to_Z',
+        'B_from_Z', 'Z_from_virial_density_form',
+        'Z_from_virial_pressure_form', 'CVirial_Orbey_Vera',
+        'CVirial_Liu_Xiang', 'CVirial_Liu_Xiang_mat', 'CVirial_Liu_Xiang_vec',
+        'CVirial_Orbey_Vera_vec', 'CVirial_Orbey_Vera_mat',
+        'CVirial_mixture_Orentlicher_Prausnitz',
+        'dCVirial_mixture_dT_Orentlicher_Prausnitz',
+        'd2CVirial_mixture_dT2_Orentlicher_Prausnitz',
+        'd3CVirial_mixture_dT3_Orentlicher_Prausnitz',
+        'd2CVirial_mixture_Orentlicher_Prausnitz_dTdzs',
+        'Tarakad_Danner_virial_CSP_kijs', 'Tarakad_Danner_virial_CSP_Tcijs',
+        'Tarakad_Danner_virial_CSP_Pcijs',
+        'Tarakad_Danner_virial_CSP_omegaijs', 'Meng_Duan_2005_virial_CSP_kijs',
+        'Lee_Kesler_virial_CSP_Vcijs', 'dV_dzs_virial', 'd2V_dzizjs_virial',
+    ),
+    'viscosity': (
+        'Viswanath_Natarajan_3', 'Letsou_Stiel', 'Przedziecki_Sridhar',
+        'PPDS9', 'dPPDS9_dT', 'Viswanath_Natarajan_2',
+        'Viswanath_Natarajan_2_exponential', 'Lucas', 'Brokaw', 'mu_TDE',
+        'Yoon_Thodos', 'Stiel_Thodos', 'Lucas_gas',
+        'viscosity_gas_Gharagheizi', 'Herning_Zipperer', 'Wilke',
+        'Wilke_prefactors', 'Wilke_prefactored', 'Wilke_large', 'mu_Yaws',
+        'dmu_Yaws_dT', 'mu_Yaws_fitting_jacobian', 'viscosity_index',
+        'viscosity_converter', 'Lorentz_Bray_Clarke', 'Twu_1985', 'mu_IAPWS',
+        'mu_air_lemmon', 'PPDS5',
+    ),
+    'volume': (
+        'volume_VDI_PPDS', 'Yen_Woods_saturation', 'Rackett', 'Yamada_Gunn',
+        'Townsend_Hales', 'Bhirud_normal', 'COSTALD', 'Campbell_Thodos',
+        'SNM0', 'CRC_inorganic', 'COSTALD_compressed', 'Amgat',
+        'Rackett_mixture', 'COSTALD_mixture', 'ideal_gas', 'Goodman',
+        'Rackett_fit', 'TDE_VDNS_rho', 'PPDS17',
+    ),
+}
@@ -100,7 +100,7 @@ from chemicals.data_reader import (data_source, database_constant_lookup,
                                    register_df_source,
                                    retrieve_any_from_df_dict,
                                    retrieve_from_df_dict)
-from chemicals.utils import (PY37, can_load_data, exp, log,
+from chemicals.utils import (PY37, can_load_data, single_flight_loader, exp, log,
                              mark_numba_incompatible, os_path_join, sin,
                              source_path)
 
@@ -121,15 +121,16 @@ BSLB = 'Bird, Stewart, and Light (2002) boiling relation'
 BSLM = 'Bird, Stewart, and Light (2002) melting relation'
 
 _LJ_data_loaded = False
+@single_flight_loader
 def _load_LJ_data():
     global _LJ_data_loaded, LJ_data_Magalhaes, LJ_data_Poling, LJ_sources
     LJ_data_Magalhaes = data_source('MagalhaesLJ.tsv')
     LJ_data_Poling = data_source('PolingLJ.tsv')
-    _LJ_data_loaded = True
     LJ_sources = {
         MAGALHAES: LJ_data_Magalhaes,
         POLING: LJ_data_Poling,
     }
+    _LJ_data_loaded = True
 
 if PY37:
     def __getattr__(name):
@@ -39,8 +39,8 @@ __all__ = ['lookup_VDI_tabular_data']
 
 import os
 
-from chemicals.data_reader import data_source, register_df_source
-from chemicals.utils import (PY37, can_load_data, mark_numba_incompatible,
+from chemicals.data_reader import data_source, open_data_file, register_data_file, register_df_source
+from chemicals.utils import (PY37, can_load_data, single_flight_loader, mark_numba_incompatible,
                              os_path_join, source_path)
 
 ### Register data sources and lazy load them
@@ -48,12 +48,15 @@ from chemicals.utils import (PY37, can_load_data, mark_numba_incompatible,
 folder = os_path_join(source_path, 'Misc')
 
 ### CRC Handbook general tables
-register_df_source(folder, 'Physical Constants of Inorganic Compounds.csv')
-register_df_source(folder, 'Physical Constants of Organic Compounds.csv')
-register_df_source(folder, 'joback_predictions.tsv', int_CAS=True)
-register_df_source(folder, 'wikidata_properties.tsv', sparsify=True, int_CAS=True)
-register_df_source(folder, 'webbook_constants.tsv', sparsify=True, int_CAS=True)
-register_df_source(folder, 'common_chemistry_data.tsv', sparsify=True, int_CAS=True)
+# Wide tables only ever read through the data_reader lookups; with column
+# projection only the columns actually looked up are loaded
+register_df_source(folder, 'Physical Constants of Inorganic Compounds.csv', lazy_columns=True)
+register_df_source(folder, 'Physical Constants of Organic Compounds.csv', lazy_columns=True)
+register_df_source(folder, 'joback_predictions.tsv', int_CAS=True, lazy_columns=True)
+register_df_source(folder, 'wikidata_properties.tsv', sparsify=True, int_CAS=True, lazy_columns=True)
+register_df_source(folder, 'webbook_constants.tsv', sparsify=True, int_CAS=True, lazy_columns=True)
+register_df_source(folder, 'common_chemistry_data.tsv', sparsify=True, int_CAS=True, lazy_columns=True)
+register_data_file(folder, 'VDI Saturation Compounds Data.json')
 
 JOBACK = 'JOBACK'
 WIKIDATA = 'WIKIDATA'
@@ -65,6 +68,7 @@ JANAF = 'JANAF'
 
 
 _VDI_dict_loaded = False
+@single_flight_loader
 def _load_VDI_saturation_dict():
     """Read in a dict of assorted chemical properties at saturation for 58
     industrially important chemicals, from:
@@ -77,11 +81,12 @@ def _load_VDI_saturation_dict():
     import json
     global VDI_saturation_dict, _VDI_dict_loaded
 
-    with open(os.path.join(folder, 'VDI Saturation Compounds Data.json')) as f:
+    with open_data_file(os.path.join(folder, 'VDI Saturation Compounds Data.json')) as f:
         VDI_saturation_dict = json.loads(f.read())
     _VDI_dict_loaded = True
 
 _miscdata_loaded = False
+@single_flight_loader
 def _load_miscdata():
     global CRC_inorganic_data, CRC_organic_data, joback_predictions, wikidata_data, webbook_data, common_chemistry_data, _miscdata_loaded
     CRC_inorganic_data = data_source('Physical Constants of Inorganic Compounds.csv')
@@ -49,7 +49,7 @@ from chemicals.data_reader import (data_source, database_constant_lookup,
                                    retrieve_any_from_df_dict,
                                    retrieve_from_df_dict)
 from chemicals.miscdata import CHEMSEP, PSI4_2022A
-from chemicals.utils import (PY37, can_load_data, mark_numba_incompatible,
+from chemicals.utils import (PY37, can_load_data, single_flight_loader, mark_numba_incompatible,
                              os_path_join, source_path)
 
 # Register data sources and lazy load them
@@ -62,6 +62,7 @@ register_df_source(folder, 'psi4_linear.tsv')
 
 _RG_data_loaded = False
 @mark_numba_incompatible
+@single_flight_loader
 def _load_RG_data():
     global _RG_data_loaded, radius_of_gyration_data_psi4_2022a, linear_data_psi4_2022a
     global RG_sources, linear_sources, radius_of_gyration_data_chemsep
@@ -76,6 +77,7 @@ def _load_RG_data():
     linear_sources = {
         PSI4_2022A: linear_data_psi4_2022a,
     }
+    _RG_data_loaded = True
     
 if PY37:
     def __getattr__(name):
@@ -63,7 +63,7 @@ __all__ = ['permittivity_IAPWS', 'permittivity_CRC']
 from fluids.numerics import numpy as np
 
 from chemicals.data_reader import data_source, register_df_source
-from chemicals.utils import (PY37, can_load_data, mark_numba_incompatible,
+from chemicals.utils import (PY37, can_load_data, single_flight_loader, mark_numba_incompatible,
                              os_path_join, source_path, sqrt)
 
 folder = os_path_join(source_path, 'Electrolytes')
@@ -71,10 +71,12 @@ register_df_source(folder, 'Permittivity (Dielectric Constant) of Liquids.tsv')
 
 _permittivity_data_loaded = False
 @mark_numba_incompatible
+@single_flight_loader
 def _load_permittivity_data():
     global _permittivity_data_loaded, permittivity_values_CRC, permittivity_data_CRC
     permittivity_data_CRC = data_source('Permittivity (Dielectric Constant) of Liquids.tsv')
     permittivity_values_CRC = np.array(permittivity_data_CRC.values[:, 1:], dtype=float)
+    _permittivity_data_loaded = True
 
 if PY37:
     def __getattr__(name):
@@ -33,12 +33,14 @@ Boiling Point
 -------------
 .. autofunction:: chemicals.phase_change.Tb
 .. autofunction:: chemicals.phase_change.Tb_methods
+.. autofunction:: chemicals.phase_change.Tb_many
 .. autodata:: chemicals.phase_change.Tb_all_methods
 
 Melting Point
 -------------
 .. autofunction:: chemicals.phase_change.Tm
 .. autofunction:: chemicals.phase_change.Tm_methods
+.. autofunction:: chemicals.phase_change.Tm_many
 .. autodata:: chemicals.phase_change.Tm_all_methods
 
 Heat of Fusion
@@ -48,6 +50,7 @@ standard value, at 1 atm and the normal melting point.
 
 .. autofunction:: chemicals.phase_change.Hfus
 .. autofunction:: chemicals.phase_change.Hfus_methods
+.. autofunction:: chemicals.phase_change.Hfus_many
 .. autodata:: chemicals.phase_change.Hfus_all_methods
 
 Heat of Vaporization at Tb Correlations
@@ -127,10 +130,10 @@ The structure of each dataframe is shown below:
 
 """
 
-__all__ = ['Tb_methods', 'Tb', 'Tm_methods', 'Tm',
+__all__ = ['Tb_methods', 'Tb_many', 'Tb', 'Tm_methods', 'Tm_many', 'Tm',
            'Clapeyron', 'Pitzer', 'SMK', 'MK', 'Velasco', 'Riedel', 'Chen',
            'Liu', 'Vetere', 'Alibakhshi','PPDS12', 'Watson', 'Watson_n',
-           'Hfus', 'Hfus_methods']
+           'Hfus', 'Hfus_methods', 'Hfus_many']
 
 
 from fluids.constants import N_A, R, pi
@@ -141,9 +144,10 @@ from chemicals.data_reader import (data_source, database_constant_lookup,
                                    list_available_methods_from_df_dict,
                                    register_df_source,
                                    retrieve_any_from_df_dict,
-                                   retrieve_from_df_dict)
+                                   retrieve_from_df_dict,
+                                   retrieve_many_from_df_dict)
 from chemicals.utils import (
-    PY37, can_load_data, log, mark_numba_incompatible, os_path_join,
+    PY37, can_load_data, single_flight_loader, log, mark_numba_incompatible, os_path_join,
     source_path)
 
 ###  Register data sources and lazy load them
@@ -168,6 +172,7 @@ CRC = 'CRC'
 
 _phase_change_const_loaded = False
 @mark_numba_incompatible
+@single_flight_loader
 def _load_phase_change_constants():
     global Tb_data_Yaws, Tm_ON_data, Hvap_data_Gharagheizi, Hvap_data_CRC
     global Hfus_data_CRC, Hsub_data_Gharagheizi, _phase_change_const_loaded
@@ -178,7 +183,6 @@ def _load_phase_change_constants():
     Hvap_data_CRC = data_source('CRC Handbook Heat of Vaporization.tsv')
     Hfus_data_CRC = data_source('CRC Handbook Heat of Fusion.tsv')
     Hsub_data_Gharagheizi = data_source('Ghazerati Appendix Sublimation Enthalpy.tsv')
-    _phase_change_const_loaded = True
     Tb_sources = {
         CRC_ORG: miscdata.CRC_organic_data,
         CRC_INORG: miscdata.CRC_inorganic_data,
@@ -203,10 +207,12 @@ def _load_phase_change_constants():
         miscdata.WIKIDATA: miscdata.wikidata_data,
         miscdata.JOBACK: miscdata.joback_predictions,
     }
+    _phase_change_const_loaded = True
 
 
 _phase_change_corrs_loaded = False
 @mark_numba_incompatible
+@single_flight_loader
 def _load_phase_change_correlations():
     global phase_change_data_Perrys2_150, phase_change_values_Perrys2_150
     global phase_change_data_VDI_PPDS_4, phase_change_values_VDI_PPDS_4
@@ -347,6 +353,44 @@ def Tb(CASRN, method=None):
     else:
         return retrieve_any_from_df_dict(Tb_sources, CASRN, 'Tb')
 
+@mark_numba_incompatible
+def Tb_many(CASRNs, method=None):
+    r'''Retrieve the normal boiling points of many chemicals from the CRC
+    organic and inorganic tables, CAS Common Chemistry, the WebBook, Yaws and
+    Wikidata in that order, with the Joback estimate last, as :obj:`Tb`
+    does.
+
+    Parameters
+    ----------
+    CASRNs : list[str]
+        CASRNs, [-]
+
+    Returns
+    -------
+    Tbs : ndarray
+        Normal boiling points, NaN where not available, [K]
+    methods : ndarray
+        Method which provided each value, None where not available, [-]
+
+    Other Parameters
+    ----------------
+    method : string, optional
+        A single method to use for all of the chemicals; see :obj:`Tb`.
+
+    Examples
+    --------
+    >>> Tbs, methods = Tb_many(['64-17-5', '7732-18-5'])
+    >>> Tbs.tolist(), methods.tolist()
+    ([351.39, 373.124], ['CRC_ORG', 'CRC_INORG'])
+
+    See Also
+    --------
+    Tb
+    chemicals.data_reader.retrieve_many_from_df_dict
+    '''
+    if not _phase_change_const_loaded: _load_phase_change_constants()
+    return retrieve_many_from_df_dict(Tb_sources, CASRNs, 'Tb', method)
+
 ### Melting Point
 
 Tm_all_methods = (OPEN_NTBKM, CRC_INORG, CRC_ORG, miscdata.COMMON_CHEMISTRY, 
@@ -452,6 +496,43 @@ def Tm(CASRN, method=None):
     else:
         return retrieve_any_from_df_dict(Tm_sources, CASRN, 'Tm')
 
+@mark_numba_incompatible
+def Tm_many(CASRNs, method=None):
+    r'''Retrieve the melting points of many chemicals, preferring the Open
+    Notebook Melting Point data over the CRC tables and the other sources of
+    :obj:`Tm`.
+
+    Parameters
+    ----------
+    CASRNs : list[str]
+        CASRNs, [-]
+
+    Returns
+    -------
+    Tms : ndarray
+        Melting points, NaN where not available, [K]
+    methods : ndarray
+        Method which provided each value, None where not available, [-]
+
+    Other Parameters
+    ----------------
+    method : string, optional
+        A single method to use for all of the chemicals; see :obj:`Tm`.
+
+    Examples
+    --------
+    >>> Tms, methods = Tm_many(['64-17-5', '7732-18-5'])
+    >>> Tms.tolist(), methods.tolist()
+    ([159.05, 273.15], ['OPEN_NTBKM', 'OPEN_NTBKM'])
+
+    See Also
+    --------
+    Tm
+    chemicals.data_reader.retrieve_many_from_df_dict
+    '''
+    if not _phase_change_const_loaded: _load_phase_change_constants()
+    return retrieve_many_from_df_dict(Tm_sources, CASRNs, 'Tm', method)
+
 
 ### Enthalpy of Vaporization at T
 
@@ -1343,4 +1424,40 @@ def Hfus(CASRN, method=None):
     else:
         return retrieve_any_from_df_dict(Hfus_sources, CASRN, 'Hfus')
 
+@mark_numba_incompatible
+def Hfus_many(CASRNs, method=None):
+    r'''Retrieve the heats of fusion of many chemicals from the CRC Handbook,
+    the WebBook and Wikidata in that order, with the Joback estimate last.
+
+    Parameters
+    ----------
+    CASRNs : list[str]
+        CASRNs, [-]
+
+    Returns
+    -------
+    Hfuses : ndarray
+        Heats of fusion, NaN where not available, [J/mol]
+    methods : ndarray
+        Method which provided each value, None where not available, [-]
+
+    Other Parameters
+    ----------------
+    method : string, optional
+        A single method to use for all of the chemicals; see :obj:`Hfus`.
+
+    Examples
+    --------
+    >>> Hfuses, methods = Hfus_many(['64-17-5', '7732-18-5'])
+    >>> Hfuses.tolist(), methods.tolist()
+    ([4931.0, 6010.0], ['CRC', 'CRC'])
+
+    See Also
+    --------
+    Hfus
+    chemicals.data_reader.retrieve_many_from_df_dict
+    '''
+    if not _phase_change_const_loaded: _load_phase_change_constants()
+    return retrieve_many_from_df_dict(Hfus_sources, CASRNs, 'Hfus', method)
+
 
@@ -34,36 +34,42 @@ Solid Heat of Formation
 -----------------------
 .. autofunction:: chemicals.reaction.Hfs
 .. autofunction:: chemicals.reaction.Hfs_methods
+.. autofunction:: chemicals.reaction.Hfs_many
 .. autodata:: chemicals.reaction.Hfs_all_methods
 
 Liquid Heat of Formation
 ------------------------
 .. autofunction:: chemicals.reaction.Hfl
 .. autofunction:: chemicals.reaction.Hfl_methods
+.. autofunction:: chemicals.reaction.Hfl_many
 .. autodata:: chemicals.reaction.Hfl_all_methods
 
 Gas Heat of Formation
 ---------------------
 .. autofunction:: chemicals.reaction.Hfg
 .. autofunction:: chemicals.reaction.Hfg_methods
+.. autofunction:: chemicals.reaction.Hfg_many
 .. autodata:: chemicals.reaction.Hfg_all_methods
 
 Solid Absolute Entropy
 ----------------------
 .. autofunction:: chemicals.reaction.S0s
 .. autofunction:: chemicals.reaction.S0s_methods
+.. autofunction:: chemicals.reaction.S0s_many
 .. autodata:: chemicals.reaction.S0s_all_methods
 
 Liquid Absolute Entropy
 -----------------------
 .. autofunction:: chemicals.reaction.S0l
 .. autofunction:: chemicals.reaction.S0l_methods
+.. autofunction:: chemicals.reaction.S0l_many
 .. autodata:: chemicals.reaction.S0l_all_methods
 
 Gas Absolute Entropy
 --------------------
 .. autofunction:: chemicals.reaction.S0g
 .. autofunction:: chemicals.reaction.S0g_methods
+.. autofunction:: chemicals.reaction.S0g_many
 .. autodata:: chemicals.reaction.S0g_all_methods
 
 Utility Functions
@@ -79,8 +85,8 @@ Chemical Reactions
 """
 
 __all__ = ['Hfg', 'Hfl', 'Hfs', 'S0g', 'S0l', 'S0s',
-           'Hfl_methods', 'Hfg_methods', 'Hfs_methods',
-           'S0l_methods', 'S0g_methods', 'S0s_methods',
+           'Hfl_methods', 'Hfl_many', 'Hfg_methods', 'Hfg_many', 'Hfs_methods', 'Hfs_many',
+           'S0l_methods', 'S0l_many', 'S0g_methods', 'S0g_many', 'S0s_methods', 'S0s_many',
            'Hfl_all_methods', 'Hfg_all_methods', 'Hfs_all_methods',
            'S0l_all_methods', 'S0g_all_methods', 'S0s_all_methods',
            'Gibbs_formation', 'entropy_formation', 'Hf_basis_converter',
@@ -92,8 +98,9 @@ from chemicals.data_reader import (data_source, database_constant_lookup,
                                    list_available_methods_from_df_dict,
                                    register_df_source,
                                    retrieve_any_from_df_dict,
-                                   retrieve_from_df_dict)
-from chemicals.utils import (PY37, can_load_data, ceil, log10,
+                                   retrieve_from_df_dict,
+                                   retrieve_many_from_df_dict)
+from chemicals.utils import (PY37, can_load_data, single_flight_loader, ceil, log10,
                              mark_numba_incompatible, os_path_join,
                              source_path)
 
@@ -112,6 +119,7 @@ register_df_source(folder, 'ATcT 1.112 (l).tsv')
 register_df_source(folder, 'Yaws Hf S0 (g).tsv')
 register_df_source(folder, 'JANAF_1998.tsv')
 _reaction_data_loaded = False
+@single_flight_loader
 def _load_reaction_data():
     global Hfg_API_TDB_data, Hfg_ATcT_data, Hfl_ATcT_data, Hfg_S0g_YAWS_data
     global Hfg_sources, Hfl_sources, Hfs_sources
@@ -122,7 +130,6 @@ def _load_reaction_data():
     Hfl_ATcT_data = data_source('ATcT 1.112 (l).tsv')
     Hfg_S0g_YAWS_data = data_source('Yaws Hf S0 (g).tsv')
     JANAF_1998_data = data_source('JANAF_1998.tsv')
-    _reaction_data_loaded = True
     S0g_sources = {
         CRC: heat_capacity.CRC_standard_data,
         miscdata.WEBBOOK: miscdata.webbook_data,
@@ -158,6 +165,7 @@ def _load_reaction_data():
         CRC: heat_capacity.CRC_standard_data,
         miscdata.WEBBOOK: miscdata.webbook_data,
     }
+    _reaction_data_loaded = True
 
 if PY37:
     def __getattr__(name):
@@ -259,6 +267,43 @@ def Hfs(CASRN, method=None):
     else:
         return retrieve_any_from_df_dict(Hfs_sources, CASRN, 'Hfs')
 
+@mark_numba_incompatible
+def Hfs_many(CASRNs, method=None):
+    r'''Retrieve the standard heats of formation of many chemicals in the solid
+    phase, mostly inorganic solids, from the CRC Handbook and then the
+    WebBook.
+
+    Parameters
+    ----------
+    CASRNs : list[str]
+        CASRNs, [-]
+
+    Returns
+    -------
+    Hfss : ndarray
+        Solid standard heats of formation, NaN where not available, [J/mol]
+    methods : ndarray
+        Method which provided each value, None where not available, [-]
+
+    Other Parameters
+    ----------------
+    method : string, optional
+        A single method to use for all of the chemicals; see :obj:`Hfs`.
+
+    Examples
+    --------
+    >>> Hfss, methods = Hfs_many(['7440-21-3', '1314-13-2'])
+    >>> Hfss.tolist(), methods.tolist()
+    ([0.0, -350500.0], ['CRC', 'CRC'])
+
+    See Also
+    --------
+    Hfs
+    chemicals.data_reader.retrieve_many_from_df_dict
+    '''
+    if not _reaction_data_loaded: _load_reaction_data()
+    return retrieve_many_from_df_dict(Hfs_sources, CASRNs, 'Hfs', method)
+
 Hfl_all_methods = (ATCT_L, CRC, miscdata.WEBBOOK, miscdata.JANAF)
 '''Tuple of method name keys. See the `Hfl` for the actual references'''
 
@@ -346,6 +391,43 @@ def Hfl(CASRN, method=None):
     else:
         return retrieve_any_from_df_dict(Hfl_sources, CASRN, 'Hfl')
 
+@mark_numba_incompatible
+def Hfl_many(CASRNs, method=None):
+    r'''Retrieve the standard heats of formation of many chemicals in the
+    liquid phase, preferring the Active Thermochemical Tables over the CRC
+    Handbook, the WebBook and JANAF.
+
+    Parameters
+    ----------
+    CASRNs : list[str]
+        CASRNs, [-]
+
+    Returns
+    -------
+    Hfls : ndarray
+        Liquid standard heats of formation, NaN where not available, [J/mol]
+    methods : ndarray
+        Method which provided each value, None where not available, [-]
+
+    Other Parameters
+    ----------------
+    method : string, optional
+        A single method to use for all of the chemicals; see :obj:`Hfl`.
+
+    Examples
+    --------
+    >>> Hfls, methods = Hfl_many(['64-17-5', '7732-18-5'])
+    >>> Hfls.tolist(), methods.tolist()
+    ([-277030.0, -285825.0], ['ATCT_L', 'ATCT_L'])
+
+    See Also
+    --------
+    Hfl
+    chemicals.data_reader.retrieve_many_from_df_dict
+    '''
+    if not _reaction_data_loaded: _load_reaction_data()
+    return retrieve_many_from_df_dict(Hfl_sources, CASRNs, 'Hfl', method)
+
 Hfg_all_methods = (ATCT_G, TRC, CRC, miscdata.WEBBOOK, miscdata.JANAF, YAWS, miscdata.JOBACK)
 '''Tuple of method name keys. See the `Hfg` for the actual references'''
 
@@ -458,6 +540,43 @@ def Hfg(CASRN, method=None):
     else:
         return retrieve_any_from_df_dict(Hfg_sources, CASRN, 'Hfg')
 
+@mark_numba_incompatible
+def Hfg_many(CASRNs, method=None):
+    r'''Retrieve the standard heats of formation of many chemicals in the ideal
+    gas phase, preferring the Active Thermochemical Tables, with the Yaws and
+    Joback values as the last resort, as :obj:`Hfg` does.
+
+    Parameters
+    ----------
+    CASRNs : list[str]
+        CASRNs, [-]
+
+    Returns
+    -------
+    Hfgs : ndarray
+        Ideal-gas standard heats of formation, NaN where not available, [J/mol]
+    methods : ndarray
+        Method which provided each value, None where not available, [-]
+
+    Other Parameters
+    ----------------
+    method : string, optional
+        A single method to use for all of the chemicals; see :obj:`Hfg`.
+
+    Examples
+    --------
+    >>> Hfgs, methods = Hfg_many(['64-17-5', '7732-18-5'])
+    >>> Hfgs.tolist(), methods.tolist()
+    ([-234570.0, -241822.0], ['ATCT_G', 'ATCT_G'])
+
+    See Also
+    --------
+    Hfg
+    chemicals.data_reader.retrieve_many_from_df_dict
+    '''
+    if not _reaction_data_loaded: _load_reaction_data()
+    return retrieve_many_from_df_dict(Hfg_sources, CASRNs, 'Hfg', method)
+
 S0s_all_methods = (CRC, miscdata.WEBBOOK)
 '''Tuple of method name keys. See the `S0s` for the actual references'''
 
@@ -541,6 +660,42 @@ def S0s(CASRN, method=None):
     else:
         return retrieve_any_from_df_dict(S0s_sources, CASRN, 'S0s')
 
+@mark_numba_incompatible
+def S0s_many(CASRNs, method=None):
+    r'''Retrieve the standard absolute entropies of many chemicals in the solid
+    phase from the CRC Handbook and then the WebBook.
+
+    Parameters
+    ----------
+    CASRNs : list[str]
+        CASRNs, [-]
+
+    Returns
+    -------
+    S0ss : ndarray
+        Solid standard absolute entropies, NaN where not available, [J/mol/K]
+    methods : ndarray
+        Method which provided each value, None where not available, [-]
+
+    Other Parameters
+    ----------------
+    method : string, optional
+        A single method to use for all of the chemicals; see :obj:`S0s`.
+
+    Examples
+    --------
+    >>> S0ss, methods = S0s_many(['7440-21-3', '1314-13-2'])
+    >>> S0ss.tolist(), methods.tolist()
+    ([18.8, 43.7], ['CRC', 'CRC'])
+
+    See Also
+    --------
+    S0s
+    chemicals.data_reader.retrieve_many_from_df_dict
+    '''
+    if not _reaction_data_loaded: _load_reaction_data()
+    return retrieve_many_from_df_dict(S0s_sources, CASRNs, 'S0s', method)
+
 S0l_all_methods = (CRC, miscdata.WEBBOOK, miscdata.JANAF)
 '''Tuple of method name keys. See the `S0l` for the actual references'''
 
@@ -621,6 +776,42 @@ def S0l(CASRN, method=None):
     else:
         return retrieve_any_from_df_dict(S0l_sources, CASRN, 'S0l')
 
+@mark_numba_incompatible
+def S0l_many(CASRNs, method=None):
+    r'''Retrieve the standard absolute entropies of many chemicals in the liquid
+    phase from the CRC Handbook, the WebBook and JANAF, in that order.
+
+    Parameters
+    ----------
+    CASRNs : list[str]
+        CASRNs, [-]
+
+    Returns
+    -------
+    S0ls : ndarray
+        Liquid standard absolute entropies, NaN where not available, [J/mol/K]
+    methods : ndarray
+        Method which provided each value, None where not available, [-]
+
+    Other Parameters
+    ----------------
+    method : string, optional
+        A single method to use for all of the chemicals; see :obj:`S0l`.
+
+    Examples
+    --------
+    >>> S0ls, methods = S0l_many(['64-17-5', '7732-18-5'])
+    >>> S0ls.tolist(), methods.tolist()
+    ([160.7, 70.0], ['CRC', 'CRC'])
+
+    See Also
+    --------
+    S0l
+    chemicals.data_reader.retrieve_many_from_df_dict
+    '''
+    if not _reaction_data_loaded: _load_reaction_data()
+    return retrieve_many_from_df_dict(S0l_sources, CASRNs, 'S0l', method)
+
 S0g_all_methods = (CRC, miscdata.WEBBOOK, miscdata.JANAF, YAWS)
 '''Tuple of method name keys. See the `S0g` for the actual references'''
 
@@ -711,6 +902,43 @@ def S0g(CASRN, method=None):
     else:
         return retrieve_any_from_df_dict(S0g_sources, CASRN, 'S0g')
 
+@mark_numba_incompatible
+def S0g_many(CASRNs, method=None):
+    r'''Retrieve the standard absolute entropies of many chemicals in the ideal
+    gas phase from the CRC Handbook, the WebBook, JANAF and Yaws, in that
+    order.
+
+    Parameters
+    ----------
+    CASRNs : list[str]
+        CASRNs, [-]
+
+    Returns
+    -------
+    S0gs : ndarray
+        Ideal-gas standard absolute entropies, NaN where not available, [J/mol/K]
+    methods : ndarray
+        Method which provided each value, None where not available, [-]
+
+    Other Parameters
+    ----------------
+    method : string, optional
+        A single method to use for all of the chemicals; see :obj:`S0g`.
+
+    Examples
+    --------
+    >>> S0gs, methods = S0g_many(['64-17-5', '7732-18-5'])
+    >>> S0gs.tolist(), methods.tolist()
+    ([281.6, 188.8], ['CRC', 'CRC'])
+
+    See Also
+    --------
+    S0g
+    chemicals.data_reader.retrieve_many_from_df_dict
+    '''
+    if not _reaction_data_loaded: _load_reaction_data()
+    return retrieve_many_from_df_dict(S0g_sources, CASRNs, 'S0g', method)
+
 
 # %% Converter functions
 
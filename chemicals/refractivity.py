@@ -70,7 +70,7 @@ from chemicals.data_reader import (data_source, database_constant_lookup,
                                    register_df_source,
                                    retrieve_any_from_df_dict,
                                    retrieve_from_df_dict)
-from chemicals.utils import (PY37, can_load_data, isnan,
+from chemicals.utils import (PY37, can_load_data, single_flight_loader, isnan,
                              mark_numba_incompatible, os_path_join,
                              source_path, sqrt)
 
@@ -84,6 +84,7 @@ CRC = 'CRC'
 
 _RI_data_loaded = False
 @mark_numba_incompatible
+@single_flight_loader
 def _load_RI_data():
     global _RI_data_loaded, RI_data_CRC_organic, RI_sources
     RI_data_CRC_organic = data_source('CRC Handbook Organic RI.csv')
@@ -91,6 +92,7 @@ def _load_RI_data():
         CRC: RI_data_CRC_organic,
         miscdata.WIKIDATA: miscdata.wikidata_data
     }
+    _RI_data_loaded = True
 
 if PY37:
     def __getattr__(name):
@@ -79,12 +79,14 @@ Flash Point
 -----------
 .. autofunction:: chemicals.safety.T_flash
 .. autofunction:: chemicals.safety.T_flash_methods
+.. autofunction:: chemicals.safety.T_flash_many
 .. autodata:: chemicals.safety.T_flash_all_methods
 
 Autoignition Point
 ------------------
 .. autofunction:: chemicals.safety.T_autoignition
 .. autofunction:: chemicals.safety.T_autoignition_methods
+.. autofunction:: chemicals.safety.T_autoignition_many
 .. autodata:: chemicals.safety.T_autoignition_all_methods
 
 Lower Flammability Limit
@@ -122,8 +124,8 @@ __all__ = ('ppmv_to_mgm3', 'mgm3_to_ppmv',
            'TWA_all_methods',
            'TWA_methods', 'TWA', 'STEL', 'STEL_methods', 'Ceiling', 'Ceiling_methods',
            'Skin', 'Skin_methods', 'Carcinogen_methods', 'Carcinogen_all_methods',
-           'Carcinogen', 'T_flash_all_methods', 'T_flash_methods',
-           'T_flash', 'T_autoignition_methods', 'T_autoignition_all_methods',
+           'Carcinogen', 'T_flash_all_methods', 'T_flash_methods', 'T_flash_many',
+           'T_flash', 'T_autoignition_methods', 'T_autoignition_many', 'T_autoignition_all_methods',
            'T_autoignition', 'LFL_methods', 'LFL_all_methods',
            'LFL', 'UFL_methods', 'UFL_all_methods', 'UFL', 'fire_mixing',
            'Suzuki_LFL', 'Suzuki_UFL',
@@ -135,10 +137,13 @@ from chemicals import data_reader as dr
 from chemicals import miscdata
 from chemicals.data_reader import (data_source, database_constant_lookup,
                                    list_available_methods_from_df_dict,
+                                   open_data_file,
+                                   register_data_file,
                                    register_df_source,
                                    retrieve_any_from_df_dict,
-                                   retrieve_from_df_dict)
-from chemicals.utils import (PY37, R, can_load_data, mark_numba_incompatible,
+                                   retrieve_from_df_dict,
+                                   retrieve_many_from_df_dict)
+from chemicals.utils import (PY37, R, can_load_data, single_flight_loader, mark_numba_incompatible,
                              normalize, os_path_join, source_path)
 
 ### Utilities
@@ -251,6 +256,7 @@ register_df_source(folder, 'IS IEC 60079-20-1 2010.tsv')
 register_df_source(folder, 'DIPPR T_flash Serat.csv')
 register_df_source(folder, 'National Toxicology Program Carcinogens.tsv')
 register_df_source(folder, 'IARC Carcinogen Database.tsv')
+register_data_file(folder, 'Ontario Exposure Limits.json')
 _safety_data_loaded = False
 
 
@@ -261,14 +267,14 @@ SERAT = 'Serat DIPPR (2017)'
 SUZUKI = 'Suzuki (1994)'
 CROWLLOUVAR = 'Crowl and Louvar (2001)'
 
+@single_flight_loader
 def _load_safety_data():
     global Ontario_exposure_limits_dict, NFPA_2008_data, IEC_2010_data
     global DIPPR_SERAT_data, NTP_data, IARC_data, Tflash_sources
     global Tautoignition_sources, LFL_sources, UFL_sources, _safety_data_loaded
     import json
-    from io import open
     file = os_path_join(folder, 'Ontario Exposure Limits.json')
-    with open(file, 'r') as stream:
+    with open_data_file(file) as stream:
         Ontario_exposure_limits_dict = json.load(stream)
     NFPA_2008_data = data_source('NFPA 497 2008.tsv')
     IEC_2010_data = data_source('IS IEC 60079-20-1 2010.tsv')
@@ -861,6 +867,42 @@ def T_flash(CASRN, method=None):
     else:
         return retrieve_any_from_df_dict(Tflash_sources, CASRN, 'T_flash')
 
+@mark_numba_incompatible
+def T_flash_many(CASRNs, method=None):
+    r'''Retrieve the flash points of many chemicals from IEC 60079-20-1,
+    NFPA 497, the DIPPR data of Serat and Wikidata, in that order.
+
+    Parameters
+    ----------
+    CASRNs : list[str]
+        CASRNs, [-]
+
+    Returns
+    -------
+    T_flashes : ndarray
+        Flash points, NaN where not available, [K]
+    methods : ndarray
+        Method which provided each value, None where not available, [-]
+
+    Other Parameters
+    ----------------
+    method : string, optional
+        A single method to use for all of the chemicals; see :obj:`T_flash`.
+
+    Examples
+    --------
+    >>> T_flashes, methods = T_flash_many(['71-43-2', '108-88-3'])
+    >>> T_flashes.tolist(), methods.tolist()
+    ([262.15, 277.15], ['IEC 60079-20-1 (2010)', 'IEC 60079-20-1 (2010)'])
+
+    See Also
+    --------
+    T_flash
+    chemicals.data_reader.retrieve_many_from_df_dict
+    '''
+    if not _safety_data_loaded: _load_safety_data()
+    return retrieve_many_from_df_dict(Tflash_sources, CASRNs, 'T_flash', method)
+
 
 T_autoignition_all_methods = (IEC, NFPA, miscdata.WIKIDATA)
 '''Tuple of method name keys. See the :obj:`T_autoignition` for the actual references'''
@@ -947,6 +989,42 @@ def T_autoignition(CASRN, method=None):
     else:
         return retrieve_any_from_df_dict(Tautoignition_sources, CASRN, 'T_autoignition')
 
+@mark_numba_incompatible
+def T_autoignition_many(CASRNs, method=None):
+    r'''Retrieve the autoignition temperatures of many chemicals from
+    IEC 60079-20-1, NFPA 497 and Wikidata, in that order.
+
+    Parameters
+    ----------
+    CASRNs : list[str]
+        CASRNs, [-]
+
+    Returns
+    -------
+    T_autoignitions : ndarray
+        Autoignition temperatures, NaN where not available, [K]
+    methods : ndarray
+        Method which provided each value, None where not available, [-]
+
+    Other Parameters
+    ----------------
+    method : string, optional
+        A single method to use for all of the chemicals; see :obj:`T_autoignition`.
+
+    Examples
+    --------
+    >>> T_autoignitions, methods = T_autoignition_many(['71-43-2', '108-88-3'])
+    >>> T_autoignitions.tolist(), methods.tolist()
+    ([771.15, 803.15], ['IEC 60079-20-1 (2010)', 'IEC 60079-20-1 (2010)'])
+
+    See Also
+    --------
+    T_autoignition
+    chemicals.data_reader.retrieve_many_from_df_dict
+    '''
+    if not _safety_data_loaded: _load_safety_data()
+    return retrieve_many_from_df_dict(Tautoignition_sources, CASRNs, 'T_autoignition', method)
+
 
 
 LFL_all_methods = (IEC, NFPA, miscdata.WIKIDATA, SUZUKI, CROWLLOUVAR)
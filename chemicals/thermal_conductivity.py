@@ -140,7 +140,7 @@ from fluids.numerics import numpy as np
 from fluids.numerics import trunc_exp
 
 from chemicals.data_reader import data_source, register_df_source
-from chemicals.utils import (PY37, atan, can_load_data, exp, log,
+from chemicals.utils import (PY37, atan, can_load_data, single_flight_loader, exp, log,
                              mark_numba_incompatible, os_path_join,
                              source_path, sqrt)
 from chemicals.viscosity import Herning_Zipperer
@@ -155,6 +155,7 @@ register_df_source(folder, 'VDI PPDS Thermal conductivity of gases.tsv', csv_kwa
 
 _k_data_loaded = False
 @mark_numba_incompatible
+@single_flight_loader
 def _load_k_data():
     global _k_data_loaded, k_data_Perrys_8E_2_314, k_values_Perrys_8E_2_314
     global k_data_Perrys_8E_2_315, k_values_Perrys_8E_2_315, k_data_VDI_PPDS_9
@@ -171,6 +172,7 @@ def _load_k_data():
 
     k_data_VDI_PPDS_10 = data_source('VDI PPDS Thermal conductivity of gases.tsv')
     k_values_VDI_PPDS_10 = np.array(k_data_VDI_PPDS_10.values[:, 1:], dtype=float)
+    _k_data_loaded = True
 
 if PY37:
     def __getattr__(name):
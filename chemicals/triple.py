@@ -33,18 +33,20 @@ Triple Temperature
 ------------------
 .. autofunction:: chemicals.triple.Tt
 .. autofunction:: chemicals.triple.Tt_methods
+.. autofunction:: chemicals.triple.Tt_many
 .. autodata:: chemicals.triple.Tt_all_methods
 
 Triple Pressure
 ---------------
 .. autofunction:: chemicals.triple.Pt
 .. autofunction:: chemicals.triple.Pt_methods
+.. autofunction:: chemicals.triple.Pt_many
 .. autodata:: chemicals.triple.Pt_all_methods
 
 """
 
-__all__ = ['Tt_all_methods', 'Tt_methods', 'Tt',
-           'Pt_all_methods', 'Pt_methods', 'Pt']
+__all__ = ['Tt_all_methods', 'Tt_methods', 'Tt_many', 'Tt',
+           'Pt_all_methods', 'Pt_methods', 'Pt_many', 'Pt']
 
 from chemicals import data_reader as dr
 from chemicals import miscdata
@@ -52,9 +54,10 @@ from chemicals.data_reader import (data_source, database_constant_lookup,
                                    list_available_methods_from_df_dict,
                                    register_df_source,
                                    retrieve_any_from_df_dict,
-                                   retrieve_from_df_dict)
-from chemicals.phase_change import Tm
-from chemicals.utils import (PY37, can_load_data, mark_numba_incompatible,
+                                   retrieve_from_df_dict,
+                                   retrieve_many_from_df_dict)
+from chemicals.phase_change import Tm, Tm_many
+from chemicals.utils import (PY37, can_load_data, single_flight_loader, mark_numba_incompatible,
                              os_path_join, source_path)
 
 # Register data sources and lazy load them
@@ -65,15 +68,16 @@ STAVELEY = 'STAVELEY'
 MELTING = 'MELTING'
 
 _triple_data_loaded = False
+@single_flight_loader
 def _load_triple_data():
     global triple_data_Staveley, _triple_data_loaded, Tt_sources, Pt_sources
     triple_data_Staveley = data_source('Staveley 1981.tsv')
-    _triple_data_loaded = True
     Tt_sources = {
         STAVELEY: triple_data_Staveley,
         miscdata.WEBBOOK: miscdata.webbook_data,
     }
     Pt_sources = Tt_sources.copy()
+    _triple_data_loaded = True
 
 if PY37:
     def __getattr__(name):
@@ -182,6 +186,57 @@ def Tt(CASRN, method=None):
         if Tt: return Tt
         return Tm(CASRN)
 
+@mark_numba_incompatible
+def Tt_many(CASRNs, method=None):
+    r'''Retrieve the triple point temperatures of many chemicals from the data
+    of Staveley and then the WebBook. When no `method` is given, the melting
+    point from :obj:`Tm_many` is used for the chemicals in neither, as
+    :obj:`Tt` does.
+
+    Parameters
+    ----------
+    CASRNs : list[str]
+        CASRNs, [-]
+
+    Returns
+    -------
+    Tts : ndarray
+        Triple temperatures, NaN where not available, [K]
+    methods : ndarray
+        Method which provided each value, None where not available, [-]
+
+    Other Parameters
+    ----------------
+    method : string, optional
+        A single method to use for all of the chemicals; see :obj:`Tt`.
+
+    Examples
+    --------
+    >>> Tts, methods = Tt_many(['64-17-5', '7732-18-5'])
+    >>> Tts.tolist(), methods.tolist()
+    ([150.0, 273.15], ['WEBBOOK', 'MELTING'])
+
+    See Also
+    --------
+    Tt
+    chemicals.data_reader.retrieve_many_from_df_dict
+    '''
+    if not _triple_data_loaded: _load_triple_data()
+    if method == MELTING:
+        return Tm_many(CASRNs)
+    CASRNs = list(CASRNs)
+    Tts, methods = retrieve_many_from_df_dict(Tt_sources, CASRNs, 'Tt', method)
+    if method is None:
+        # Fall back to the melting point, as in `Tt`
+        missing = [i for i, m in enumerate(methods) if m is None]
+        if missing:
+            Tms, _ = Tm_many([CASRNs[i] for i in missing])
+            for i, Tm_value in zip(missing, Tms.tolist()):
+                if Tm_value == Tm_value:
+                    Tts[i] = Tm_value
+                    methods[i] = MELTING
+    return Tts, methods
+
 Pt_all_methods = (STAVELEY, miscdata.WEBBOOK)
 '''Tuple of method name keys. See the `Pt` for the actual references'''
 
@@ -267,3 +322,39 @@ def Pt(CASRN, method=None):
     else:
         return retrieve_any_from_df_dict(Pt_sources, CASRN, 'Pt')
 
+@mark_numba_incompatible
+def Pt_many(CASRNs, method=None):
+    r'''Retrieve the triple point pressures of many chemicals from the data of
+    Staveley and then the WebBook.
+
+    Parameters
+    ----------
+    CASRNs : list[str]
+        CASRNs, [-]
+
+    Returns
+    -------
+    Pts : ndarray
+        Triple pressures, NaN where not available, [Pa]
+    methods : ndarray
+        Method which provided each value, None where not available, [-]
+
+    Other Parameters
+    ----------------
+    method : string, optional
+        A single method to use for all of the chemicals; see :obj:`Pt`.
+
+    Examples
+    --------
+    >>> Pts, methods = Pt_many(['7732-18-5', '124-38-9'])
+    >>> Pts.round(1).tolist(), methods.tolist()
+    ([610.0, 517957.4], ['WEBBOOK', 'STAVELEY'])
+
+    See Also
+    --------
+    Pt
+    chemicals.data_reader.retrieve_many_from_df_dict
+    '''
+    if not _triple_data_loaded: _load_triple_data()
+    return retrieve_many_from_df_dict(Pt_sources, CASRNs, 'Pt', method)
+
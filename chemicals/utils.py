@@ -50,6 +50,7 @@ __all__ = ['isobaric_expansion', 'isothermal_compressibility',
 
 import os
 import sys
+from time import monotonic
 from math import (  # Not supported in Python 2.6: expm1, erf, erfc,gamma lgamma
     acos, acosh, asin, asinh, atan, atan2, atanh, ceil, copysign, cos, cosh,
     degrees, e, exp, fabs, floor, fmod, frexp, isinf, isnan, ldexp, log, log10,
@@ -88,7 +89,7 @@ try:
 except:
     pass
 
-numba_blacklisted = ['mark_numba_incompatible', 'mark_numba_uncacheable']
+numba_blacklisted = ['mark_numba_incompatible', 'mark_numba_uncacheable', 'single_flight_loader']
 numba_cache_blacklisted = []
 
 def mark_numba_incompatible(f):
@@ -99,6 +100,30 @@ def mark_numba_uncacheable(f):
     numba_cache_blacklisted.append(f.__name__)
     return f
 
+def single_flight_loader(f):
+    '''Decorator for the functions which lazily load the data of a module, so
+    that they can be called from several threads at once. Concurrent calls
+    wait for the one already running and then return without loading the
+    data again.'''
+    from functools import wraps
+    from threading import RLock
+    lock = RLock()
+    completed = [0]
+    @wraps(f)
+    def wrapper():
+        started = completed[0]
+        with lock:
+            if completed[0] != started:
+                # Loaded by another thread while this one waited
+                return
+            from chemicals import data_reader
+            if data_reader.USE_LOAD_PROFILING:
+                data_reader.profile_loader(f)
+            else:
+                f()
+            completed[0] += 1
+    return wrapper
+
 @mark_numba_incompatible
 def to_num(values):
     r'''Legacy function to turn a list of strings into either floats
@@ -277,6 +302,128 @@ def hash_any_primitive(v):
         v = hash(v.data.tobytes())
     return hash(v)
 
+class LRUCache:
+    '''Thread-safe mapping which keeps at most `maxsize` entries, evicting
+    the least recently used one first. Hits, misses and evictions are counted
+    so the effectiveness of the cache can be inspected with :obj:`stats`.
+    Entries older than `ttl` are treated as missing, and counted as evicted
+    when they are found to have expired.
+
+    Parameters
+    ----------
+    maxsize : int or None
+        Maximum number of entries to keep; None or a value <= 0 for no limit,
+        [-]
+    ttl : float or None
+        Time after which an entry expires; None for no expiry; may be changed
+        later by setting the attribute, and then applies to the time since
+        each entry was stored, [s]
+
+    Examples
+    --------
+    >>> cache = LRUCache(2)
+    >>> cache['a'] = 1; cache['b'] = 2
+    >>> cache.get('a')
+    1
+    >>> cache['c'] = 3
+    >>> 'b' in cache
+    False
+    >>> cache.stats()['evictions']
+    1
+    '''
+    __slots__ = ('data', 'maxsize', 'hits', 'misses', 'evictions', 'lock',
+                 'ttl', 'times')
+
+    def __init__(self, maxsize=None, ttl=None):
+        from collections import OrderedDict
+        from threading import RLock
+        self.data = OrderedDict()
+        self.maxsize = maxsize if (maxsize is not None and maxsize > 0) else None
+        self.hits = self.misses = self.evictions = 0
+        self.lock = RLock()
+        self.ttl = ttl
+        self.times = {}
+
+    def __len__(self):
+        return len(self.data)
+
+    def _expired(self, key):
+        # Only called with the lock held and `key` in the cache
+        ttl = self.ttl
+        if ttl is not None and monotonic() - self.times[key] > ttl:
+            del self.data[key]
+            self.times.pop(key, None)
+            self.evictions += 1
+            return True
+        return False
+
+    def __contains__(self, key):
+        with self.lock:
+            return key in self.data and not self._expired(key)
+
+    def get(self, key, default=None):
+        '''Return the value for `key`, marking it as recently used, or
+        `default` if it is not cached; counts as a hit or a miss.'''
+        with self.lock:
+            try:
+                value = self.data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            if self.ttl is not None and self._expired(key):
+                self.misses += 1
+                return default
+            self.data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def __setitem__(self, key, value):
+        with self.lock:
+            data = self.data
+            data[key] = value
+            data.move_to_end(key)
+            # Recorded even without `ttl`, in case one is set later
+            self.times[key] = monotonic()
+            self._trim()
+
+    def _trim(self):
+        data, maxsize = self.data, self.maxsize
+        if maxsize is not None:
+            while len(data) > maxsize:
+                key, _ = data.popitem(last=False)
+                self.times.pop(key, None)
+                self.evictions += 1
+
+    def pop(self, key, default=None):
+        with self.lock:
+            self.times.pop(key, None)
+            return self.data.pop(key, default)
+
+    def clear(self):
+        '''Remove every entry; the counters are kept.'''
+        with self.lock:
+            self.data.clear()
+            self.times.clear()
+
+    def resize(self, maxsize):
+        '''Change the maximum size, evicting entries if it shrinks.'''
+        with self.lock:
+            self.maxsize = maxsize if (maxsize is not None and maxsize > 0) else None
+            self._trim()
+
+    def reset_stats(self):
+        with self.lock:
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        '''Return a dictionary of the size, limit and counters of the cache.'''
+        with self.lock:
+            lookups = self.hits + self.misses
+            return {'size': len(self.data), 'maxsize': self.maxsize,
+                    'hits': self.hits, 'misses': self.misses,
+                    'evictions': self.evictions,
+                    'hit_rate': self.hits/lookups if lookups else 0.0}
+
 def Parachor(MW, rhol, rhog, sigma):
     r'''Calculate Parachor for a pure species, using its density in the
     liquid and gas phases, surface tension, and molecular weight.
@@ -188,7 +188,7 @@ from fluids.numerics import numpy as np
 from fluids.numerics import trunc_exp
 
 from chemicals.data_reader import data_source, register_df_source
-from chemicals.utils import (PY37, can_load_data, exp, log, log10,
+from chemicals.utils import (PY37, can_load_data, single_flight_loader, exp, log, log10,
                              mark_numba_incompatible, os_path_join,
                              source_path, sqrt)
 
@@ -220,6 +220,7 @@ register_df_source(folder, 'VDI PPDS Boiling temperatures at different pressures
 
 _vapor_pressure_dfs_loaded = False
 @mark_numba_incompatible
+@single_flight_loader
 def load_vapor_pressure_dfs():
     global Psat_data_WagnerMcGarry, Psat_values_WagnerMcGarry, Psat_data_AntoinePoling, Psat_values_AntoinePoling
     global Psat_data_WagnerPoling, Psat_values_WagnerPoling, Psat_data_AntoineExtended, Psat_values_AntoineExtended
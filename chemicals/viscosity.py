@@ -187,7 +187,7 @@ from fluids.numerics import numpy as np
 from fluids.numerics import secant, trunc_exp
 
 from chemicals.data_reader import data_source, register_df_source
-from chemicals.utils import (PY37, acos, atan, can_load_data, exp, log,
+from chemicals.utils import (PY37, acos, atan, can_load_data, single_flight_loader, exp, log,
                              mark_numba_incompatible, os_path_join, sin,
                              source_path, sqrt, tan)
 
@@ -218,6 +218,7 @@ register_df_source(folder, 'VDI PPDS Dynamic viscosity of gases polynomials.tsv'
 
 _mu_data_loaded = False
 @mark_numba_incompatible
+@single_flight_loader
 def _load_mu_data():
     global _mu_data_loaded, mu_data_Dutt_Prasad, mu_values_Dutt_Prasad
     global mu_data_VN3, mu_values_VN3, mu_data_VN2, mu_values_VN2
@@ -186,7 +186,7 @@ from fluids.constants import R, root_two
 from fluids.numerics import implementation_optimize_tck, np, splev
 
 from chemicals.data_reader import data_source, register_df_source
-from chemicals.utils import (PY37, can_load_data, exp, log, mark_numba_incompatible, mixing_simple,
+from chemicals.utils import (PY37, can_load_data, single_flight_loader, exp, log, mark_numba_incompatible, mixing_simple,
                              os_path_join, source_path,
                              sqrt)
 
@@ -208,6 +208,7 @@ register_df_source(folder, 'CRC Virial polynomials.tsv', csv_kwargs={
 
 _rho_data_loaded = False
 @mark_numba_incompatible
+@single_flight_loader
 def _load_rho_data():
     global _rho_data_loaded, rho_data_COSTALD, rho_data_SNM0
     global rho_data_Perry_8E_105_l, rho_values_Perry_8E_105_l
@@ -232,6 +233,7 @@ def _load_rho_data():
 
     rho_data_CRC_virial = data_source('CRC Virial polynomials.tsv')
     rho_values_CRC_virial = np.array(rho_data_CRC_virial.values[:, 1:], dtype=float)
+    _rho_data_loaded = True
 
 if PY37:
     def __getattr__(name):
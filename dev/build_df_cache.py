@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2023, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+# Writes the binary cache of every registered data source and the indexes of
+# the chemical identifier databases, so that a fresh process started with
+# CHEDL_DF_CACHE=1 does not parse any of the text files.
+# The folder written to is CHEDL_DF_CACHE_DIR if set, otherwise chemicals/Cache.
+import os
+import sys
+
+import chemicals
+from chemicals.data_reader import build_df_cache, df_cache_folder
+from chemicals.identifiers import get_pubchem_db, write_metadata_index, write_metadata_shards
+
+folder = sys.argv[1] if len(sys.argv) > 1 else df_cache_folder
+for path in build_df_cache(folder=folder):
+    print(path)
+
+db = get_pubchem_db()
+for file_name in [db.main_db] + db.user_dbs:
+    if os.path.exists(file_name):
+        print(write_metadata_index(file_name, folder=folder))
+if os.path.exists(db.main_db):
+    print(write_metadata_shards(db.main_db, folder=folder))
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2023, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+# Compiles every registered data source and data file into a single bundle,
+# and checks it. A process started with CHEDL_DATA_BUNDLE set to the path of
+# the bundle reads all of its data from that one file.
+import sys
+
+import chemicals
+from chemicals.data_reader import compile_data_bundle, verify_data_bundle
+
+path = sys.argv[1] if len(sys.argv) > 1 else 'chemicals.bundle'
+chemicals.complete_lazy_loading()
+manifest = compile_data_bundle(path)
+failures = verify_data_bundle(path)
+if failures:
+    sys.exit('Corrupt entries in %s: %s' %(path, ', '.join(failures)))
+print('%s: %d data sources, %d data files, chemicals %s' %(path, len(manifest['sources']),
+      len(manifest['files']), manifest['chemicals_version']))
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""Chemical Engineering Design Library (ChEDL). Utilities for process modeling.
+Copyright (C) 2023, Caleb Bell <Caleb.Andrew.Bell@gmail.com>
+
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+"""
+
+# Writes chemicals/lazy_names.py, the map of every name exported by the
+# `chemicals` package to the submodule it comes from, used when the package
+# is imported with CHEDL_LAZY_IMPORT=1. Run this after changing the `__all__`
+# of any submodule; tests/test_chemicals.py checks the map is up to date.
+import os
+import sys
+import textwrap
+
+os.environ['CHEDL_LAZY_IMPORT'] = '0'
+import chemicals
+
+# The order of the star imports in chemicals/__init__.py; a name exported by
+# two submodules is bound to the one imported last
+STAR_IMPORT_ORDER = ['acentric', 'air', 'combustion', 'critical', 'dipole', 'dippr',
+                     'elements', 'environment', 'exceptions', 'flash_basic',
+                     'heat_capacity', 'iapws', 'identifiers', 'interface',
+                     'lennard_jones', 'miscdata', 'molecular_geometry', 'permittivity',
+                     'phase_change', 'rachford_rice', 'reaction', 'refractivity',
+                     'safety', 'solubility', 'temperature', 'thermal_conductivity',
+                     'triple', 'utils', 'vapor_pressure', 'virial', 'viscosity', 'volume']
+
+def lazy_name_map():
+    name_to_module = {}
+    for module in STAR_IMPORT_ORDER:
+        for name in getattr(chemicals, module).__all__:
+            name_to_module[name] = module
+    exported = {module: [] for module in STAR_IMPORT_ORDER}
+    for name, module in name_to_module.items():
+        assert getattr(chemicals, name) is getattr(getattr(chemicals, module), name), name
+        exported[module].append(name)
+    submodules = [name for name in chemicals.__all__ if name in STAR_IMPORT_ORDER]
+    return submodules, {module: tuple(names) for module, names in exported.items() if names}
+
+HEADER = '''# -*- coding: utf-8 -*-
+# Generated by dev/generate_lazy_names.py; do not edit.
+"""Map of the names exported by the `chemicals` package to the submodules
+defining them, for importing with `CHEDL_LAZY_IMPORT`.
+"""
+'''
+
+def format_names(names, indent):
+    items = ', '.join(repr(name) for name in names)
+    return textwrap.fill(items, 79, initial_indent=indent, subsequent_indent=indent)
+
+if __name__ == '__main__':
+    submodules, exported = lazy_name_map()
+    path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(chemicals.__file__), 'lazy_names.py')
+    lines = [HEADER, 'submodule_names = (', format_names(submodules, '    ') + ',', ')', '',
+             'exported_names = {']
+    for module, names in exported.items():
+        lines.append('    %r: (' %(module))
+        lines.append(format_names(names, '        ') + ',')
+        lines.append('    ),')
+    lines.append('}')
+    with open(path, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+    print(path)
@@ -86,3 +86,7 @@ engine = create_engine('sqlite:///../chemicals/Misc/default.sqlite', echo=False)
 if os.path.exists("../chemicals/Misc/default.sqlite"):
     os.remove("../chemicals/Misc/default.sqlite")
 df.to_sql('constants', con=engine)
+
+# Memory-mapped store with the same contents; preferred over sqlite when present
+df = df[data_reader.CONSTANT_DATABASE_COLUMNS[1:]]
+data_reader.write_constants_memmap(df.index.values, df.values, folder='../chemicals/Misc')
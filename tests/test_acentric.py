@@ -88,3 +88,15 @@ def test_Stiel_polar_factor():
     factor = Stiel_polar_factor(Psat=169745.0, Pc=22048321.0, omega=0.344)
     assert_close(0.02322146744772713, factor)
 
+
+def test_omega_many():
+    from chemicals.acentric import omega_many
+    CASs = ['64-17-5', '7732-18-5', '50-00-0', 'BADCAS', '74-82-8', '7440-37-1']
+    values, methods = omega_many(CASs)
+    for CAS, value, method in zip(CASs, values.tolist(), methods.tolist()):
+        expect = omega(CAS)
+        if expect is None:
+            assert value != value and method is None
+        else:
+            assert value == expect
+            assert omega(CAS, method=method) == expect
@@ -25,4 +25,93 @@ import chemicals
 
 def test_all_methods_accessible():
     all_methods = [i for i in dir(chemicals) if 'all_methods' in i]
-    len(all_methods) >= 31
\ No newline at end of file
+    len(all_methods) >= 31
+
+def test_warm_up():
+    import os
+    import subprocess
+    import sys
+    code = '''
+import chemicals
+from chemicals import data_reader
+from concurrent.futures import ThreadPoolExecutor
+thread = chemicals.warm_up_thread
+assert thread is not None and thread.name == 'chemicals-warm-up'
+# Lookups while the warm-up is still running block only on what they need
+with ThreadPoolExecutor(4) as pool:
+    Tcs = list(pool.map(chemicals.Tc, ['64-17-5', '7732-18-5']*4))
+    Hfgs = list(pool.map(chemicals.Hfg, ['64-17-5']*4))
+assert Tcs == [chemicals.Tc('64-17-5'), chemicals.Tc('7732-18-5')]*4
+assert len(set(Hfgs)) == 1 and Hfgs[0] is not None
+thread.join()
+assert chemicals.critical._critical_data_loaded
+assert chemicals.reaction._reaction_data_loaded
+assert 'MagalhaesLJ.tsv' not in data_reader.df_sources
+try:
+    chemicals.warm_up(['not_a_module'])
+except ValueError:
+    pass
+else:
+    raise AssertionError
+assert chemicals.warm_up(['lennard_jones'], background=False) is None
+assert 'MagalhaesLJ.tsv' in data_reader.df_sources
+'''
+    env = dict(os.environ, CHEDL_WARM_UP='critical, reaction, bogus')
+    result = subprocess.run([sys.executable, '-c', code], env=env, stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE, universal_newlines=True)
+    assert result.returncode == 0, result.stderr
+
+
+
+def test_lazy_names_up_to_date():
+    # Regenerate with dev/generate_lazy_names.py if this fails
+    from chemicals.lazy_names import exported_names, submodule_names
+    assert set(submodule_names) == set(name for name in chemicals.__all__
+                                       if type(getattr(chemicals, name)) is type(chemicals))
+    names = [name for names in exported_names.values() for name in names]
+    assert len(names) == len(set(names))
+    assert set(names) | set(submodule_names) == set(chemicals.__all__)
+    for module, names in exported_names.items():
+        for name in names:
+            assert getattr(chemicals, name) is getattr(getattr(chemicals, module), name)
+
+
+def test_lazy_import():
+    import os
+    import subprocess
+    import sys
+    code = '''
+import sys
+import chemicals
+assert chemicals.lazy_import
+assert 'chemicals.critical' not in sys.modules and 'chemicals.iapws' not in sys.modules
+assert chemicals.Antoine(100.0, A=8.95894, B=510.595, C=-15.95) > 0
+assert 'chemicals.vapor_pressure' in sys.modules and 'chemicals.iapws' not in sys.modules
+assert chemicals.critical.Tc is chemicals.Tc
+assert 'Tc' in dir(chemicals)
+try:
+    chemicals.not_a_name
+except AttributeError:
+    pass
+else:
+    raise AssertionError
+namespace = {}
+exec('from chemicals import *', namespace)
+assert 'chemicals.iapws' in sys.modules
+assert namespace['iapws95_rho'] is chemicals.iapws.iapws95_rho
+assert len(chemicals.submodules) == len(chemicals.lazy_names.submodule_names)
+assert set(chemicals.lazy_loaders) == set(chemicals.lazy_loader_names)
+'''
+    env = dict(os.environ, CHEDL_LAZY_IMPORT='1')
+    result = subprocess.run([sys.executable, '-c', code], env=env, stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE, universal_newlines=True)
+    assert result.returncode == 0, result.stderr
+
+def test_data_source_threaded_first_use():
+    from concurrent.futures import ThreadPoolExecutor
+    from chemicals import data_reader
+    key = 'psi4_radius_of_gyrations.tsv'
+    data_reader.df_sources.pop(key, None)
+    with ThreadPoolExecutor(8) as pool:
+        dfs = list(pool.map(data_reader.data_source, [key]*16))
+    assert all(df is dfs[0] for df in dfs)
@@ -27,6 +27,7 @@ from fluids.numerics import assert_close, assert_close1d
 from chemicals.miscdata import webbook_data
 from chemicals import int_to_CAS, data_reader
 from chemicals.critical import (Chueh_Prausnitz_Tc, Chueh_Prausnitz_Vc, Grieves_Thodos, Grigoras,
+                                Tc_many, Pc_many, Vc_many, Zc_many,
                                 Hekayati_Raeissi, Ihmels, Li, Meissner, Mersmann_Kind_predictor, Pc,
                                 Pc_methods, Tb_Tc_relationship, Tc, Tc_methods, Vc, Vc_methods, Zc,
                                 Zc_methods, critical_surface, critical_surface_methods,
@@ -504,3 +505,31 @@ def test_Tb_Tc_relationship():
         Tb_Tc_relationship(fit='Perry8E')
     with pytest.raises(ValueError):
         Tb_Tc_relationship(Tb=1, Tc=2, fit='Perry8E')
+
+
+@pytest.mark.parametrize("func, func_many, func_methods, sources", [
+    (Tc, Tc_many, Tc_methods, 'Tc_sources'),
+    (Pc, Pc_many, Pc_methods, 'Pc_sources'),
+    (Vc, Vc_many, Vc_methods, 'Vc_sources'),
+    (Zc, Zc_many, Zc_methods, 'Zc_sources')])
+def test_critical_many(func, func_many, func_methods, sources):
+    from chemicals import critical
+    CASs = ['64-17-5', '7732-18-5', 'BADCAS', '98-01-1', '1-1-1']
+    for df in getattr(critical, sources).values():
+        CASs.extend(i if type(i) is str else int_to_CAS(i) for i in df.index[::50])
+    values, methods = func_many(CASs)
+    assert len(values) == len(methods) == len(CASs)
+    for CAS, value, method in zip(CASs, values.tolist(), methods.tolist()):
+        expect = func(CAS)
+        if expect is None:
+            assert value != value
+            assert method is None
+        else:
+            assert value == expect
+            assert method == func_methods(CAS)[0]
+
+    values, methods = func_many(['64-17-5', '7732-18-5'], method='PSRK')
+    assert values.tolist() == [func('64-17-5', method='PSRK'), func('7732-18-5', method='PSRK')]
+    assert methods.tolist() == ['PSRK', 'PSRK']
+    with pytest.raises(ValueError):
+        func_many(['64-17-5'], method='BADMETHOD')
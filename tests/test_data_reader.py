@@ -53,3 +53,572 @@ def test_CAS_numbers_valid_and_unique():
     # Check that the name is CAS
     for k, df in chemicals.data_reader.df_sources.items():
         assert df.index.name == 'CAS'
+
+def test_df_cache_roundtrip(tmp_path):
+    import pandas as pd
+    from chemicals import data_reader
+    # Cover integer and string CAS indexes, sparse, int, and string columns,
+    # a postload hook and a compressed file
+    keys = ['joback_predictions.tsv', 'webbook_constants.tsv', 'Yaws Collection.tsv',
+            'Syrres logP data.csv.gz', 'IARC Carcinogen Database.tsv']
+    paths = data_reader.build_df_cache(keys, folder=str(tmp_path))
+    assert len(paths) == len(keys)
+    for key in keys:
+        expect = data_reader.parse_df_source(key)
+        cached = data_reader.read_df_cache(key, folder=str(tmp_path))
+        pd.testing.assert_frame_equal(expect, cached, check_exact=True)
+        assert cached.index.dtype == expect.index.dtype
+
+def test_df_cache_invalidated_by_source_change(tmp_path):
+    from chemicals import data_reader
+    source = tmp_path / 'test source.tsv'
+    source.write_text('CAS\tTc\tName\n64-17-5\t514.0\tethanol\n7732-18-5\t647.1\t\n')
+    key = 'test source.tsv'
+    data_reader.register_df_source(str(tmp_path), key)
+    try:
+        data_reader.build_df_cache([key], folder=str(tmp_path))
+        df = data_reader.read_df_cache(key, folder=str(tmp_path))
+        assert df.at['64-17-5', 'Tc'] == 514.0
+        assert df.at['64-17-5', 'Name'] == 'ethanol'
+
+        source.write_text('CAS\tTc\tName\n64-17-5\t513.9\tethanol\n')
+        assert data_reader.read_df_cache(key, folder=str(tmp_path)) is None
+        # A different loading option also invalidates the cache
+        data_reader.build_df_cache([key], folder=str(tmp_path))
+        data_reader.register_df_source(str(tmp_path), key, sparsify=True)
+        assert data_reader.read_df_cache(key, folder=str(tmp_path)) is None
+    finally:
+        del data_reader.load_cmds[key]
+
+def test_fast_lookup_matches_pandas():
+    from chemicals import data_reader, critical, refractivity, environment
+    from chemicals.data_reader import (retrieve_any_from_df_dict, retrieve_from_df_dict,
+                                       list_available_methods_from_df_dict,
+                                       retrieve_any_from_df, list_available_methods_from_df)
+    sources = critical.Tc_sources
+    CASs = ['64-17-5', '98-01-1', '7732-18-5', '50-00-0', 'BADCAS', 7732185]
+    for df in sources.values():
+        CASs.extend(df.index[:3].tolist())
+    GWP_keys = environment._IPCC_2014_GWP_keys_by_method
+
+    def lookups():
+        results = []
+        for CAS in CASs:
+            results.append(retrieve_any_from_df_dict(sources, CAS, 'Tc'))
+            results.append(retrieve_any_from_df_dict(refractivity.RI_sources, CAS, ('RI', 'RIT')))
+            results.append(retrieve_any_from_df(environment.IPCC_2014_GWPs, CAS, GWP_keys.values()))
+            results.append(list_available_methods_from_df(environment.IPCC_2014_GWPs, CAS, GWP_keys))
+            for method in sources:
+                results.append(retrieve_from_df_dict(sources, CAS, 'Tc', method))
+            # String column
+            results.append(retrieve_from_df_dict(sources, CAS, 'Chemical', 'IUPAC'))
+            if CAS != 'BADCAS':
+                results.append(list_available_methods_from_df_dict(sources, CAS, 'Pc'))
+        return results
+
+    orig = data_reader.USE_FAST_LOOKUP
+    try:
+        data_reader.USE_FAST_LOOKUP = False
+        expect = lookups()
+        data_reader.USE_FAST_LOOKUP = True
+        fast = lookups()
+    finally:
+        data_reader.USE_FAST_LOOKUP = orig
+    assert repr(expect) == repr(fast)
+    assert [type(v) for v in expect] == [type(v) for v in fast]
+
+
+def test_constants_memmap_store(tmp_path):
+    from chemicals import data_reader as dr
+    cols = dr.CONSTANT_DATABASE_COLUMNS[1:]
+    CASs = [7732185, 64175, 74828]
+    data = np.full((3, len(cols)), np.nan)
+    data[0, cols.index('Tc')] = 647.14
+    data[1, cols.index('Tc')] = 514.71
+    data[1, cols.index('Pc')] = 6268000.0
+    dr.write_constants_memmap(CASs, data, folder=str(tmp_path))
+    with pytest.raises(ValueError):
+        dr.write_constants_memmap(CASs, data[:, 1:], folder=str(tmp_path))
+
+    old = (dr.CONSTANTS_DB_FOLDER, dr.CONSTANTS_DATABASE_BACKEND, dr.USE_CONSTANTS_DATABASE)
+    dr.close_constants_db()
+    try:
+        dr.CONSTANTS_DB_FOLDER = str(tmp_path)
+        dr.CONSTANTS_DATABASE_BACKEND = None
+        dr.USE_CONSTANTS_DATABASE = True
+        assert dr.database_constant_lookup('64-17-5', 'Tc') == (514.71, True)
+        assert dr.database_constant_lookup(64175, 'Pc') == (6268000.0, True)
+        assert dr.database_constant_lookup('74-82-8', 'Tc') == (None, True)
+        assert dr.database_constant_lookup('50-00-0', 'Tc') == (None, False)
+        assert dr.database_constant_lookup('BADCAS', 'Tc') == (None, False)
+        assert isinstance(dr.CONSTANTS_CAS_ARRAY, np.memmap)
+
+        values, found = dr.database_constant_lookup_many([7732185, 50000, -1, 74828, 99999999999], 'Tc')
+        assert found.tolist() == [True, False, False, True, False]
+        assert values[0] == 647.14
+        assert np.isnan(values[1:]).all()
+
+        from chemicals.critical import Tc, Tc_many
+        assert Tc('64-17-5') == 514.71
+        values, methods = Tc_many(['64-17-5', '74-82-8', '7732-18-5'])
+        # A compound in the store without a value is not looked up elsewhere
+        assert methods.tolist() == [dr.CONSTANTS_DATABASE, None, dr.CONSTANTS_DATABASE]
+        assert values.tolist()[0] == 514.71
+        assert Tc('74-82-8') is None and np.isnan(values[1])
+    finally:
+        dr.close_constants_db()
+        dr.CONSTANTS_DB_FOLDER, dr.CONSTANTS_DATABASE_BACKEND, dr.USE_CONSTANTS_DATABASE = old
+
+
+def make_sqlite_constants(path, Tcs):
+    import sqlite3
+    from chemicals.data_reader import CONSTANT_DATABASE_COLUMNS as cols
+    rows = []
+    for CASi, Tc in Tcs:
+        row = [CASi] + [None]*(len(cols)-1)
+        row[cols.index('Tc')] = Tc
+        rows.append(row)
+    conn = sqlite3.connect(str(path))
+    conn.execute('CREATE TABLE constants (`index` INTEGER, %s)' %(', '.join('`%s` REAL' %(c) for c in cols[1:])))
+    conn.executemany('INSERT INTO constants VALUES (%s)' %(', '.join('?'*len(cols))), rows)
+    conn.commit()
+    conn.close()
+
+def test_constants_cache_bounded(tmp_path):
+    from chemicals import data_reader as dr
+    rows = [(7732185, 647.14), (64175, 514.71), (74828, 190.564)]
+    make_sqlite_constants(tmp_path/dr.CONSTANTS_SQLITE_FILE, rows)
+
+    old = (dr.CONSTANTS_DB_FOLDER, dr.CONSTANTS_DATABASE_BACKEND, dr.USE_CONSTANTS_DATABASE, dr.CONSTANTS_CACHE_SIZE)
+    dr.close_constants_db()
+    dr.DATABASE_CONSTANTS_CACHE.reset_stats()
+    try:
+        dr.CONSTANTS_DB_FOLDER = str(tmp_path)
+        dr.CONSTANTS_DATABASE_BACKEND = 'sqlite'
+        dr.USE_CONSTANTS_DATABASE = True
+        dr.set_constants_cache_size(2)
+        assert dr.database_constant_lookup('7732-18-5', 'Tc') == (647.14, True)
+        assert dr.database_constant_lookup('7732-18-5', 'Tc') == (647.14, True)
+        assert dr.database_constant_lookup('64-17-5', 'Tc') == (514.71, True)
+        assert dr.database_constant_lookup('50-00-0', 'Tc') == (None, False)
+        stats = dr.constants_cache_stats()
+        assert stats['size'] == 2
+        assert stats['maxsize'] == 2
+        assert (stats['hits'], stats['misses'], stats['evictions']) == (1, 3, 1)
+
+        dr.set_constants_cache_size(None)
+        assert dr.warm_constants_cache(['74-82-8', '7732-18-5', 'BADCAS']) == 2
+        assert dr.constants_cache_stats()['size'] == 4
+        assert dr.database_constant_lookup('74-82-8', 'Tc') == (190.564, True)
+        assert dr.constants_cache_stats()['hits'] == 2
+    finally:
+        dr.close_constants_db()
+        dr.CONSTANTS_DB_FOLDER, dr.CONSTANTS_DATABASE_BACKEND, dr.USE_CONSTANTS_DATABASE, size = old
+        dr.set_constants_cache_size(size)
+
+
+def test_constants_db_threads_and_fork(tmp_path):
+    import os
+    from concurrent.futures import ThreadPoolExecutor
+    from chemicals import data_reader as dr
+    Tcs = [(i*10 + 5, float(i)) for i in range(1, 500)]
+    make_sqlite_constants(tmp_path/dr.CONSTANTS_SQLITE_FILE, Tcs)
+    old = (dr.CONSTANTS_DB_FOLDER, dr.CONSTANTS_DATABASE_BACKEND, dr.USE_CONSTANTS_DATABASE)
+    dr.close_constants_db()
+    try:
+        # A missing database disables lookups without creating the file
+        dr.CONSTANTS_DB_FOLDER = str(tmp_path/'missing')
+        dr.CONSTANTS_DATABASE_BACKEND = 'sqlite'
+        dr.USE_CONSTANTS_DATABASE = True
+        assert dr.database_constant_lookup(15, 'Tc') == (None, False)
+        assert not dr.USE_CONSTANTS_DATABASE
+        assert dr.CONSTANTS_DB_LAST_ERROR is not None
+        assert not os.path.exists(str(tmp_path/'missing'/dr.CONSTANTS_SQLITE_FILE))
+        dr.close_constants_db()
+
+        dr.CONSTANTS_DB_FOLDER = str(tmp_path)
+        dr.USE_CONSTANTS_DATABASE = True
+        def lookup(i):
+            return dr.database_constant_lookup(i*10 + 5, 'Tc')
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(lookup, list(range(1, 500))*4))
+        assert results == [(float(i), True) for i in range(1, 500)]*4
+        assert dr.USE_CONSTANTS_DATABASE
+        assert len(dr._constants_connections) > 1
+
+        if hasattr(os, 'fork'):
+            dr.DATABASE_CONSTANTS_CACHE.clear()
+            pid = os.fork()
+            if pid == 0: # pragma: no cover
+                ok = dr.database_constant_lookup(15, 'Tc') == (1.0, True) and len(dr._constants_connections) == 1
+                os._exit(0 if ok else 1)
+            _, status = os.waitpid(pid, 0)
+            assert os.WEXITSTATUS(status) == 0
+    finally:
+        dr.close_constants_db()
+        dr.CONSTANTS_DB_FOLDER, dr.CONSTANTS_DATABASE_BACKEND, dr.USE_CONSTANTS_DATABASE = old
+
+
+def test_prefetch_constants(tmp_path):
+    from chemicals import data_reader as dr
+    Tcs = [(i*10 + 5, float(i)) for i in range(1, 2001)]
+    make_sqlite_constants(tmp_path/dr.CONSTANTS_SQLITE_FILE, Tcs)
+    old = (dr.CONSTANTS_DB_FOLDER, dr.CONSTANTS_DATABASE_BACKEND, dr.USE_CONSTANTS_DATABASE)
+    dr.close_constants_db()
+    try:
+        dr.CONSTANTS_DB_FOLDER = str(tmp_path)
+        dr.CONSTANTS_DATABASE_BACKEND = 'sqlite'
+        dr.USE_CONSTANTS_DATABASE = True
+        dr.init_constants_db()
+        statements = []
+        dr.get_constants_cursor().connection.set_trace_callback(statements.append)
+
+        CASs = [i*10 + 5 for i in range(1, 1001)] + [int_to_CAS(7), 'BADCAS']
+        assert dr.prefetch_constants(CASs) == 1001
+        assert len(statements) == 2
+        assert dr.database_constant_lookup(15, 'Tc') == (1.0, True)
+        assert dr.database_constant_lookup(7, 'Tc') == (None, False)
+        assert dr.prefetch_constants(CASs) == 0
+        assert len(statements) == 2
+
+        del statements[:]
+        CASis = np.array([i*10 + 5 for i in range(900, 2001)] + [-1, 8])
+        values, found = dr.database_constant_lookup_many(CASis, 'Tc')
+        assert len(statements) == 2
+        assert values[:-2].tolist() == [float(i) for i in range(900, 2001)]
+        assert found.tolist() == [True]*1101 + [False, False]
+    finally:
+        dr.close_constants_db()
+        dr.CONSTANTS_DB_FOLDER, dr.CONSTANTS_DATABASE_BACKEND, dr.USE_CONSTANTS_DATABASE = old
+
+
+def test_method_availability_index():
+    from chemicals import data_reader as dr
+    from chemicals.critical import Tc, Tc_methods, Tc_sources, IUPAC, MATTHEWS
+    CASs = ['64-17-5', '7732-18-5', '7440-59-7', '50-00-0', '1-1-1']
+    for df in Tc_sources.values():
+        CASs.extend(i if type(i) is str else int_to_CAS(i) for i in df.index[::97])
+    expect = {}
+    for CAS in CASs:
+        methods = []
+        for method, df in Tc_sources.items():
+            index = CAS if df.index.dtype == object or str(df.index.dtype) == 'str' else CAS_to_int(CAS) if check_CAS(CAS) else None
+            if index in df.index and not np.isnan(df.at[index, 'Tc']):
+                methods.append(method)
+        expect[CAS] = methods
+
+    dr.method_availability.clear()
+    old = dr.USE_CONSTANTS_DATABASE
+    dr.USE_CONSTANTS_DATABASE = False
+    try:
+        before = {CAS: Tc(CAS) for CAS in CASs}
+        for CAS in CASs:
+            assert Tc_methods(CAS) == expect[CAS]
+        assert Tc_methods('1-1-1') == []
+        # As when the sources are searched one by one, which the index
+        # replaces, an invalid CAS number raises
+        with pytest.raises(ValueError):
+            Tc_methods('BADCAS')
+        assert Tc('BADCAS') is None
+        availability = dr.method_availability[(id(Tc_sources), 'Tc')]
+        # Default method resolution uses the index once it exists
+        assert {CAS: Tc(CAS) for CAS in CASs} == before
+        # Several columns at once are looked up in the sources
+        assert dr.retrieve_any_from_df_dict(Tc_sources, '7732-18-5', ['Tc', 'Pc']) == [647.14, 22048320.0]
+
+        IUPAC_CASs = dr.list_indexes_with_methods(Tc_sources, 'Tc', IUPAC)
+        assert len(IUPAC_CASs) == Tc_sources[IUPAC]['Tc'].notna().sum()
+        assert '64-17-5' in IUPAC_CASs
+        both = dr.list_indexes_with_methods(Tc_sources, 'Tc', [IUPAC, MATTHEWS])
+        assert set(IUPAC_CASs) < set(both)
+        with pytest.raises(ValueError):
+            dr.list_indexes_with_methods(Tc_sources, 'Tc', 'NOTAMETHOD')
+
+        # Changing the sources rebuilds the index
+        df = Tc_sources[IUPAC]
+        try:
+            Tc_sources[IUPAC] = df.iloc[:0]
+            assert IUPAC not in Tc_methods('7732-18-5')
+            assert dr.method_availability[(id(Tc_sources), 'Tc')] is not availability
+        finally:
+            Tc_sources[IUPAC] = df
+        assert Tc_methods('7732-18-5') == expect['7732-18-5']
+    finally:
+        dr.USE_CONSTANTS_DATABASE = old
+
+
+def test_negative_cache(tmp_path):
+    import numpy as np
+    import pandas as pd
+    from chemicals import data_reader as dr
+    a = pd.DataFrame({'Tc': [500.0, np.nan]}, index=['64-17-5', '7732-18-5'])
+    b = pd.DataFrame({'Tc': [600.0]}, index=['7732-18-5'])
+    sources = {'A': a, 'B': b}
+    # Disabled by default, as dataframes modified in place keep their misses
+    old_enabled = dr.USE_NEGATIVE_CACHE
+    dr.USE_NEGATIVE_CACHE = True
+    try:
+        assert dr.retrieve_any_from_df_dict(sources, '50-00-0', 'Tc') is None
+        assert dr.retrieve_from_df_dict(sources, '7732-18-5', 'Tc', 'A') is None
+        misses = dr.negative_lookups[id(sources)].misses
+        assert misses == {('Tc', '50-00-0', None), ('Tc', '7732-18-5', 'A')}
+        assert dr.retrieve_any_from_df_dict(sources, '7732-18-5', 'Tc') == 600.0
+        assert dr.retrieve_from_df_dict(sources, '7732-18-5', 'Tc', 'B') == 600.0
+        assert len(misses) == 2
+
+        # Repeated misses are answered without searching the sources
+        calls = []
+        original = dr.search_df_dict
+        dr.search_df_dict = lambda *args: calls.append(args) or original(*args)
+        try:
+            assert dr.retrieve_any_from_df_dict(sources, '50-00-0', 'Tc') is None
+            assert calls == []
+
+            # Changing the sources or registering a source forgets the misses
+            sources['C'] = pd.DataFrame({'Tc': [700.0]}, index=['50-00-0'])
+            assert dr.retrieve_any_from_df_dict(sources, '50-00-0', 'Tc') == 700.0
+            del sources['C']
+            assert dr.retrieve_any_from_df_dict(sources, '50-00-0', 'Tc') is None
+            generation = dr.sources_generation
+            dr.register_df_source(str(tmp_path), 'unused.tsv')
+            del dr.load_cmds['unused.tsv']
+            assert dr.sources_generation > generation
+            calls.clear()
+            assert dr.retrieve_any_from_df_dict(sources, '50-00-0', 'Tc') is None
+            assert len(calls) == 1
+        finally:
+            dr.search_df_dict = original
+        dr.clear_negative_cache()
+        assert id(sources) not in dr.negative_lookups
+
+        # Misses are bounded
+        old = dr.NEGATIVE_CACHE_SIZE
+        dr.NEGATIVE_CACHE_SIZE = 3
+        try:
+            for i in range(10):
+                dr.retrieve_any_from_df_dict(sources, '%d-00-0' %(i+100), 'Tc')
+            assert len(dr.negative_lookups[id(sources)].misses) <= 3
+        finally:
+            dr.NEGATIVE_CACHE_SIZE = old
+            dr.clear_negative_cache()
+    finally:
+        dr.USE_NEGATIVE_CACHE = old_enabled
+        dr.clear_negative_cache()
+
+
+def test_shared_snapshot(tmp_path):
+    import mmap
+    import pandas as pd
+    from chemicals import data_reader as dr
+    import chemicals.critical
+    import chemicals.heat_capacity
+    keys = ['IUPACOrganicCriticalProps.tsv', 'Yaws Collection.tsv',
+            'CRC Standard Thermodynamic Properties of Chemical Substances.tsv']
+    loaded = {key: dr.data_source(key) for key in keys}
+    # CHEDL_LOW_MEMORY replaces some columns after loading, which would not
+    # stay in the snapshot's memory
+    old_snapshot, old_low_mem = dr.shared_snapshot, dr.low_mem
+    dr.low_mem = False
+    try:
+        for key in keys:
+            dr.df_sources.pop(key)
+        originals = {key: dr.data_source(key) for key in keys}
+        path = str(tmp_path/'snapshot.chedl')
+        assert dr.write_shared_snapshot(path, keys) == path
+
+        assert sorted(dr.attach_shared_snapshot(path)) == sorted(keys)
+        for key in keys:
+            dr.df_sources.pop(key)
+            df = dr.data_source(key)
+            original = originals[key]
+            assert df.index.equals(original.index)
+            assert df.columns.tolist() == original.columns.tolist()
+            for col in original.columns:
+                expect = original[col]
+                if isinstance(expect.dtype, pd.SparseDtype):
+                    expect = expect.sparse.to_dense()
+                pd.testing.assert_series_equal(df[col], expect, check_dtype=False)
+                values = df[col].to_numpy()
+                if values.dtype.kind == 'f':
+                    # Numeric data stays in the memory-mapped file
+                    assert not values.flags.writeable and not values.flags.owndata
+
+        with pytest.raises(ValueError):
+            dr.write_tables(str(tmp_path/'plain.chedl'), {keys[0]: originals[keys[0]]})
+            dr.attach_shared_snapshot(str(tmp_path/'plain.chedl'))
+    finally:
+        dr.shared_snapshot, dr.low_mem = old_snapshot, old_low_mem
+        for key, df in loaded.items():
+            dr.df_sources[key] = df
+
+
+def test_data_bundle(tmp_path):
+    import os
+    from chemicals import data_reader as dr
+    import chemicals.critical
+    import chemicals.heat_capacity
+    key = 'IUPACOrganicCriticalProps.tsv'
+    original = dr.data_source(key)
+    json_file = os.path.join(chemicals.heat_capacity.folder, 'JANAF_1998_gas_Cp.json')
+    assert dr.data_file_key(json_file) in dr.data_files
+    extra_file = str(tmp_path/'extra data.tsv')
+    with open(extra_file, 'w') as f:
+        f.write('CAS\tvalue\r\n7732-18-5\t1.5\r\n')
+    path = str(tmp_path/'data.bundle')
+    manifest = dr.compile_data_bundle(path, [key], [json_file, extra_file])
+    assert manifest['bundle'] == dr.DATA_BUNDLE_VERSION
+    assert manifest['sources'][key]['hash'] == dr.df_source_hash(key)
+    assert manifest['files'][dr.data_file_key(json_file)]['size'] == os.path.getsize(json_file)
+    assert dr.verify_data_bundle(path) == []
+    os.remove(extra_file)
+
+    old_bundle = dr.data_bundle
+    try:
+        assert dr.attach_data_bundle(path, verify=True)['sources'] == manifest['sources']
+        dr.df_sources.pop(key)
+        df = dr.data_source(key)
+        assert df.index.equals(original.index)
+        assert df.columns.tolist() == original.columns.tolist()
+        # Files are served from the bundle, even once removed from disk
+        with dr.open_data_file(extra_file) as f:
+            assert f.read() == 'CAS\tvalue\n7732-18-5\t1.5\n'
+        with dr.open_data_file(json_file) as f, open(json_file) as f2:
+            assert f.read() == f2.read()
+        # Files not in the bundle are read from disk
+        zabransky = os.path.join(chemicals.heat_capacity.folder, 'Zabransky.tsv')
+        with dr.open_data_file(zabransky, encoding='utf-8') as f:
+            assert f.readline().startswith('CAS')
+    finally:
+        dr.data_bundle = old_bundle
+        dr.df_sources[key] = original
+
+    with open(path, 'rb') as f:
+        raw = bytearray(f.read())
+    raw[raw.find(b'7732-18-5\t1.5')] = ord('8')
+    corrupt = str(tmp_path/'corrupt.bundle')
+    with open(corrupt, 'wb') as f:
+        f.write(raw)
+    assert dr.verify_data_bundle(corrupt) == [dr.data_file_key(extra_file)]
+    with pytest.raises(ValueError):
+        dr.attach_data_bundle(corrupt, verify=True)
+    assert dr.data_bundle is old_bundle
+    with pytest.raises(ValueError):
+        dr.attach_data_bundle(dr.write_shared_snapshot(str(tmp_path/'snapshot.chedl'), [key]))
+
+
+def test_packed_arrays_cache(tmp_path):
+    import os
+    import json
+    from chemicals import data_reader as dr
+    source = str(tmp_path/'values.json')
+    with open(source, 'w') as f:
+        json.dump({'7732-18-5': [[1.0, 2.0], [3.0, 4.0]], '64-17-5': [[5.0, 6.0]]}, f)
+    pack = lambda rows: [rows]
+    old = dr.use_df_cache, dr.df_cache_folder
+    dr.use_df_cache, dr.df_cache_folder = True, str(tmp_path/'cache')
+    try:
+        arrays = dr.PackedArrays(source, pack, width=2).load()
+        assert arrays.keys == ['7732-18-5', '64-17-5']
+        assert arrays.offsets.tolist() == [0, 2, 3]
+        assert os.path.exists(arrays.cache_path())
+
+        # A second load comes from the cache, which is invalidated by edits
+        cached = dr.PackedArrays(source, pack, width=2)
+        assert cached.read_cache(cached.source_hash()) is not None
+        d = dr.PackedArrayDict(cached, lambda segments: segments[0].tolist())
+        assert dict(d) == {'7732-18-5': [[1.0, 2.0], [3.0, 4.0]], '64-17-5': [[5.0, 6.0]]}
+        with open(source, 'w') as f:
+            json.dump({'50-00-0': [[7.0, 8.0]]}, f)
+        assert cached.read_cache(cached.source_hash()) is None
+        d = dr.PackedArrayDict(dr.PackedArrays(source, pack, width=2), lambda segments: segments[0].tolist())
+        assert list(d.items()) == [('50-00-0', [[7.0, 8.0]])]
+
+        # A file of the same name elsewhere does not share the cache
+        os.mkdir(str(tmp_path/'other'))
+        other = str(tmp_path/'other'/'values.json')
+        assert dr.PackedArrays(other, pack, width=2).cache_path() != arrays.cache_path()
+
+        # A file served from a data bundle need not exist on disk
+        dr.compile_data_bundle(str(tmp_path/'data.bundle'), [], [source])
+        os.remove(source)
+        old_bundle = dr.data_bundle
+        try:
+            dr.attach_data_bundle(str(tmp_path/'data.bundle'))
+            arrays = dr.PackedArrays(source, pack, width=2).load()
+            assert arrays.keys == ['50-00-0']
+            assert dr.PackedArrays(source, pack, width=2).read_cache(arrays.source_hash()) is not None
+        finally:
+            dr.data_bundle = old_bundle
+    finally:
+        dr.use_df_cache, dr.df_cache_folder = old
+
+
+def test_column_projection():
+    from chemicals import data_reader as dr
+    import chemicals.miscdata
+    key = 'webbook_constants.tsv'
+    assert key in dr.lazy_column_sources
+    full = dr.data_source(key)
+    old, old_bundle, old_low_mem = dr.USE_COLUMN_PROJECTION, dr.data_bundle, dr.low_mem
+    # A bundle always provides whole tables
+    dr.USE_COLUMN_PROJECTION, dr.data_bundle, dr.low_mem = True, None, False
+    try:
+        del dr.df_sources[key]
+        df = dr.data_source(key, columns=['Tc'])
+        assert df is not full
+        assert df.columns.tolist() == ['Tc']
+        assert df.index.equals(full.index)
+        # Asking for a column again adds it to the same dataframe
+        assert dr.data_source(key, columns=['Tc', 'Pc', 'NotAColumn']) is df
+        assert df.columns.tolist() == ['Tc', 'Pc']
+
+        # Lookups pull in the columns they need
+        sources = {'WEBBOOK': df}
+        assert dr.retrieve_any_from_df_dict(sources, '64-17-5', 'Tb') == dr.retrieve_from_df(full, '64-17-5', 'Tb')
+        assert 'Tb' in df.columns
+        assert dr.list_available_methods_from_df_dict(sources, '64-17-5', 'Hfg') == ['WEBBOOK']
+        values, _ = dr.retrieve_many_from_df_dict(sources, ['64-17-5', '7732-18-5'], 'Tm')
+        assert [v if v == v else None for v in values.tolist()] == [
+            dr.retrieve_from_df(full, '64-17-5', 'Tm'), dr.retrieve_from_df(full, '7732-18-5', 'Tm')]
+        for col in df.columns:
+            assert (df[col].sparse.to_dense() if hasattr(df[col], 'sparse') else df[col]).equals(
+                    full[col].sparse.to_dense() if hasattr(full[col], 'sparse') else full[col])
+        assert id(df) in dr.projected_sources
+        dr.ensure_columns(df, full.columns.tolist())
+        assert id(df) not in dr.projected_sources
+        assert set(df.columns) == set(full.columns) - {'Zc'}
+    finally:
+        dr.USE_COLUMN_PROJECTION, dr.data_bundle, dr.low_mem = old, old_bundle, old_low_mem
+        dr.projected_sources.pop(id(dr.df_sources[key]), None)
+        dr.df_sources[key] = full
+
+
+def test_load_profiling():
+    from chemicals import data_reader as dr
+    import chemicals.dipole
+    key = 'Poling Dipole.csv'
+    original = dr.data_source(key)
+    old = dr.USE_LOAD_PROFILING
+    dr.USE_LOAD_PROFILING = 1
+    try:
+        dr.load_profiles.pop(key, None)
+        del dr.df_sources[key]
+        dr.data_source(key)
+        profile = [r for r in dr.load_report('source') if r['name'] == key][0]
+        assert profile['kind'] == 'source' and profile['count'] == 1
+        assert profile['origin'] in ('text', 'cache', 'snapshot', 'bundle')
+        assert profile['wall_time'] >= profile['parse_time'] >= 0
+        assert profile['bytes'] > 0
+        assert 'test_load_profiling' in profile['caller']
+
+        chemicals.dipole._load_dipole_data()
+        loader = dr.load_profiles['chemicals.dipole._load_dipole_data']
+        assert loader['kind'] == 'loader'
+        assert 'test_load_profiling' in loader['caller']
+        assert all(r['kind'] == 'loader' for r in dr.load_report('loader'))
+        times = [r['wall_time'] for r in dr.load_report()]
+        assert times == sorted(times, reverse=True)
+    finally:
+        dr.USE_LOAD_PROFILING = old
+        dr.df_sources[key] = original
+        chemicals.dipole._load_dipole_data()
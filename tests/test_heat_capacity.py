@@ -375,6 +375,73 @@ def test_zabransky_dict_types():
             assert type(v) is PiecewiseHeatCapacity
             
             
+def test_packed_Cp_dicts():
+    import copy
+    import json
+    import os
+    import pickle
+    from chemicals import heat_capacity
+    from chemicals.data_reader import PackedArrayDict, PackedArrays
+    heat_capacity._load_Cp_data()
+    gas = PackedArrayDict(heat_capacity.Cp_dict_JANAF_gas.arrays, heat_capacity._unpack_JANAF)
+    assert not gas.materialized
+    Ts, Cps = gas['7732-18-5']
+    assert list(gas.materialized) == ['7732-18-5']
+    assert gas['7732-18-5'] is gas['7732-18-5']
+    assert_close(Cps[Ts.index(298.15)], 33.59)
+    assert '7732-18-5' in gas and 'not a CAS' not in gas
+    with pytest.raises(KeyError):
+        gas['not a CAS']
+
+    # Entries can be added, replaced and removed as in a dict
+    gas['not a CAS'] = ([298.15], [1.0])
+    assert gas['not a CAS'] == ([298.15], [1.0]) and list(gas)[-1] == 'not a CAS'
+    gas.update({'7732-18-5': ([298.15], [2.0])})
+    assert gas['7732-18-5'] == ([298.15], [2.0])
+    CAS = next(iter(gas))
+    del gas[CAS]
+    assert CAS not in gas
+    with pytest.raises(KeyError):
+        del gas[CAS]
+    plain = gas.copy()
+    assert type(plain) is dict and plain == dict(gas) and len(plain) == len(gas)
+    assert CAS in heat_capacity.Cp_dict_JANAF_gas
+
+    for name, d in [('JANAF_1998_liq_Cp.json', heat_capacity.Cp_dict_JANAF_liquid),
+                    ('psi4_adjusted_characteristic_temperatures.json',
+                     heat_capacity.Cp_dict_characteristic_temperatures_adjusted_psi4_2022a),
+                    ('webbook_shomate_coefficients.json', heat_capacity.WebBook_Shomate_coefficients)]:
+        with open(os.path.join(heat_capacity.folder, name)) as f:
+            expect = json.load(f)
+        assert len(d) == len(expect)
+        assert dict(d) == expect
+
+    # They can be pickled and copied, loaded or not
+    for d in [heat_capacity.Cp_dict_JANAF_gas,
+              PackedArrayDict(heat_capacity.Cp_dict_JANAF_gas.arrays, heat_capacity._unpack_JANAF)]:
+        for copied in [pickle.loads(pickle.dumps(d)), copy.deepcopy(d)]:
+            assert type(copied) is PackedArrayDict
+            assert list(copied) == list(d)
+            assert copied['7732-18-5'] == d['7732-18-5']
+    gases = heat_capacity.WebBook_Shomate_gases
+    for copied in [pickle.loads(pickle.dumps(gases)), copy.deepcopy(gases)]:
+        assert list(copied) == list(gases)
+        assert_close(copied['7732-18-5'].calculate(500.0), gases['7732-18-5'].calculate(500.0))
+    unloaded = PackedArrayDict(PackedArrays(os.path.join(heat_capacity.folder, 'JANAF_1998_gas_Cp.json'),
+                                            heat_capacity._pack_JANAF, width=2), heat_capacity._unpack_JANAF)
+    copied = pickle.loads(pickle.dumps(unloaded))
+    assert copied.arrays.keys is None
+    assert copied['7732-18-5'] == heat_capacity.Cp_dict_JANAF_gas['7732-18-5']
+
+    shomate = heat_capacity.WebBook_Shomate_coefficients['7732-18-5']
+    assert shomate[0] is None
+    gas_model = heat_capacity.WebBook_Shomate_gases['7732-18-5']
+    assert type(gas_model) is PiecewiseHeatCapacity
+    assert len(gas_model.models) == len(shomate[2])
+    assert '7732-18-5' not in heat_capacity.WebBook_Shomate_solids
+    assert_close(heat_capacity.WebBook_Shomate_liquids['7732-18-5'].Tmin, shomate[1][0][0])
+
+
 def test_PPDS2():
     Cp = PPDS2(T=350.0, Ts=462.493, C_low=4.54115, C_inf=9.96847, a1=-103.419, a2=695.484, a3=-2006.1, a4=2476.84, a5=-1186.47)
     assert_close(Cp, 136.46338956689826, rtol=1e-13)
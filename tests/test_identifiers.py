@@ -29,10 +29,22 @@ from chemicals.identifiers import (CAS_from_any, CAS_to_int, IDs_to_CASs, check_
                                    sorted_CAS_key)
 from chemicals.elements import periodic_table, nested_formula_parser, serialize_formula, molecular_weight
 import os
-from chemicals.identifiers import ChemicalMetadataDB, folder, pubchem_db
+from chemicals.identifiers import ChemicalMetadata, ChemicalMetadataDB, folder, normalize_name, pubchem_db
 from chemicals.identifiers import common_mixtures
 from fluids.numerics import assert_close
 
+# A line of a metadata file for a chemical in none of the bundled databases
+formaldehyde_line = '1\t50-00-0\tCH2O\t30.026\tC=O\tInChI=1S/CH2O/c1-2/h1H2\tWSFSSNUMVMOOMR-UHFFFAOYSA-N\tformaldehyde\tformaldehyde\tmethanal\n'
+
+def formaldehyde_main_db(tmp_path):
+    '''Write a main database holding only formaldehyde, and return its path
+    and a :obj:`ChemicalMetadataDB` using it with the cations as user
+    database.'''
+    main_db = str(tmp_path / 'main db.tsv')
+    with open(main_db, 'w', encoding='utf-8') as f:
+        f.write(formaldehyde_line)
+    return main_db, ChemicalMetadataDB(main_db=main_db, user_dbs=[os.path.join(folder, 'Cation db.tsv')])
+
 # Force the whole db to load
 try:
     CAS_from_any('asdfadsfasdfasdf')
@@ -236,6 +248,182 @@ def test_search_chemical():
     assert search_chemical('water').charge == 0
 
 
+def test_search_chemicals(tmp_path):
+    from chemicals import identifiers
+    from chemicals.identifiers import search_chemicals
+    IDs = ['water', '64-17-5', ' water ', 'water', 'O', '1', 'InChI=1S/C2H6O/c1-2-3/h3H,2H2,1H3',
+           'InChIKey=LFQSCWFLJHTTHZ-UHFFFAOYSA-N', 'pubchem=702', 'smiles=CCO', 'CCCCCCCCCC',
+           'H2O', 'water (H2O)', 'pubchem=abc']
+    hits, errors = search_chemicals(IDs, cache=False)
+    for ID, hit, error in zip(IDs, hits, errors):
+        try:
+            assert hit is search_chemical(ID, cache=False) and error is None
+        except ValueError as e:
+            assert hit is None and str(error) == str(e)
+
+    # The main database is loaded once for all of the identifiers not in
+    # the others, and those still not found are reported
+    _, db = formaldehyde_main_db(tmp_path)
+    autoloads = []
+    autoload_main_db = db.autoload_main_db
+    db.autoload_main_db = lambda: autoloads.append(1) or autoload_main_db()
+    old_db = identifiers.pubchem_db
+    try:
+        identifiers.pubchem_db = db
+        hits, errors = search_chemicals(['methanal', 'sodium', '50-00-0', 'methanal', 'not a chemical', 'smiles=CC'], cache=False)
+    finally:
+        identifiers.pubchem_db = old_db
+    assert autoloads == [1]
+    assert [hit.CASs if hit else None for hit in hits] == ['50-00-0', '7440-23-5', '50-00-0', '50-00-0', None, None]
+    assert str(errors[4]) == 'Chemical name (not a chemical) not recognized'
+    assert str(errors[5]) == 'A SMILES identifier (CC) was recognized, but it is not in the database.'
+    assert errors[:4] == [None]*4
+
+
+def test_search_chemical_cache(tmp_path):
+    from chemicals import identifiers
+    from chemicals.identifiers import chemical_search_cache, warm_search_cache
+    _, db = formaldehyde_main_db(tmp_path)
+    searches = []
+    search = identifiers._search_chemical
+    def counted_search(ID, autoload):
+        if not autoload:
+            searches.append(ID)
+        return search(ID, autoload)
+    old_db, old_maxsize = identifiers.pubchem_db, chemical_search_cache.maxsize
+    try:
+        identifiers.pubchem_db = db
+        identifiers._search_chemical = counted_search
+        chemical_search_cache.clear()
+        chemical_search_cache.resize(3)
+        chemical_search_cache.reset_stats()
+
+        # The most recently used identifiers are kept
+        for ID in ['sodium', 'methanal', 'sodium', 'potassium', 'sodium', 'lithium', 'sodium']:
+            search_chemical(ID)
+        assert searches == ['sodium', 'methanal', 'potassium', 'lithium']
+        assert 'methanal' not in chemical_search_cache
+        assert chemical_search_cache.stats()['hits'] == 3
+
+        # Unrecognized identifiers are cached too
+        for _ in range(3):
+            with pytest.raises(ValueError, match='not a chemical'):
+                search_chemical('not a chemical')
+        assert searches.count('not a chemical') == 1
+        hits, errors = identifiers.search_chemicals(['not a chemical'])
+        assert hits == [None] and 'not a chemical' in str(errors[0])
+
+        assert warm_search_cache(['water', 'ethanol', 'benzene', 'toluene', 'bad name', 'water']) == 0
+        assert chemical_search_cache.maxsize == 5
+        del searches[:]
+        for ID in ['sodium', 'potassium', 'lithium']:
+            search_chemical(ID)
+        assert warm_search_cache(['sodium', 'potassium', 'lithium']) == 3
+        del searches[:]
+        for ID in ['sodium', 'potassium', 'lithium']:
+            search_chemical(ID)
+        assert searches == []
+    finally:
+        identifiers.pubchem_db = old_db
+        identifiers._search_chemical = search
+        chemical_search_cache.clear()
+        chemical_search_cache.resize(old_maxsize)
+
+
+def test_normalized_name_index():
+    from chemicals.identifiers import normalize_name
+    assert normalize_name('Ethyl-Alcohol') == normalize_name(' ethyl\talcohol') == 'ethylalcohol'
+    assert normalize_name('1,1\u2010Difluoro\u2013ethane') == '1,1difluoroethane'
+    assert normalize_name('\uff37ater') == 'water'
+    # Isomers are not merged
+    assert normalize_name('(+)-limonene') != normalize_name('(-)-limonene')
+
+    for ID in ['ETHYL-ALCOHOL', 'Ethyl Alcohol', 'ethylalcohol', 'ethyl\u2010alcohol', ' ethyl  alcohol ']:
+        assert CAS_from_any(ID) == '64-17-5'
+    assert CAS_from_any('1,1\u2010difluoroethane') == '75-37-6'
+
+    user_dbs = [os.path.join(folder, 'Inorganic db.tsv'), os.path.join(folder, 'Cation db.tsv')]
+    for columnar in (False, True):
+        db = ChemicalMetadataDB(main_db=None, user_dbs=user_dbs, columnar=columnar)
+        assert db.search_normalized_name('CHROMIUM-DIOXIDE') is db.search_name('Chromium dioxide')
+        assert db.search_normalized_name('SODIUM') is db.search_name('sodium')
+        assert db.search_normalized_name('not a chemical name') is False
+        assert len(db.normalized_name_index) < len(db.name_index)
+
+
+def test_name_search():
+    db = ChemicalMetadataDB(main_db=None, user_dbs=[os.path.join(folder, 'Inorganic db.tsv'),
+                                                    os.path.join(folder, 'chemical identifiers example user db.tsv')])
+    results = db.search_name_prefix('Chromium', limit=5)
+    assert len(results) == 5
+    assert all(normalize_name(name).startswith('chromium') for name, _, _ in results)
+    assert [score for _, score, _ in results] == sorted([score for _, score, _ in results], reverse=True)
+    for name, score, obj in results:
+        assert name in obj.synonyms
+        assert_close(score, len('chromium')/len(normalize_name(name)))
+    assert db.search_name_prefix('chromium dioxide')[0][1:] == (1.0, db.search_CAS('12018-01-8'))
+    assert db.search_name_prefix('zzzzzz') == []
+
+    name, score, obj = db.search_similar_names('chromium dioxid')[0]
+    assert obj is db.search_CAS('12018-01-8')
+    assert 0.8 < score < 1.0
+    assert db.search_similar_names('chromium dioxide')[0][1:] == (1.0, obj)
+    results = db.search_similar_names('chromium dioxid', limit=3, min_score=0.5)
+    assert len(results) <= 3
+    assert all(score >= 0.5 for _, score, _ in results)
+    assert db.search_similar_names('qqqqqq') == []
+
+    # The indexes include chemicals added later
+    index = db.name_search_index
+    db.load(os.path.join(folder, 'Cation db.tsv'))
+    assert db.name_search_index is not index
+    assert db.search_name_prefix('Polonium(6+')[0][2] is db.search_CAS('105715-27-3')
+
+    # Results come from the rows the index was built from, even once they
+    # have been replaced, as when the main database is loaded
+    index = db.name_search_index
+    db.reset_indexes()
+    name, score, obj = db._name_search_results(index, index.prefix('chromiumdioxide'))[0]
+    assert (normalize_name(name), score, obj.CASs) == ('chromiumdioxide', 1.0, '12018-01-8')
+
+
+def test_autoload_main_db_threads(tmp_path):
+    import threading
+    import time
+    main_db, db = formaldehyde_main_db(tmp_path)
+    loads = []
+    read_index = db.read_index
+    def slow_read_index(file_name):
+        if file_name == main_db:
+            loads.append(file_name)
+            time.sleep(0.05)
+        return read_index(file_name)
+    db.read_index = slow_read_index
+
+    # Searches for a chemical already loaded keep finding it while the main
+    # database is loaded, and the threads needing it wait for one load
+    results, stop = [], []
+    def search_loaded():
+        while not stop:
+            results.append(db.search_name('sodium', autoload=False))
+    def search_main():
+        results.append(db.search_name('methanal'))
+    readers = [threading.Thread(target=search_loaded) for _ in range(2)]
+    loaders = [threading.Thread(target=search_main) for _ in range(8)]
+    for thread in readers + loaders:
+        thread.start()
+    for thread in loaders:
+        thread.join()
+    stop.append(True)
+    for thread in readers:
+        thread.join()
+
+    assert len(loads) == 1
+    assert all(results)
+    assert sum(1 for obj in results if obj.CASs == '50-00-0') == 8
+    assert db.search_name('sodium').CASs == '7440-23-5'
+
+
 def test_CAS_from_any():
     assert CAS_from_any('7732-18-5 ') == '7732-18-5'
     assert CAS_from_any('   7732  -18-5 ') == '7732-18-5'
@@ -479,6 +667,131 @@ def test_db_vs_ChemSep():
 
 
 
+def test_metadata_index(tmp_path):
+    from chemicals import data_reader
+    from chemicals.identifiers import read_metadata_index, write_metadata_index
+    source = tmp_path / 'test db.tsv'
+    with open(os.path.join(folder, 'Inorganic db.tsv'), encoding='utf-8') as f:
+        source.write_text(f.read(), encoding='utf-8')
+    parsed = ChemicalMetadataDB(elements=False, main_db=None, user_dbs=[str(source)])
+
+    old_cache, old_folder = data_reader.use_df_cache, data_reader.df_cache_folder
+    try:
+        data_reader.use_df_cache, data_reader.df_cache_folder = True, str(tmp_path)
+        ChemicalMetadataDB(elements=False, main_db=None, user_dbs=[str(source)])
+        assert read_metadata_index(str(source)) is not None
+        db = ChemicalMetadataDB(elements=False, main_db=None, user_dbs=[str(source)])
+        # Nothing is decoded or created until it is searched for
+        assert type(db.rows.blocks[0]) is bytes
+        assert all(obj is None for obj in db.rows.objects)
+        assert db.search_CAS('12018-01-8').formula == 'CrO2'
+        assert sum(obj is not None for obj in db.rows.objects) == 1
+        assert db.search_name('Chromium dioxide') is db.search_CAS('12018-01-8')
+
+        assert sorted(db.CAS_index) == sorted(parsed.CAS_index)
+        assert sorted(db.name_index) == sorted(parsed.name_index)
+        for CAS, obj in parsed.CAS_index.items():
+            new = db.CAS_index[CAS]
+            assert (new.CAS, new.formula, new.MW, new.smiles, new.synonyms) == (obj.CAS, obj.formula, obj.MW, obj.smiles, obj.synonyms)
+
+        # A changed file is parsed again; one only touched is not
+        os.utime(str(source), (1e9, 1e9))
+        assert read_metadata_index(str(source)) is not None
+        with open(str(source), 'a', encoding='utf-8') as f:
+            f.write(formaldehyde_line)
+        assert read_metadata_index(str(source)) is None
+        db = ChemicalMetadataDB(elements=False, main_db=None, user_dbs=[str(source)])
+        assert db.search_CAS('50-00-0').pubchemid == 1
+        write_metadata_index(str(source))
+        assert read_metadata_index(str(source)) is not None
+    finally:
+        data_reader.use_df_cache, data_reader.df_cache_folder = old_cache, old_folder
+
+
+def test_sharded_main_db(tmp_path):
+    from chemicals import data_reader
+    from chemicals.identifiers import MetadataShards, write_metadata_shards
+    main_db = tmp_path / 'main db.tsv'
+    with open(os.path.join(folder, 'Inorganic db.tsv'), encoding='utf-8') as f:
+        main_db.write_text(f.read(), encoding='utf-8')
+    user_dbs = [os.path.join(folder, 'Cation db.tsv')]
+    full = ChemicalMetadataDB(main_db=str(main_db), user_dbs=user_dbs)
+    full.autoload_main_db()
+
+    old_folder = data_reader.df_cache_folder
+    try:
+        data_reader.df_cache_folder = str(tmp_path)
+        write_metadata_shards(str(main_db), shards=8, block_size=16)
+        db = ChemicalMetadataDB(main_db=str(main_db), user_dbs=user_dbs, sharded=True)
+        # One search loads one shard of its identifier type and one block
+        assert db.search_CAS('12018-01-8').formula == 'CrO2'
+        assert sorted(db.main_shards.loaded) == ['CAS-%d' %(int(12018018) % 8), 'elements']
+        assert len(db.main_shards.blocks) == 1
+        assert not db.finished_loading
+
+        for CAS in full.CAS_index:
+            assert db.search_CAS(CAS).CAS == full.search_CAS(CAS).CAS
+        for name in full.name_index:
+            assert db.search_name(name).CAS == full.search_name(name).CAS
+        for key in full.InChI_key_index:
+            assert db.search_InChI_key(key).CAS == full.search_InChI_key(key).CAS
+        for smiles in full.smiles_index:
+            assert db.search_smiles(smiles).CAS == full.search_smiles(smiles).CAS
+        assert db.search_CAS('50-00-0') is False
+        assert not db.finished_loading
+
+        # Shards of a changed file are written again when next needed
+        with open(str(main_db), 'a', encoding='utf-8') as f:
+            f.write(formaldehyde_line)
+        assert MetadataShards.open(str(main_db)) is None
+        db = ChemicalMetadataDB(main_db=str(main_db), user_dbs=user_dbs, sharded=True)
+        assert db.search_name('methanal').CASs == '50-00-0'
+        assert MetadataShards.open(str(main_db)) is not None
+    finally:
+        data_reader.df_cache_folder = old_folder
+
+
+def test_columnar_metadata(tmp_path):
+    from chemicals import data_reader
+    from chemicals.identifiers import ChemicalMetadataView, CompactIndex, MetadataColumns
+    user_dbs = [os.path.join(folder, 'Inorganic db.tsv'), os.path.join(folder, 'Cation db.tsv')]
+    db = ChemicalMetadataDB(main_db=None, user_dbs=user_dbs, columnar=False)
+    old_cache, old_folder = data_reader.use_df_cache, data_reader.df_cache_folder
+    try:
+        # Parsed, then read back from the cache
+        for use_df_cache in (False, True, True):
+            data_reader.use_df_cache, data_reader.df_cache_folder = use_df_cache, str(tmp_path)
+            columnar = ChemicalMetadataDB(main_db=None, user_dbs=user_dbs, columnar=True)
+            assert type(columnar.name_index) is CompactIndex
+            for key in ('CAS', 'pubchem', 'smiles', 'InChI', 'InChI_key', 'name', 'formula'):
+                index, compact = getattr(db, key + '_index'), getattr(columnar, key + '_index')
+                assert len(index) == len(compact)
+                assert sorted(index, key=str) == sorted(compact, key=str)
+                for k, obj in index.items():
+                    assert k in compact
+                    view = compact[k]
+                    assert (view.pubchemid, view.CAS, view.formula, view.MW, view.smiles, view.InChI,
+                            view.InChI_key, view.iupac_name, view.common_name, view.synonyms) == (
+                            obj.pubchemid, obj.CAS, obj.formula, obj.MW, obj.smiles, obj.InChI,
+                            obj.InChI_key, obj.iupac_name, obj.common_name, obj.synonyms)
+            assert 'not a chemical' not in columnar.name_index
+            assert 1.5 not in columnar.CAS_index
+    finally:
+        data_reader.use_df_cache, data_reader.df_cache_folder = old_cache, old_folder
+
+    view = columnar.search_CAS('12018-01-8')
+    assert type(view) is ChemicalMetadataView and view.row is not None
+    assert view is columnar.search_name('Chromium dioxide')
+    assert isinstance(columnar.search_name('sodium'), ChemicalMetadata)
+    assert columnar.search_name('monatomic hydrogen').CASs == '12385-13-6'
+
+    columns = MetadataColumns.from_rows([(1, 50000, 'CH2O', 30.026, 'C=O', 'InChI', 'KEY',
+                                          'formaldehyde', 'méthanal', ['formaldehyde', 'méthanal'])])
+    columns = MetadataColumns.deserialize(columns.serialize())
+    assert columns.row(0) == (1, 50000, 'CH2O', 30.026, 'C=O', 'InChI', 'KEY',
+                              'formaldehyde', 'méthanal', ['formaldehyde', 'méthanal'])
+
+
 def test_CAS2int():
     assert CAS_to_int('7704-34-9') == 7704349
 
@@ -290,4 +290,19 @@ def test_PPDS12():
     assert_close(Hvap, 37948.76862035927, rtol=1e-13)
 
     assert 0 == PPDS12(144.41400000000002, 144.41, 4.47837, 8.72648, -6.584538, 0.389714, 0.579951)
-    assert 0 == PPDS12(144.41, 144.41, 4.47837, 8.72648, -6.584538, 0.389714, 0.579951)
\ No newline at end of file
+    assert 0 == PPDS12(144.41, 144.41, 4.47837, 8.72648, -6.584538, 0.389714, 0.579951)
+
+
+def test_Tb_Tm_Hfus_many():
+    from chemicals.phase_change import Tb_many, Tm_many, Hfus_many, Tb, Tm, Hfus
+    CASs = ['64-17-5', '7732-18-5', '50-00-0', '7440-44-0', 'BADCAS', '1-1-1']
+    CASs += ['%d-%02d-%d' %(i, i % 100, i % 10) for i in range(50, 10000, 37)]
+    for func, func_many in [(Tb, Tb_many), (Tm, Tm_many), (Hfus, Hfus_many)]:
+        values, methods = func_many(CASs)
+        for CAS, value, method in zip(CASs, values.tolist(), methods.tolist()):
+            expect = func(CAS)
+            if expect is None:
+                assert value != value and method is None
+            else:
+                assert value == expect
+                assert func(CAS, method=method) == expect
@@ -205,4 +205,20 @@ def test_balance_stoichiometry():
 
 def test_stoichiometric_matrix():
     res = stoichiometric_matrix([{'Mg': 1, 'O': 1}, {'Mg': 1}, {'O': 2}], [True, False, False])
-    assert_close2d([[1, -1, 0], [1, 0, -2]], res)
\ No newline at end of file
+    assert_close2d([[1, -1, 0], [1, 0, -2]], res)
+
+
+def test_Hf_S0_many():
+    from chemicals.reaction import Hfs_many, Hfl_many, Hfg_many, S0s_many, S0l_many, S0g_many
+    CASs = ['64-17-5', '7732-18-5', '50-00-0', '7440-44-0', 'BADCAS']
+    CASs += TRC_gas_data.index[::40].tolist() + CRC_standard_data.index[::40].tolist()
+    for func, func_many in [(Hfs, Hfs_many), (Hfl, Hfl_many), (Hfg, Hfg_many),
+                            (S0s, S0s_many), (S0l, S0l_many), (S0g, S0g_many)]:
+        values, methods = func_many(CASs)
+        for CAS, value, method in zip(CASs, values.tolist(), methods.tolist()):
+            expect = func(CAS)
+            if expect is None:
+                assert value != value and method is None
+            else:
+                assert value == expect
+                assert func(CAS, method=method) == expect
@@ -84,3 +84,18 @@ def test_Pt():
 def test_Pt_fuzz():
     Pt_sum = sum([Pt(i) for i in triple_data_Staveley.index if pd.notnull(triple_data_Staveley.at[i, 'Pt'])])
     assert_close(Pt_sum, 1886624.8374376972)
+
+def test_Tt_Pt_many():
+    from chemicals.triple import Tt_many, Pt_many
+    CASs = ['7664-41-7', '64-17-5', '7732-18-5', '50-00-0', 'BADCAS'] + triple_data_Staveley.index[::20].tolist()
+    Tts, methods = Tt_many(CASs)
+    for CAS, value, method in zip(CASs, Tts.tolist(), methods.tolist()):
+        expect = Tt(CAS)
+        assert (value != value and expect is None) or value == expect
+        if expect is not None:
+            assert method == (Tt_methods(CAS)[0] if method != 'MELTING' else 'MELTING')
+    Pts, methods = Pt_many(CASs)
+    for CAS, value in zip(CASs, Pts.tolist()):
+        expect = Pt(CAS)
+        assert (value != value and expect is None) or value == expect
+    assert Tt_many(['64-17-5'], method='MELTING')[0].tolist() == [Tt('64-17-5', method='MELTING')]
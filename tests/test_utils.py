@@ -22,6 +22,7 @@ OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 SOFTWARE.
 """
 
+import time
 import pytest
 import numpy as np
 from chemicals.utils import (API_to_SG, Cp_minus_Cv, Joule_Thomson, Parachor, SG, SG_to_API,
@@ -612,3 +613,43 @@ def test_molar_velocity():
     assert_close(molar_velocity_to_velocity(46.537593457316525, 67.152), 179.5868138460819, rtol=1e-12)
 
     assert_close(velocity_to_molar_velocity(179.5868138460819, 67.152), 46.537593457316525, rtol=1e-12)
+
+
+def test_LRUCache():
+    from chemicals.utils import LRUCache
+    cache = LRUCache(3)
+    for i in range(5):
+        cache[i] = str(i)
+    assert list(cache.data) == [2, 3, 4]
+    assert cache.get(2) == '2'
+    cache[5] = '5'
+    assert 3 not in cache and 2 in cache
+    assert cache.get(3, 'missing') == 'missing'
+    assert cache.stats() == {'size': 3, 'maxsize': 3, 'hits': 1, 'misses': 1,
+                             'evictions': 3, 'hit_rate': 0.5}
+    cache.resize(1)
+    assert list(cache.data) == [5]
+    cache.resize(0)
+    for i in range(100):
+        cache[i] = None
+    assert len(cache) == 100 and cache.get(50, 1) is None
+
+    cache = LRUCache(10, ttl=0.05)
+    cache['a'] = 1
+    assert cache.get('a') == 1 and 'a' in cache
+    time.sleep(0.06)
+    cache['b'] = 2
+    assert 'a' not in cache and cache.get('a') is None and cache.get('b') == 2
+    assert len(cache) == 1 and cache.stats()['evictions'] == 1
+
+    # Setting a ttl on a populated cache only expires the entries older
+    # than it
+    cache = LRUCache(10)
+    cache['a'] = 1
+    time.sleep(0.06)
+    cache['b'] = 2
+    cache.ttl = 0.05
+    assert cache.get('b') == 2 and cache.stats()['evictions'] == 0
+    assert 'a' not in cache and cache.stats()['evictions'] == 1
+    cache.ttl = 10.0
+    assert cache.get('b') == 2 and len(cache) == 1